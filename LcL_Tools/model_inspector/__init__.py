@@ -2,7 +2,10 @@
 from . import operators
 from . import properties
 from . import ui
-from . import mesh_helpers
+from .lazy import lazy_import, is_loaded
+
+# 检测和绘制模块（NumPy、bmesh、gpu）延迟到第一次使用时加载
+mesh_helpers = lazy_import(__package__ + ".mesh_helpers")
 
 
 def register():
@@ -14,6 +17,9 @@ def register():
 
 def unregister():
     """Unregister model inspector"""
+    # 移除视口绘制回调和 @persistent 的叠加层回调，否则停用或重载插件后旧回调会残留
+    if is_loaded(mesh_helpers):
+        mesh_helpers.disable_display()
     ui.unregister()
     operators.unregister()
     properties.unregister()
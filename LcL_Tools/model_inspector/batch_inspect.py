@@ -0,0 +1,429 @@
+"""
+模型检测批处理入口（后台模式，无界面）
+用于在构建机上对资源目录做提交前检查
+
+用法:
+    blender -b --factory-startup --python LcL_Tools/model_inspector/batch_inspect.py -- --inspect assets/
+    blender -b --python-expr "from LcL_Tools.model_inspector import batch_inspect; batch_inspect.main()" -- --inspect assets/
+
+主进程把 .blend / .fbx 文件分发给多个后台 Blender 工作进程，
+每个对象输出一行 JSON 报告（JSON Lines），发现问题或出错时以非零退出码结束。
+"""
+
+import argparse
+import json
+import math
+import os
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import Path
+
+import bpy
+
+# 支持的资源文件类型
+SUPPORTED_EXTENSIONS = ('.blend', '.fbx')
+
+# 工作进程输出结果行的前缀（用于从 Blender 自身的日志中区分结果）
+RESULT_PREFIX = "LCL_INSPECT_JSON:"
+
+# 检测类型
+CHECK_SELF = 'self'
+CHECK_OBJECTS = 'objects'
+CHECK_DISTORTION = 'distortion'
+CHECK_TOPOLOGY = 'topology'  # 报告中拆分为 non_manifold / zero_area / duplicate_verts 三项
+CHECK_UV = 'uv_overlap'
+CHECK_THICKNESS = 'thickness'
+ALL_CHECKS = (CHECK_SELF, CHECK_OBJECTS, CHECK_DISTORTION, CHECK_TOPOLOGY, CHECK_UV, CHECK_THICKNESS)
+DEFAULT_CHECKS = (CHECK_SELF, CHECK_OBJECTS, CHECK_DISTORTION)
+
+# 退出码
+EXIT_OK = 0       # 全部通过
+EXIT_FAILED = 1   # 发现问题
+EXIT_ERROR = 2    # 文件加载或工作进程出错
+
+
+def get_script_args(argv=None):
+    """获取 Blender 命令行中 '--' 之后的参数"""
+    if argv is None:
+        argv = sys.argv
+    if "--" in argv:
+        return argv[argv.index("--") + 1:]
+    return []
+
+
+def build_arg_parser():
+    """构建命令行参数解析器"""
+    parser = argparse.ArgumentParser(
+        prog="batch_inspect",
+        description="LcL 模型检测批处理（后台模式）",
+    )
+    parser.add_argument("--inspect", nargs="+", metavar="PATH",
+                        help="要检测的目录或文件（目录会递归查找 .blend/.fbx）")
+    parser.add_argument("--worker", metavar="FILE",
+                        help=argparse.SUPPRESS)  # 内部使用：以工作进程模式检测单个文件
+    parser.add_argument("--checks", default=",".join(DEFAULT_CHECKS),
+                        help="启用的检测，逗号分隔: self,objects,distortion,topology,uv_overlap,thickness")
+    parser.add_argument("--threshold", type=float, default=0.00001,
+                        help="相交检测的距离阈值")
+    parser.add_argument("--max-hits", type=int, default=0,
+                        help="相交检测每个对象 / 对象对最多报告该数量的相交面，"
+                             "0 表示找出全部，1 即只判断是否通过")
+    parser.add_argument("--distortion-angle", type=float, default=45.0,
+                        help="扭曲检测的角度阈值（度）")
+    parser.add_argument("--area-threshold", type=float, default=1e-8,
+                        help="拓扑检测：零面积面的面积阈值")
+    parser.add_argument("--merge-distance", type=float, default=0.0001,
+                        help="拓扑检测：重复顶点的合并距离")
+    parser.add_argument("--uv-epsilon", type=float, default=0.00001,
+                        help="UV 重叠检测的容差")
+    parser.add_argument("--min-thickness", type=float, default=0.001,
+                        help="壁厚检测的最小壁厚")
+    parser.add_argument("--jobs", type=int, default=os.cpu_count() or 1,
+                        help="并行的工作进程数量")
+    parser.add_argument("--pair-workers", type=int, default=1,
+                        help="每个工作进程中对象间相交窄相位的并行数（文件少、对象多时使用，注意与 --jobs 相乘）")
+    parser.add_argument("--stream-mb", type=int, default=0,
+                        help="流式检测：对象按空间顺序处理，网格快照缓存超过该大小（MB）时释放最久未使用的对象，0 为不限制")
+    parser.add_argument("--track-memory", action="store_true",
+                        help="用 tracemalloc 记录每个文件检测的内存峰值（Python / NumPy 分配），写入报告的 memory_peak_mb")
+    parser.add_argument("--output", metavar="FILE",
+                        help="JSON Lines 报告输出文件（默认输出到 stdout）")
+    parser.add_argument("--blender", default=None,
+                        help="工作进程使用的 Blender 可执行文件（默认与当前进程相同）")
+    parser.add_argument("--timeout", type=float, default=None,
+                        help="单个文件的超时时间（秒）")
+    parser.add_argument("--cache-dir", default=None,
+                        help="启用结果磁盘缓存并使用该目录（与界面中的缓存可共用）")
+    parser.add_argument("--cache-max-mb", type=int, default=2048,
+                        help="结果缓存的容量上限（MB）")
+    parser.add_argument("--verbose", action="store_true",
+                        help="转发工作进程中 Blender 的日志输出")
+    return parser
+
+
+def parse_checks(checks_text):
+    """解析检测类型列表"""
+    checks = [c.strip() for c in checks_text.split(",") if c.strip()]
+    unknown = [c for c in checks if c not in ALL_CHECKS]
+    if unknown:
+        raise ValueError(f"未知的检测类型: {', '.join(unknown)}")
+    return checks
+
+
+def collect_asset_files(paths):
+    """收集要检测的资源文件（目录递归查找，结果排序保证报告稳定）"""
+    files = []
+    for path in paths:
+        path = Path(path)
+        if path.is_dir():
+            files.extend(p for p in path.rglob("*") if p.suffix.lower() in SUPPORTED_EXTENSIONS)
+        elif path.suffix.lower() in SUPPORTED_EXTENSIONS:
+            files.append(path)
+    return sorted({p.resolve() for p in files})
+
+
+# 工作进程：在当前 Blender 进程中加载并检测单个文件
+#################################################
+
+
+def load_asset_file(file_path):
+    """加载 .blend 或导入 .fbx 到空场景"""
+    if file_path.lower().endswith('.blend'):
+        bpy.ops.wm.open_mainfile(filepath=file_path, load_ui=False)
+    else:
+        bpy.ops.wm.read_homefile(use_empty=True)
+        bpy.ops.import_scene.fbx(filepath=file_path)
+
+
+def inspect_scene_objects(objects, checks, threshold, angle_threshold,
+                          area_threshold=1e-8, merge_distance=0.0001, uv_epsilon=0.00001,
+                          min_thickness=0.001, max_hits=0, pair_workers=1):
+    """
+    对一组网格对象执行检测（不依赖任何 UI）
+    max_hits 大于 0 时报告中的相交面数最多为 max_hits（每个对象 / 对象对）
+
+    Returns:
+        dict: {对象: {检测类型: 问题面数}}
+    """
+    from . import mesh_helpers
+
+    results = {obj: {check: 0 for check in checks} for obj in objects}
+
+    if CHECK_SELF in checks:
+        for obj in objects:
+            faces = mesh_helpers.bmesh_check_self_intersect_object(obj, threshold=threshold, max_faces=max_hits)
+            results[obj][CHECK_SELF] = len(faces)
+
+    if CHECK_OBJECTS in checks:
+        # 每对对象只检测一次，两侧的相交面分别累计（去重后计数）
+        object_faces = {obj: [] for obj in objects}
+        pair_results = mesh_helpers.check_all_object_intersections(objects, threshold, max_hits, pair_workers)
+        for obj1, obj2, faces1, faces2 in pair_results:
+            object_faces[obj1].append(faces1)
+            object_faces[obj2].append(faces2)
+        for obj, face_arrays in object_faces.items():
+            results[obj][CHECK_OBJECTS] = len(mesh_helpers.merge_face_arrays(face_arrays))
+
+    if CHECK_DISTORTION in checks:
+        for obj in objects:
+            faces = mesh_helpers.check_distorted_faces(obj, angle_threshold=angle_threshold)
+            results[obj][CHECK_DISTORTION] = len(faces)
+
+    if CHECK_TOPOLOGY in checks:
+        from . import check_engine
+
+        topology_checks = [
+            check_engine.NonManifoldCheck(),
+            check_engine.ZeroAreaCheck(area_threshold=area_threshold),
+            check_engine.DuplicateVertsCheck(merge_distance=merge_distance),
+        ]
+        check_results = check_engine.run_checks(objects, topology_checks)
+        for obj in objects:
+            obj_results = check_results.get(obj, {})
+            del results[obj][CHECK_TOPOLOGY]
+            for check in topology_checks:
+                results[obj][check.name.lower()] = len(obj_results.get(check.name, ()))
+
+    if CHECK_UV in checks:
+        from . import check_engine
+
+        uv_check = check_engine.UVOverlapCheck(epsilon=uv_epsilon)
+        check_results = check_engine.run_checks(objects, [uv_check])
+        for obj in objects:
+            results[obj][CHECK_UV] = len(check_results.get(obj, {}).get(uv_check.name, ()))
+
+    if CHECK_THICKNESS in checks:
+        from . import check_engine
+
+        # 批处理已按文件分进程并行，这里不再启用多进程投射
+        thickness_check = check_engine.ThicknessCheck(min_thickness=min_thickness, max_samples=0)
+        check_results = check_engine.run_checks(objects, [thickness_check])
+        for obj in objects:
+            results[obj][CHECK_THICKNESS] = len(check_results.get(obj, {}).get(thickness_check.name, ()))
+
+    return results
+
+
+def emit_record(record):
+    """输出一条结果记录（带前缀，供主进程解析）"""
+    sys.stdout.write(RESULT_PREFIX + json.dumps(record, ensure_ascii=False) + "\n")
+    sys.stdout.flush()
+
+
+def run_worker(args):
+    """工作进程模式：检测单个文件并逐对象输出结果"""
+    from . import result_cache
+    from . import mesh_cache
+    from . import profiling
+
+    file_path = args.worker
+    checks = parse_checks(args.checks)
+    load_asset_file(file_path)
+
+    if args.cache_dir:
+        result_cache.configure(True, args.cache_dir, args.cache_max_mb)
+    mesh_cache.begin_session(args.stream_mb * 1024 * 1024)
+    profiling.begin_run(file_path, enabled=False, track_memory=args.track_memory)
+    try:
+        objects = [obj for obj in bpy.context.scene.objects if obj.type == 'MESH']
+        if mesh_cache.is_streaming():
+            objects = mesh_cache.spatial_order(objects)
+        results = inspect_scene_objects(
+            objects, checks, args.threshold, math.radians(args.distortion_angle),
+            args.area_threshold, args.merge_distance, args.uv_epsilon, args.min_thickness,
+            args.max_hits, args.pair_workers
+        )
+    finally:
+        mesh_cache.end_session()
+        profiling.end_run()
+
+    memory_peak = profiling.get_last_memory_peak()
+    for obj in objects:
+        counts = results[obj]
+        record = {
+            'file': file_path,
+            'object': obj.name,
+            'faces': len(obj.data.polygons),
+            **counts,
+            'passed': not any(counts.values()),
+        }
+        if memory_peak is not None:
+            record['memory_peak_mb'] = round(memory_peak / (1024 * 1024), 2)
+        emit_record(record)
+    return EXIT_OK
+
+
+# 主进程：分发文件到工作进程池并汇总报告
+#################################################
+
+
+def build_worker_command(blender_binary, file_path, args):
+    """构建工作进程命令行"""
+    module_file = Path(__file__).resolve()
+    package_root = module_file.parents[2]
+    module_name = f"{module_file.parents[1].name}.model_inspector.batch_inspect"
+    python_expr = (
+        "import sys, importlib; "
+        f"sys.path.insert(0, {str(package_root)!r}); "
+        f"importlib.import_module({module_name!r}).main()"
+    )
+    command = [
+        blender_binary, "-b", "--factory-startup",
+        "--python-exit-code", str(EXIT_ERROR),
+        "--python-expr", python_expr,
+        "--",
+        "--worker", str(file_path),
+        "--checks", args.checks,
+        "--threshold", repr(args.threshold),
+        "--max-hits", str(args.max_hits),
+        "--pair-workers", str(args.pair_workers),
+        "--distortion-angle", repr(args.distortion_angle),
+        "--area-threshold", repr(args.area_threshold),
+        "--merge-distance", repr(args.merge_distance),
+        "--uv-epsilon", repr(args.uv_epsilon),
+        "--min-thickness", repr(args.min_thickness),
+    ]
+    if args.stream_mb:
+        command += ["--stream-mb", str(args.stream_mb)]
+    if args.track_memory:
+        command.append("--track-memory")
+    if args.cache_dir:
+        command += ["--cache-dir", str(Path(args.cache_dir).resolve()),
+                    "--cache-max-mb", str(args.cache_max_mb)]
+    return command
+
+
+class ReportWriter:
+    """线程安全的 JSON Lines 报告输出，并统计通过/失败数量"""
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.lock = threading.Lock()
+        self.objects_count = 0
+        self.failed_count = 0
+        self.error_count = 0
+
+    def write(self, record):
+        with self.lock:
+            if 'error' in record:
+                self.error_count += 1
+            else:
+                self.objects_count += 1
+                if not record.get('passed', False):
+                    self.failed_count += 1
+            self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+            self.stream.flush()
+
+
+def inspect_file_in_worker(blender_binary, file_path, args, writer):
+    """启动工作进程检测单个文件，并实时转发其结果"""
+    command = build_worker_command(blender_binary, file_path, args)
+    try:
+        process = subprocess.Popen(
+            command,
+            stdout=subprocess.PIPE,
+            stderr=None if args.verbose else subprocess.DEVNULL,
+            text=True,
+            encoding="utf-8",
+            errors="replace",  # 工作进程日志中的非 UTF-8 字节不能中断读取
+        )
+    except OSError as e:
+        writer.write({'file': str(file_path), 'error': f"无法启动工作进程: {e}", 'passed': False})
+        return
+
+    timer = None
+    if args.timeout:
+        timer = threading.Timer(args.timeout, process.kill)
+        timer.start()
+
+    try:
+        for line in process.stdout:
+            if line.startswith(RESULT_PREFIX):
+                try:
+                    record = json.loads(line[len(RESULT_PREFIX):])
+                except json.JSONDecodeError as e:
+                    record = {'file': str(file_path), 'error': f"无法解析工作进程结果: {e}", 'passed': False}
+                writer.write(record)
+            elif args.verbose:
+                sys.stderr.write(line)
+        return_code = process.wait()
+    finally:
+        if timer is not None:
+            timer.cancel()
+        if process.poll() is None:
+            # 转发结果出错时不留下工作进程
+            process.kill()
+            process.wait()
+
+    if return_code != EXIT_OK:
+        writer.write({
+            'file': str(file_path),
+            'error': f"工作进程退出码 {return_code}",
+            'passed': False,
+        })
+
+
+def run_driver(args):
+    """主进程模式：收集文件并用工作进程池检测"""
+    parse_checks(args.checks)  # 提前校验参数，避免每个工作进程都报错
+    files = collect_asset_files(args.inspect)
+    if not files:
+        print("batch_inspect: 未找到 .blend/.fbx 文件", file=sys.stderr)
+        return EXIT_ERROR
+
+    blender_binary = args.blender or bpy.app.binary_path
+    output = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    writer = ReportWriter(output)
+
+    try:
+        with ThreadPoolExecutor(max_workers=max(1, args.jobs)) as executor:
+            futures = {
+                executor.submit(inspect_file_in_worker, blender_binary, file_path, args, writer): file_path
+                for file_path in files
+            }
+            # 转发线程中的异常记为该文件的错误，不能被线程池吞掉后报告通过
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as e:
+                    writer.write({'file': str(futures[future]), 'error': f"检测出错: {e}", 'passed': False})
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+    print(
+        f"batch_inspect: {len(files)} 个文件, {writer.objects_count} 个对象, "
+        f"{writer.failed_count} 个未通过, {writer.error_count} 个错误",
+        file=sys.stderr,
+    )
+
+    if writer.error_count:
+        return EXIT_ERROR
+    if writer.failed_count:
+        return EXIT_FAILED
+    return EXIT_OK
+
+
+def main(argv=None):
+    """命令行入口，退出码: 0 通过 / 1 发现问题 / 2 出错"""
+    args = build_arg_parser().parse_args(get_script_args(argv))
+
+    if args.worker:
+        exit_code = run_worker(args)
+    elif args.inspect:
+        exit_code = run_driver(args)
+    else:
+        print("batch_inspect: 需要指定 --inspect 目录或文件", file=sys.stderr)
+        exit_code = EXIT_ERROR
+
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    # 通过 blender --python 直接运行时，以包的方式导入自身以支持相对导入
+    import importlib
+    _module_file = Path(__file__).resolve()
+    sys.path.insert(0, str(_module_file.parents[2]))
+    importlib.import_module(f"{_module_file.parents[1].name}.model_inspector.batch_inspect").main()
@@ -0,0 +1,102 @@
+"""
+相交检测粗筛阶段（Broad Phase）
+用世界空间包围盒（AABB）排序扫描筛选可能相交的对象对，只有包围盒重叠的对象对才进入逐三角形检测
+"""
+
+import numpy as np
+
+EMPTY_PAIRS = np.empty((0, 2), dtype=np.int32)
+
+
+def transform_bounds(local_min, local_max, matrix):
+    """
+    将局部包围盒变换到世界空间
+
+    Returns:
+        tuple: (world_min, world_max) 各为 (3,) float64
+    """
+    m = np.array(matrix, dtype=np.float64)
+    corners = np.array([
+        [x, y, z]
+        for x in (local_min[0], local_max[0])
+        for y in (local_min[1], local_max[1])
+        for z in (local_min[2], local_max[2])
+    ], dtype=np.float64)
+    world = corners @ m[:3, :3].T + m[:3, 3]
+    return world.min(axis=0), world.max(axis=0)
+
+
+def overlapping_pairs(bounds_min, bounds_max, margin=0.0):
+    """
+    找出包围盒重叠的所有对象对（沿 X 轴排序扫描）
+
+    Args:
+        bounds_min, bounds_max: (n, 3) 世界空间包围盒
+        margin: 包围盒扩展量（如相交阈值或间隙距离）
+
+    Returns:
+        np.ndarray: (k, 2) int32，每行 (i, j) 且 i < j
+    """
+    bounds_min = np.asarray(bounds_min, dtype=np.float64).reshape(-1, 3) - margin
+    bounds_max = np.asarray(bounds_max, dtype=np.float64).reshape(-1, 3) + margin
+    count = len(bounds_min)
+    if count < 2:
+        return EMPTY_PAIRS
+
+    order = np.argsort(bounds_min[:, 0], kind='stable')
+    sorted_min = bounds_min[order]
+    sorted_max = bounds_max[order]
+    # 每个包围盒在 X 轴上可能重叠的后续范围
+    ends = np.searchsorted(sorted_min[:, 0], sorted_max[:, 0], side='right')
+
+    pairs = []
+    for i in range(count - 1):
+        end = ends[i]
+        if end <= i + 1:
+            continue
+        candidates = np.arange(i + 1, end)
+        hit = np.all(
+            (sorted_min[candidates, 1:] <= sorted_max[i, 1:]) &
+            (sorted_max[candidates, 1:] >= sorted_min[i, 1:]),
+            axis=1
+        )
+        if hit.any():
+            others = candidates[hit]
+            pairs.append(np.column_stack((np.full(len(others), i), others)))
+
+    if not pairs:
+        return EMPTY_PAIRS
+
+    pairs = order[np.concatenate(pairs)]
+    pairs.sort(axis=1)
+    return pairs.astype(np.int32)
+
+
+def _spread_bits(values):
+    """把 10 位整数的每一位间隔两位展开（Morton 编码）"""
+    values = values.astype(np.uint32) & 0x3FF
+    values = (values | (values << 16)) & 0x030000FF
+    values = (values | (values << 8)) & 0x0300F00F
+    values = (values | (values << 4)) & 0x030C30C3
+    values = (values | (values << 2)) & 0x09249249
+    return values
+
+
+def morton_order(points):
+    """
+    按 Morton（Z 序）曲线排序空间点，空间上相邻的点在顺序中也大多相邻
+
+    Args:
+        points: (n, 3) 点（通常为包围盒中心）
+
+    Returns:
+        np.ndarray: (n,) 排序后的索引
+    """
+    points = np.asarray(points, dtype=np.float64).reshape(-1, 3)
+    if len(points) < 2:
+        return np.arange(len(points))
+    low = points.min(axis=0)
+    extent = np.maximum(points.max(axis=0) - low, 1e-12)
+    cells = np.floor((points - low) / extent * 1023.0)
+    codes = _spread_bits(cells[:, 0]) | (_spread_bits(cells[:, 1]) << 1) | (_spread_bits(cells[:, 2]) << 2)
+    return np.argsort(codes, kind='stable')
@@ -0,0 +1,600 @@
+"""
+检测引擎
+每个对象在一次检测中只提取一份 NumPy 网格快照（mesh_cache.MeshGeometry），所有启用的检测项共享。
+检测项声明自己需要的缓冲，引擎先汇总全部需求，一次性读取，再逐项执行。
+新增检测项只需继承 MeshCheck 并用 register_check 注册。
+"""
+
+import numpy as np
+
+from . import mesh_cache
+from . import profiling
+from . import ray_batch
+from . import result_cache
+
+# 已注册的检测项 {名称: 检测项类}
+_registry = {}
+
+
+class MeshCheck:
+    """
+    单对象检测项基类
+
+    子类需要定义：
+        name: 检测项名称（注册键）
+        inspection_type: 结果在叠加层中的显示类型（如 'INTERSECT'、'DISTORTION'）
+        requires: 除顶点和三角形外需要的网格缓冲（见 mesh_cache.MESH_BUFFERS / DERIVED_BUFFERS）
+        cache_type: 结果磁盘缓存类型，None 表示不由引擎缓存
+        digest_buffers: 结果还依赖的其他缓冲（如 UV），其哈希会加入缓存键
+        stage: 性能分析阶段名
+    并实现 evaluate(geometry)，返回排序后的问题面索引 (int32)。
+    可选实现 face_values(geometry, faces)，返回问题面的严重程度标量 (float32)，用于热力图显示。
+    检测结果只取决于局部空间几何和参数，同一网格的关联复制只计算一次；
+    结果与对象变换有关的检测项覆盖 for_object，把变换换算为参数。
+    """
+    name = None
+    inspection_type = None
+    requires = ()
+    cache_type = None
+    digest_buffers = ()
+    stage = None
+
+    def __init__(self, **params):
+        self.params = params
+
+    @property
+    def param_values(self):
+        """参数值（按参数名排序，元组参数展开，用于记忆和缓存键）"""
+        values = []
+        for k in sorted(self.params):
+            value = self.params[k]
+            if isinstance(value, tuple):
+                values.extend(value)
+            else:
+                values.append(value)
+        return tuple(values)
+
+    def for_object(self, obj):
+        """返回用于该对象的检测项（默认结果与对象变换无关，返回自身）"""
+        return self
+
+    def evaluate(self, geometry):
+        raise NotImplementedError
+
+    face_values = None
+
+
+def register_check(cls):
+    """注册检测项（可用作类装饰器）"""
+    _registry[cls.name] = cls
+    return cls
+
+
+def get_check_class(name):
+    """按名称获取检测项类"""
+    return _registry[name]
+
+
+def get_registered_checks():
+    """获取全部已注册的检测项类"""
+    return list(_registry.values())
+
+
+def required_buffers(checks):
+    """汇总一组检测项需要的网格缓冲"""
+    buffers = []
+    for check in checks:
+        for name in check.requires:
+            if name not in buffers:
+                buffers.append(name)
+    return buffers
+
+
+def run_check(check, geometry, obj=None):
+    """
+    在几何快照上执行单个检测项（按参数记忆，按需读写磁盘缓存）
+
+    Returns:
+        np.ndarray: 排序后的问题面索引 (int32)
+    """
+    memo_key = (check.name, check.param_values)
+    faces = geometry.results.get(memo_key)
+    if faces is not None:
+        return faces
+
+    cache_key = None
+    if check.cache_type and result_cache.is_enabled():
+        digests = [geometry.digest] + [geometry.buffer_digest(name) for name in check.digest_buffers]
+        cache_key = result_cache.make_key(check.cache_type, digests, (), check.param_values)
+        cached = result_cache.load(cache_key)
+        if cached is not None:
+            geometry.results[memo_key] = cached[0]
+            return cached[0]
+
+    with profiling.span(check.stage, obj):
+        faces = check.evaluate(geometry)
+
+    geometry.results[memo_key] = faces
+    if cache_key is not None:
+        result_cache.store(cache_key, [faces])
+    return faces
+
+
+def run_object_checks(obj, checks, values=None):
+    """
+    对单个对象执行一组检测项，共享同一份几何快照
+
+    Args:
+        values: 可选字典，实现了 face_values 的检测项会写入 {检测项名称: 问题面标量}
+
+    Returns:
+        dict: {检测项名称: 问题面索引}
+    """
+    geometry = mesh_cache.get_geometry(obj, required_buffers(checks))
+    results = {}
+    for check in checks:
+        check = check.for_object(obj)
+        faces = run_check(check, geometry, obj)
+        results[check.name] = faces
+        if values is not None and check.face_values is not None and len(faces):
+            values[check.name] = check.face_values(geometry, faces)
+    return results
+
+
+def run_checks(objects, checks, values=None):
+    """
+    对一组对象执行一组检测项（单次遍历，每个对象只提取一次网格）
+
+    Args:
+        values: 可选字典，写入 {对象: {检测项名称: 问题面标量}}
+
+    Returns:
+        dict: {对象: {检测项名称: 问题面索引}}
+    """
+    results = {}
+    for obj in objects:
+        if obj.type != 'MESH' or not obj.data.polygons:
+            continue
+        object_values = {} if values is not None else None
+        results[obj] = run_object_checks(obj, checks, object_values)
+        if object_values:
+            values[obj] = object_values
+    return results
+
+
+# 内置检测项
+#################################################
+
+
+@register_check
+class SelfIntersectCheck(MeshCheck):
+    """自相交（参数：threshold，可选 max_faces：大于 0 时最多报告该数量的相交面）"""
+    name = 'SELF_INTERSECT'
+    inspection_type = 'INTERSECT'
+    stage = 'self_intersect'
+    # 记忆和磁盘缓存由 mesh_cache.self_intersect_faces 处理（与实例检测共用）
+
+    def evaluate(self, geometry):
+        return mesh_cache.self_intersect_faces(
+            geometry, self.params['threshold'], self.params.get('max_faces', 0)
+        )
+
+
+@register_check
+class DistortionCheck(MeshCheck):
+    """扭曲面（参数：angle_threshold，弧度）"""
+    name = 'DISTORTION'
+    inspection_type = 'DISTORTION'
+    requires = ('poly_normals', 'poly_loop_starts', 'poly_loop_totals', 'loop_verts', 'loop_polys')
+    cache_type = 'DISTORTION'
+    stage = 'distortion_eval'
+
+    def evaluate(self, geometry):
+        return distorted_faces(geometry, self.params['angle_threshold'])
+
+    def face_values(self, geometry, faces):
+        """问题面的最大扭曲角（弧度）"""
+        return face_distortion_angles(geometry)[0][faces]
+
+
+def face_distortion_angles(geometry):
+    """
+    批量计算每个面的最大扭曲角（弧度，按几何快照记忆）
+    与 bmesh 的 loop.calc_normal() 判定一致：每个环由前后两条边叉乘得到环法线，
+    取各环法线与面法线夹角（忽略朝向）的最大值；法线为零的退化面记为 pi/2。
+
+    Returns:
+        tuple: (每个面的最大扭曲角 (n,) float32, 退化面掩码 (n,) bool)
+    """
+    memo = geometry.results.get('DISTORTION_ANGLES')
+    if memo is not None:
+        return memo
+
+    totals = geometry.get_buffer('poly_loop_totals')
+    starts = geometry.get_buffer('poly_loop_starts')
+    loop_verts = geometry.get_buffer('loop_verts')
+    loop_polys = geometry.get_buffer('loop_polys')
+    face_normals = geometry.get_buffer('poly_normals').astype(np.float64)
+    positions = geometry.positions.astype(np.float64)
+
+    # 每个环在所属面内的前后环
+    loop_start = starts[loop_polys]
+    loop_total = totals[loop_polys]
+    offset = np.arange(len(loop_verts)) - loop_start
+    prev_loops = loop_start + (offset - 1) % loop_total
+    next_loops = loop_start + (offset + 1) % loop_total
+
+    co = positions[loop_verts]
+    loop_normals = np.cross(positions[loop_verts[prev_loops]] - co, positions[loop_verts[next_loops]] - co)
+    loop_lengths = np.linalg.norm(loop_normals, axis=1)
+
+    face_lengths = np.linalg.norm(face_normals, axis=1)
+    degenerate = face_lengths <= 1e-12
+    loop_face_normals = face_normals[loop_polys]
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        cos_angle = np.abs(np.einsum('ij,ij->i', loop_normals, loop_face_normals))
+        cos_angle /= loop_lengths * face_lengths[loop_polys]
+    # 零长度环法线回退为面法线（夹角为 0）
+    cos_angle[loop_lengths <= 1e-12] = 1.0
+    angles = np.arccos(np.clip(np.nan_to_num(cos_angle, nan=1.0), -1.0, 1.0))
+
+    face_angles = np.zeros(len(totals), dtype=np.float64)
+    np.maximum.at(face_angles, loop_polys, angles)
+    face_angles[degenerate] = np.pi / 2
+    memo = (face_angles.astype(np.float32), degenerate)
+    geometry.results['DISTORTION_ANGLES'] = memo
+    return memo
+
+
+def distorted_faces(geometry, angle_threshold):
+    """批量计算扭曲面：最大扭曲角超过阈值的面，以及退化面"""
+    if geometry.poly_count == 0:
+        return mesh_cache.EMPTY_FACES
+    face_angles, degenerate = face_distortion_angles(geometry)
+    return np.flatnonzero((face_angles > angle_threshold) | degenerate).astype(np.int32)
+
+
+# 拓扑检测项
+#################################################
+
+
+def _faces_from_loops(geometry, bad_loops):
+    """标记了问题的环 -> 包含这些环的面索引"""
+    loop_polys = geometry.get_buffer('loop_polys')
+    hits = np.bincount(loop_polys[bad_loops], minlength=geometry.poly_count)
+    return np.flatnonzero(hits).astype(np.int32)
+
+
+@register_check
+class NonManifoldCheck(MeshCheck):
+    """非流形边（参数无）：边界边、被三个及以上面共用的边、两侧面绕序相反的边"""
+    name = 'NON_MANIFOLD'
+    inspection_type = 'NON_MANIFOLD'
+    requires = ('loop_edges', 'loop_verts', 'loop_polys')
+    cache_type = 'NON_MANIFOLD'
+    stage = 'non_manifold'
+
+    def evaluate(self, geometry):
+        loop_edges = geometry.get_buffer('loop_edges')
+        if len(loop_edges) == 0:
+            return mesh_cache.EMPTY_FACES
+        loop_verts = geometry.get_buffer('loop_verts')
+
+        # 每条边被面使用的次数
+        edge_uses = np.bincount(loop_edges)
+        bad_edges = (edge_uses == 1) | (edge_uses > 2)
+
+        # 两个面共用的边：两个环从同一顶点出发说明相邻面法线方向不一致
+        order = np.argsort(loop_edges, kind='stable')
+        sorted_edges = loop_edges[order]
+        first = np.flatnonzero((sorted_edges[:-1] == sorted_edges[1:]) & (edge_uses[sorted_edges[:-1]] == 2))
+        flipped = loop_verts[order[first]] == loop_verts[order[first + 1]]
+        bad_edges[sorted_edges[first[flipped]]] = True
+
+        return _faces_from_loops(geometry, bad_edges[loop_edges])
+
+
+@register_check
+class ZeroAreaCheck(MeshCheck):
+    """零面积 / 退化面（参数：area_threshold，局部空间面积）"""
+    name = 'ZERO_AREA'
+    inspection_type = 'ZERO_AREA'
+    cache_type = 'ZERO_AREA'
+    stage = 'zero_area'
+
+    def evaluate(self, geometry):
+        if len(geometry.tris) == 0:
+            return mesh_cache.EMPTY_FACES
+        positions = geometry.positions.astype(np.float64)
+        tri_co = positions[geometry.tris]
+        tri_areas = 0.5 * np.linalg.norm(
+            np.cross(tri_co[:, 1] - tri_co[:, 0], tri_co[:, 2] - tri_co[:, 0]), axis=1
+        )
+        face_areas = np.bincount(geometry.tri_polys, weights=tri_areas, minlength=geometry.poly_count)
+        return np.flatnonzero(face_areas <= self.params['area_threshold']).astype(np.int32)
+
+
+@register_check
+class DuplicateVertsCheck(MeshCheck):
+    """
+    重复顶点（参数：merge_distance）
+    顶点坐标按合并距离量化后哈希分组，同一格内有多个顶点即视为重复；
+    完全重合的顶点一定会被找到，距离接近合并距离且落在相邻格的顶点可能漏检。
+    """
+    name = 'DUPLICATE_VERTS'
+    inspection_type = 'DUPLICATE_VERTS'
+    requires = ('loop_verts', 'loop_polys')
+    cache_type = 'DUPLICATE_VERTS'
+    stage = 'duplicate_verts'
+
+    def evaluate(self, geometry):
+        if len(geometry.positions) < 2:
+            return mesh_cache.EMPTY_FACES
+        cells = np.round(geometry.positions / self.params['merge_distance']).astype(np.int64)
+        _, inverse, counts = np.unique(cells, axis=0, return_inverse=True, return_counts=True)
+        duplicate_verts = counts[inverse.reshape(-1)] > 1
+        if not duplicate_verts.any():
+            return mesh_cache.EMPTY_FACES
+        return _faces_from_loops(geometry, duplicate_verts[geometry.get_buffer('loop_verts')])
+
+
+# UV 检测项
+#################################################
+
+# 单批检测的候选三角形对数量（限制临时数组内存）
+UV_PAIR_BATCH = 1 << 20
+
+
+def _uv_grid_entries(tri_min, tri_max):
+    """
+    将 UV 三角形按包围盒装入均匀网格，返回按单元排序的 (单元, 三角形) 条目
+    网格单元大小取三角形包围盒的平均尺寸，每个三角形通常只落入少数几个单元。
+
+    Returns:
+        tuple: (单元键, 单元 x, 单元 y, 三角形索引, 每个三角形的起始单元 (n, 2))，条目数为 O(三角形数)
+    """
+    count = len(tri_min)
+    origin = tri_min.min(axis=0)
+    total_extent = float((tri_max.max(axis=0) - origin).max())
+    cell_size = max(float((tri_max - tri_min).max(axis=1).mean()), total_extent / 4096.0, 1e-12)
+
+    # 个别很大的三角形会覆盖大量单元，条目过多时加大单元尺寸
+    while True:
+        cell_min = np.floor((tri_min - origin) / cell_size).astype(np.int64)
+        cell_max = np.floor((tri_max - origin) / cell_size).astype(np.int64)
+        span = cell_max - cell_min + 1
+        cells_per_tri = span[:, 0] * span[:, 1]
+        if cells_per_tri.sum() <= 4 * count + 1024 or cell_size >= total_extent:
+            break
+        cell_size *= 2.0
+
+    # 展开为 (单元, 三角形) 条目
+    entry_tris = np.repeat(np.arange(count, dtype=np.int64), cells_per_tri)
+    entry_start = np.cumsum(cells_per_tri) - cells_per_tri
+    entry_offset = np.arange(len(entry_tris), dtype=np.int64) - np.repeat(entry_start, cells_per_tri)
+    span_x = span[entry_tris, 0]
+    cell_x = cell_min[entry_tris, 0] + entry_offset % span_x
+    cell_y = cell_min[entry_tris, 1] + entry_offset // span_x
+    cell_keys = (cell_x << 32) | cell_y
+
+    order = np.argsort(cell_keys, kind='stable')
+    return cell_keys[order], cell_x[order], cell_y[order], entry_tris[order], cell_min
+
+
+def _uv_overlap_faces(uv_tris, tri_polys, poly_count, epsilon):
+    """
+    网格哈希筛选候选三角形对，分批做分离轴测试，返回 UV 重叠的面掩码 (poly_count,) bool
+    同一单元内的条目在排序后相邻：逐步比较间隔 step 的条目，每批候选对生成后立即检测，
+    峰值内存由条目数和 UV_PAIR_BATCH 决定，与单元内三角形数的平方无关。
+    两个面都已标记的三角形对不再检测；单元内的面全部标记后整个单元移出扫描，
+    重叠的 UV 岛（镜像、堆叠）因此很快收敛，不会逐对比较单元内的所有三角形。
+    """
+    cell_keys, cell_x, cell_y, entry_tris, cell_min = _uv_grid_entries(uv_tris.min(axis=1), uv_tris.max(axis=1))
+    flagged = np.zeros(poly_count, dtype=bool)
+
+    step = 1
+    while step < len(cell_keys):
+        same = np.flatnonzero(cell_keys[:-step] == cell_keys[step:])
+        if len(same) == 0:
+            break
+        for start in range(0, len(same), UV_PAIR_BATCH):
+            batch = same[start:start + UV_PAIR_BATCH]
+            tri_a = entry_tris[batch]
+            tri_b = entry_tris[batch + step]
+            poly_a = tri_polys[tri_a]
+            poly_b = tri_polys[tri_b]
+            # 同一个面三角化出的三角形之间不检测；跨多个单元的三角形对只在两者共有的第一个单元中检测
+            keep = (poly_a != poly_b) & ~(flagged[poly_a] & flagged[poly_b])
+            keep &= cell_x[batch] == np.maximum(cell_min[tri_a, 0], cell_min[tri_b, 0])
+            keep &= cell_y[batch] == np.maximum(cell_min[tri_a, 1], cell_min[tri_b, 1])
+            if not keep.any():
+                continue
+            tri_a, tri_b = tri_a[keep], tri_b[keep]
+            hit = triangles_overlap_2d(uv_tris[tri_a], uv_tris[tri_b], epsilon)
+            flagged[tri_polys[tri_a[hit]]] = True
+            flagged[tri_polys[tri_b[hit]]] = True
+
+        # 移除面已全部标记的单元
+        pending = ~flagged[tri_polys[entry_tris]]
+        if not pending.all():
+            cell_starts = np.flatnonzero(np.r_[True, cell_keys[1:] != cell_keys[:-1]])
+            cell_pending = np.add.reduceat(pending.astype(np.int64), cell_starts) > 0
+            keep = np.repeat(cell_pending, np.diff(np.r_[cell_starts, len(cell_keys)]))
+            cell_keys, cell_x, cell_y, entry_tris = cell_keys[keep], cell_x[keep], cell_y[keep], entry_tris[keep]
+        step += 1
+    return flagged
+
+
+def triangles_overlap_2d(tri_a, tri_b, epsilon):
+    """
+    批量 2D 三角形重叠测试（分离轴定理）
+
+    Args:
+        tri_a, tri_b: (n, 3, 2) 三角形顶点
+        epsilon: 重叠深度小于该值视为不重叠（共边 / 共点的相邻三角形不算重叠）
+
+    Returns:
+        np.ndarray: (n,) bool
+    """
+    overlap = np.ones(len(tri_a), dtype=bool)
+    for tri in (tri_a, tri_b):
+        for i in range(3):
+            edge = tri[:, (i + 1) % 3] - tri[:, i]
+            axis = np.column_stack((-edge[:, 1], edge[:, 0]))
+            length = np.linalg.norm(axis, axis=1)
+            valid = length > 1e-20
+            axis[valid] /= length[valid, None]
+            proj_a = np.einsum('nij,nj->ni', tri_a, axis)
+            proj_b = np.einsum('nij,nj->ni', tri_b, axis)
+            separated = ((proj_a.max(axis=1) - proj_b.min(axis=1) <= epsilon) |
+                         (proj_b.max(axis=1) - proj_a.min(axis=1) <= epsilon))
+            overlap &= ~(separated & valid)
+    return overlap
+
+
+@register_check
+class UVOverlapCheck(MeshCheck):
+    """UV 重叠（参数：epsilon，UV 空间重叠容差），检测活动 UV 层"""
+    name = 'UV_OVERLAP'
+    inspection_type = 'UV_OVERLAP'
+    requires = ('uvs', 'tri_loops')
+    cache_type = 'UV_OVERLAP'
+    digest_buffers = ('uvs',)
+    stage = 'uv_overlap'
+
+    def evaluate(self, geometry):
+        uvs = geometry.get_buffer('uvs')
+        if len(uvs) == 0 or len(geometry.tris) < 2:
+            return mesh_cache.EMPTY_FACES
+        epsilon = self.params['epsilon']
+
+        uv_tris = uvs[geometry.get_buffer('tri_loops')].astype(np.float64)
+        # UV 面积为零的三角形不会与其他三角形重叠，不参与检测
+        edge1 = uv_tris[:, 1] - uv_tris[:, 0]
+        edge2 = uv_tris[:, 2] - uv_tris[:, 0]
+        areas = np.abs(edge1[:, 0] * edge2[:, 1] - edge1[:, 1] * edge2[:, 0]) * 0.5
+        valid = np.flatnonzero(areas > epsilon * epsilon)
+        if len(valid) < 2:
+            return mesh_cache.EMPTY_FACES
+        flagged = _uv_overlap_faces(uv_tris[valid], geometry.tri_polys[valid], geometry.poly_count, epsilon)
+        return np.flatnonzero(flagged).astype(np.int32)
+
+
+# 壁厚检测项
+#################################################
+
+
+@register_check
+class ThicknessCheck(MeshCheck):
+    """
+    最小壁厚（参数：min_thickness 世界空间距离，max_samples 最多采样面数，0 为全部）
+    从每个面中心沿法线反方向向内投射射线，在 min_thickness 内命中对侧表面的面即为过薄。
+    射线在局部空间投射，对象有缩放时 for_object 加入 metric 参数（局部到世界线性变换的度量 M^T M 上三角），
+    命中距离按射线方向的缩放换算为世界距离。
+    workers 只影响执行方式，不影响结果，因此不作为参数参与缓存键。
+    """
+    name = 'THICKNESS'
+    inspection_type = 'THIN_WALL'
+    requires = ('poly_centers', 'poly_normals')
+    cache_type = 'THICKNESS'
+    stage = 'thickness'
+
+    def __init__(self, workers=1, **params):
+        super().__init__(**params)
+        self.workers = workers
+
+    def for_object(self, obj):
+        """对象有缩放时把局部空间的度量加入参数（只有旋转和平移时结果与对象无关）"""
+        linear = np.array(obj.matrix_world, dtype=np.float64)[:3, :3]
+        metric = linear.T @ linear
+        if np.allclose(metric, np.eye(3), rtol=0.0, atol=1e-9):
+            return self
+        upper = tuple(float(v) for v in np.round(metric[np.triu_indices(3)], 9))
+        return ThicknessCheck(workers=self.workers, **dict(self.params, metric=upper))
+
+    def _stretch(self, directions):
+        """局部空间单位方向在世界空间中的长度"""
+        upper = self.params.get('metric')
+        if upper is None:
+            return np.ones(len(directions))
+        metric = np.empty((3, 3))
+        metric[np.triu_indices(3)] = upper
+        metric[np.tril_indices(3)] = metric.T[np.tril_indices(3)]
+        return np.sqrt(np.einsum('ij,jk,ik->i', directions, metric, directions))
+
+    def _cast(self, geometry, faces):
+        """从指定面中心向内投射，返回 (有效面, 命中三角形索引, 世界空间命中距离)"""
+        min_thickness = self.params['min_thickness']
+        normals = geometry.get_buffer('poly_normals')[faces].astype(np.float64)
+        lengths = np.linalg.norm(normals, axis=1)
+        valid = lengths > 1e-12
+        faces = faces[valid]
+        directions = -normals[valid] / lengths[valid, None]
+        stretch = self._stretch(directions)
+        # 起点略微移入内部，避免命中自身
+        offset = min(min_thickness * 1e-3, 1e-5)
+        origins = geometry.get_buffer('poly_centers')[faces].astype(np.float64) + directions * offset
+
+        # 按缩放最小的方向确定局部投射距离，命中后再逐条换算为世界距离筛选
+        distance = min_thickness / stretch.min() if len(stretch) else min_thickness
+        tree = geometry.get_bvh()
+        hit_indices, distances = ray_batch.cast_rays(
+            tree, origins, directions, distance,
+            ray_owners=faces, tri_owners=geometry.tri_polys, workers=self.workers
+        )
+        distances = (distances + offset) * stretch
+        hit_indices[distances > min_thickness] = -1
+        return faces, hit_indices, distances
+
+    def evaluate(self, geometry):
+        if geometry.poly_count == 0 or len(geometry.tris) == 0:
+            return mesh_cache.EMPTY_FACES
+        max_samples = self.params['max_samples']
+
+        faces = np.arange(geometry.poly_count, dtype=np.int32)
+        if 0 < max_samples < len(faces):
+            # 均匀抽样，结果可复现
+            faces = np.unique(np.linspace(0, len(faces) - 1, max_samples).astype(np.int32))
+
+        faces, hit_indices, _ = self._cast(geometry, faces)
+        return faces[hit_indices >= 0]
+
+    def face_values(self, geometry, faces):
+        """问题面的世界空间壁厚（结果可能来自磁盘缓存，因此只对问题面重新投射）"""
+        faces = np.asarray(faces, dtype=np.int32)
+        valid_faces, _, distances = self._cast(geometry, faces)
+        values = np.full(len(faces), np.inf, dtype=np.float32)
+        values[np.isin(faces, valid_faces)] = distances
+        return values
+
+
+# 拓扑检测项 -> 面板开关属性名
+TOPOLOGY_CHECKS = (
+    (NonManifoldCheck, 'check_non_manifold'),
+    (ZeroAreaCheck, 'check_zero_area'),
+    (DuplicateVertsCheck, 'check_duplicate_verts'),
+)
+
+
+def thickness_check_from_props(props):
+    """根据面板设置创建壁厚检测项"""
+    return ThicknessCheck(
+        workers=props.thickness_workers,
+        min_thickness=props.min_thickness,
+        max_samples=props.thickness_samples,
+    )
+
+
+def topology_checks_from_props(props):
+    """根据面板设置创建启用的拓扑检测项"""
+    if not props.check_topology:
+        return []
+    checks = []
+    if props.check_non_manifold:
+        checks.append(NonManifoldCheck())
+    if props.check_zero_area:
+        checks.append(ZeroAreaCheck(area_threshold=props.zero_area_threshold))
+    if props.check_duplicate_verts:
+        checks.append(DuplicateVertsCheck(merge_distance=props.merge_distance))
+    return checks
@@ -0,0 +1,60 @@
+"""
+间隙检测
+找出两个对象之间距离小于间隙值但不一定相交的区域（如服装层与身体）。
+对包围盒（扩展间隙值后）重叠的对象对，采样一侧的顶点，批量查询另一侧缓存 BVH 上的最近点，
+得到每个面的最小距离（面的所有顶点中最近的一个）。
+"""
+
+import numpy as np
+
+from . import profiling
+from . import ray_batch
+
+# 间隙检测需要的额外缓冲（顶点距离 -> 面距离）
+REQUIRED_BUFFERS = ('loop_verts', 'loop_polys')
+
+
+def _sample_vertices(vertex_count, max_samples):
+    """采样顶点索引（0 表示全部顶点，否则均匀抽样）"""
+    if 0 < max_samples < vertex_count:
+        return np.unique(np.linspace(0, vertex_count - 1, max_samples).astype(np.int64))
+    return np.arange(vertex_count)
+
+
+def face_clearance(geometry, matrix, other_geometry, other_matrix, distance, max_samples=0, epsilon=0.0):
+    """
+    计算 geometry 每个面到 other_geometry 的最小世界空间距离
+
+    Returns:
+        np.ndarray: (面数,) float32，超出间隙值（或未采样）的面为 inf
+    """
+    face_distances = np.full(geometry.poly_count, np.inf, dtype=np.float32)
+    if len(geometry.positions) == 0 or len(other_geometry.tris) == 0:
+        return face_distances
+
+    samples = _sample_vertices(len(geometry.positions), max_samples)
+    m = np.array(matrix, dtype=np.float64)
+    points_world = geometry.positions[samples].astype(np.float64) @ m[:3, :3].T + m[:3, 3]
+
+    # 在另一侧的局部空间查询，复用其缓存的 BVH；局部距离上限按最小缩放换算
+    other_m = np.array(other_matrix, dtype=np.float64)
+    to_other = np.array(other_matrix.inverted_safe(), dtype=np.float64)
+    points_local = points_world @ to_other[:3, :3].T + to_other[:3, 3]
+    min_scale = np.linalg.svd(other_m[:3, :3], compute_uv=False).min()
+    local_distance = distance / min_scale if min_scale > 1e-12 else distance
+
+    tree = other_geometry.get_bvh(epsilon)
+    with profiling.span('clearance'):
+        locations, found = ray_batch.find_nearest_batch(tree, points_local, local_distance)
+
+    vertex_distances = np.full(len(geometry.positions), np.inf, dtype=np.float64)
+    if found.any():
+        nearest_world = locations[found] @ other_m[:3, :3].T + other_m[:3, 3]
+        vertex_distances[samples[found]] = np.linalg.norm(nearest_world - points_world[found], axis=1)
+    vertex_distances[vertex_distances > distance] = np.inf
+
+    # 顶点距离 -> 面最小距离
+    loop_verts = geometry.get_buffer('loop_verts')
+    loop_polys = geometry.get_buffer('loop_polys')
+    np.minimum.at(face_distances, loop_polys, vertex_distances[loop_verts].astype(np.float32))
+    return face_distances
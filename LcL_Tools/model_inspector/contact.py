@@ -0,0 +1,149 @@
+"""
+相交接触线
+对窄相位（BVH 重叠查询）得到的相交三角形对批量求交线段：
+每个三角形与另一个三角形所在平面的交为一条线段，两条线段在两平面交线方向上的重叠部分即为接触线段。
+接触线只有少量顶点，比高亮整个相交面更精确，叠加层数据也少得多。
+"""
+
+import numpy as np
+
+from . import mesh_cache
+from . import profiling
+
+EMPTY_SEGMENTS = np.empty((0, 2, 3), dtype=np.float32)
+
+# 每条边的下一个顶点
+_NEXT_VERTEX = [1, 2, 0]
+
+
+def _to_world(points, matrix):
+    """用 4x4 矩阵变换任意形状 (..., 3) 的点"""
+    m = np.array(matrix, dtype=np.float64)
+    return np.asarray(points, dtype=np.float64) @ m[:3, :3].T + m[:3, 3]
+
+
+def _planes(tris):
+    """三角形所在平面 (法线 (n, 3), 偏移 (n,))"""
+    normals = np.cross(tris[:, 1] - tris[:, 0], tris[:, 2] - tris[:, 0])
+    return normals, np.einsum('ij,ij->i', normals, tris[:, 0])
+
+
+def _plane_crossings(tris, normals, offsets):
+    """
+    三角形与平面的交线段
+
+    Returns:
+        tuple: (端点 (n, 2, 3), 是否与平面相交 (n,) bool)
+    """
+    distances = np.einsum('nvj,nj->nv', tris, normals) - offsets[:, None]
+    # 恰好位于平面上的顶点视为正侧，穿越平面的边只可能有 0 或 2 条
+    side = distances >= 0
+    crosses = side != side[:, _NEXT_VERTEX]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        t = distances / (distances - distances[:, _NEXT_VERTEX])
+    # 未穿越平面的边不取交点（两端到平面距离相等时 t 为无穷大，相乘会溢出）
+    t = np.where(crosses, t, 0.0)
+    points = tris + (tris[:, _NEXT_VERTEX] - tris) * t[..., None]
+
+    # 取两条穿越边上的交点
+    edges = np.argsort(~crosses, axis=1, kind='stable')[:, :2]
+    ends = points[np.arange(len(tris))[:, None], edges]
+    return ends, crosses.sum(axis=1) == 2
+
+
+def _pair_segments(tris_a, tris_b):
+    """
+    逐对计算三角形对的交线段
+
+    Returns:
+        tuple: (起点 (n, 3), 终点 (n, 3), 是否有交线段 (n,) bool)
+    """
+    tris_a = np.asarray(tris_a, dtype=np.float64)
+    tris_b = np.asarray(tris_b, dtype=np.float64)
+
+    normals_a, offsets_a = _planes(tris_a)
+    normals_b, offsets_b = _planes(tris_b)
+    ends_a, valid_a = _plane_crossings(tris_a, normals_b, offsets_b)
+    ends_b, valid_b = _plane_crossings(tris_b, normals_a, offsets_a)
+
+    # 两条线段都位于两平面的交线上，沿交线方向取重叠区间
+    direction = np.cross(normals_a, normals_b)
+    scale = np.linalg.norm(normals_a, axis=1) * np.linalg.norm(normals_b, axis=1)
+    not_parallel = np.linalg.norm(direction, axis=1) > 1e-9 * scale
+
+    s_a = np.einsum('nkj,nj->nk', ends_a, direction)
+    s_b = np.einsum('nkj,nj->nk', ends_b, direction)
+    order_a = np.argsort(s_a, axis=1)
+    order_b = np.argsort(s_b, axis=1)
+    rows = np.arange(len(tris_a))[:, None]
+    ends_a, s_a = ends_a[rows, order_a], s_a[rows, order_a]
+    ends_b, s_b = ends_b[rows, order_b], s_b[rows, order_b]
+
+    start_from_a = s_a[:, 0] >= s_b[:, 0]
+    end_from_a = s_a[:, 1] <= s_b[:, 1]
+    starts = np.where(start_from_a[:, None], ends_a[:, 0], ends_b[:, 0])
+    ends = np.where(end_from_a[:, None], ends_a[:, 1], ends_b[:, 1])
+    overlapping = np.maximum(s_a[:, 0], s_b[:, 0]) <= np.minimum(s_a[:, 1], s_b[:, 1])
+
+    return starts, ends, valid_a & valid_b & not_parallel & overlapping
+
+
+def triangle_segments(tris_a, tris_b):
+    """
+    批量计算三角形对的交线段（共面的三角形对没有交线段）
+
+    Args:
+        tris_a, tris_b: (n, 3, 3) 同一坐标空间中的三角形对
+
+    Returns:
+        np.ndarray: (m, 2, 3) float32 交线段
+    """
+    if len(tris_a) == 0:
+        return EMPTY_SEGMENTS
+    starts, ends, valid = _pair_segments(tris_a, tris_b)
+    return np.stack((starts[valid], ends[valid]), axis=1).astype(np.float32)
+
+
+def self_contact_segments(geometry, matrix, epsilon):
+    """
+    自相交接触线（局部空间计算并按几何快照记忆，返回世界空间）
+    复用自相交检测记忆的三角形对，结果来自磁盘缓存（没有三角形对）时才重新做重叠查询
+
+    Returns:
+        np.ndarray: (m, 2, 3) float32 世界空间交线段
+    """
+    memo_key = ('SELF_CONTACT', epsilon)
+    segments = geometry.results.get(memo_key)
+    if segments is None:
+        pairs = geometry.results.get(('SELF_PAIRS', epsilon))
+        if pairs is None:
+            pairs = mesh_cache.self_overlap_pairs(geometry, epsilon)
+        with profiling.span('contact'):
+            tris = geometry.positions[geometry.tris]
+            segments = triangle_segments(tris[pairs[:, 0]], tris[pairs[:, 1]])
+        geometry.results[memo_key] = segments
+
+    if len(segments) == 0:
+        return EMPTY_SEGMENTS
+    return _to_world(segments, matrix).astype(np.float32)
+
+
+def pair_contact_segments(geometry1, matrix1, geometry2, matrix2, epsilon):
+    """
+    两份几何之间的接触线
+    复用窄相位记入会话的三角形对，结果来自磁盘缓存（没有三角形对）时才重新做重叠查询
+
+    Returns:
+        np.ndarray: (m, 2, 3) float32 世界空间交线段
+    """
+    pairs = mesh_cache.get_pair_triangles(geometry1, matrix1, geometry2, matrix2, epsilon)
+    if pairs is None:
+        pairs = mesh_cache.pair_overlap(geometry1, matrix1, geometry2, matrix2, epsilon)
+    if len(pairs) == 0:
+        return EMPTY_SEGMENTS
+
+    with profiling.span('contact'):
+        # 只变换参与相交的三角形
+        tris1 = _to_world(geometry1.positions[geometry1.tris[pairs[:, 0]]], matrix1)
+        tris2 = _to_world(geometry2.positions[geometry2.tris[pairs[:, 1]]], matrix2)
+        return triangle_segments(tris1, tris2)
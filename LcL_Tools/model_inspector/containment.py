@@ -0,0 +1,93 @@
+"""
+包含检测
+表面相交检测（BVHTree.overlap）找不到完全埋在其他网格内部的对象。
+对包围盒重叠但没有表面相交的对象对，取内侧对象的一个顶点做奇偶射线判定：
+没有表面相交时，只要一个顶点在外侧网格内部，整个对象就在内部。
+"""
+
+import numpy as np
+
+from . import profiling
+from . import ray_batch
+
+# 奇偶判定使用的射线方向（避开坐标轴，减少恰好穿过边或顶点的情况），多数表决
+PARITY_DIRECTIONS = (
+    (0.5773, 0.5774, 0.5775),
+    (-0.7071, 0.0123, 0.7070),
+    (0.1234, -0.9876, 0.0987),
+)
+
+
+def _sample_point(geometry):
+    """内侧对象的采样顶点（取第一个三角形的顶点，避免取到不属于任何面的孤立顶点）"""
+    return geometry.positions[geometry.tris[0, 0]].astype(np.float64)
+
+
+def _bounds_inside(inner_min, inner_max, outer_min, outer_max, margin):
+    return bool(np.all(inner_min >= outer_min - margin) and np.all(inner_max <= outer_max + margin))
+
+
+def points_inside(tree, points):
+    """
+    批量判断点是否在封闭网格内部（局部空间）
+
+    Returns:
+        np.ndarray: (n,) bool
+    """
+    votes = np.zeros(len(points), dtype=np.int32)
+    for direction in PARITY_DIRECTIONS:
+        votes += ray_batch.count_crossings(tree, points, direction) % 2
+    return votes * 2 > len(PARITY_DIRECTIONS)
+
+
+def nested_pairs(pairs, bounds_min, bounds_max, epsilon):
+    """
+    包围盒粗筛：只保留一侧包围盒完全在另一侧内部的对象对（只比较包围盒，不需要几何）
+
+    Returns:
+        list[tuple]: [(内侧索引, 外侧索引)]
+    """
+    nested = []
+    for i, j in pairs:
+        i, j = int(i), int(j)
+        if _bounds_inside(bounds_min[i], bounds_max[i], bounds_min[j], bounds_max[j], epsilon):
+            nested.append((i, j))
+        elif _bounds_inside(bounds_min[j], bounds_max[j], bounds_min[i], bounds_max[i], epsilon):
+            nested.append((j, i))
+    return nested
+
+
+def find_buried(items, pairs, bounds_min, bounds_max, epsilon):
+    """
+    找出完全在其他对象内部的对象
+
+    Args:
+        items: 参与检测的对象 / 实例（需要 geometry 和 matrix 属性），可以是只包含 pairs 用到的索引的字典
+        pairs: 包围盒重叠且没有表面相交的对象对 [(i, j)]
+        bounds_min, bounds_max: (n, 3) 各对象的世界空间包围盒
+        epsilon: 包围盒比较容差
+
+    Returns:
+        list[tuple]: [(内侧索引, 外侧索引)]
+    """
+    # 按外侧对象分组，同一外侧对象的所有采样点一次批量判定
+    candidates = {}
+    for inner, outer in nested_pairs(pairs, bounds_min, bounds_max, epsilon):
+        candidates.setdefault(outer, []).append(inner)
+
+    buried = []
+    with profiling.span('containment'):
+        for outer, inners in candidates.items():
+            outer_item = items[outer]
+            to_outer_local = np.array(outer_item.matrix.inverted_safe(), dtype=np.float64)
+            points = []
+            for inner in inners:
+                inner_item = items[inner]
+                m = np.array(inner_item.matrix, dtype=np.float64)
+                world = m[:3, :3] @ _sample_point(inner_item.geometry) + m[:3, 3]
+                points.append(to_outer_local[:3, :3] @ world + to_outer_local[:3, 3])
+
+            inside = points_inside(outer_item.geometry.get_bvh(epsilon), np.array(points))
+            buried.extend((inner, outer) for inner, hit in zip(inners, inside) if hit)
+
+    return buried
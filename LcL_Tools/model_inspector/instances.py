@@ -0,0 +1,146 @@
+"""
+实例相交检测
+遍历 depsgraph.object_instances，检测几何节点 / 集合实例之间以及实例与普通对象之间的相交。
+每份唯一实例几何只提取一次并缓存一棵局部 BVH，每个实例只保存世界矩阵，
+先用包围盒粗筛出可能相交的对象对，再逐三角形检测；
+包围盒重叠但没有表面相交的对象对再做包含检测，找出完全埋在其他对象内部的实例。
+"""
+
+import numpy as np
+
+from . import broad_phase
+from . import containment
+from . import mesh_cache
+from . import pair_batch
+from . import profiling
+
+
+class InspectionItem:
+    """参与检测的一个实例或对象"""
+    __slots__ = ('label', 'owner', 'geometry', 'matrix', 'is_instance')
+
+    def __init__(self, label, owner, geometry, matrix, is_instance):
+        self.label = label              # 显示名称（实例为 "实例化者[序号]"）
+        self.owner = owner              # 原始对象（实例为其实例化者）
+        self.geometry = geometry        # 局部空间几何（同一实例几何共享）
+        self.matrix = matrix            # 世界矩阵
+        self.is_instance = is_instance
+
+
+def collect_items(context, selected_objects, geometry_cache):
+    """
+    收集选中对象及其产生的实例
+
+    Args:
+        selected_objects: 选中的对象（可以是网格、带几何节点的对象或集合实例空物体）
+
+    Returns:
+        list[InspectionItem]
+    """
+    selected = {obj.original for obj in selected_objects}
+    depsgraph = context.evaluated_depsgraph_get()
+    items = []
+    real_objects = []
+    instance_counters = {}
+
+    with profiling.span('collect_instances'):
+        for inst in depsgraph.object_instances:
+            ob = inst.object
+            if ob.type != 'MESH':
+                continue
+
+            if not inst.is_instance:
+                # 普通对象在遍历结束后再提取几何（避免在迭代中调用 to_mesh）
+                if ob.original in selected:
+                    real_objects.append((ob.original, inst.matrix_world.copy()))
+                continue
+
+            owner = inst.parent.original if inst.parent else None
+            if owner not in selected:
+                continue
+            index = instance_counters.get(owner.name, 0)
+            instance_counters[owner.name] = index + 1
+            geometry = geometry_cache.get_instanced(ob)
+            if len(geometry.tris) == 0:
+                continue
+            # 实例迭代器中的数据只在当前迭代有效，矩阵必须复制
+            items.append(InspectionItem(
+                f"{owner.name}[{index}]", owner, geometry, inst.matrix_world.copy(), True
+            ))
+
+    for obj, matrix in real_objects:
+        geometry = geometry_cache.get(obj)
+        if len(geometry.tris):
+            items.append(InspectionItem(obj.name, obj, geometry, matrix, False))
+
+    return items
+
+
+def world_triangles(geometry, matrix, faces):
+    """获取指定面的世界空间三角形顶点 (n*3, 3) float32，用于叠加层绘制"""
+    tri_mask = np.isin(geometry.tri_polys, faces)
+    positions = geometry.transformed_positions(matrix)
+    return positions[geometry.tris[tri_mask].ravel()].astype(np.float32)
+
+
+def item_world_bounds(items):
+    """
+    各对象的世界空间包围盒
+
+    Returns:
+        tuple: (bounds_min, bounds_max) 各为 (n, 3)
+    """
+    bounds = [broad_phase.transform_bounds(*item.geometry.local_bounds, item.matrix) for item in items]
+    return np.array([b[0] for b in bounds]), np.array([b[1] for b in bounds])
+
+
+def check_item_intersections(items, epsilon, bounds=None, misses=None, max_faces=0, workers=1):
+    """
+    检测实例 / 对象之间的相交（只检测包围盒重叠的对象对）
+
+    Args:
+        bounds: 可选，预先计算的 item_world_bounds 结果
+        misses: 可选列表，包围盒重叠但没有表面相交的对象对 (i, j) 会追加到其中
+        max_faces: 大于 0 时每个对象对每一侧最多报告该数量的相交面
+        workers: 窄相位并行数（见 pair_batch）
+
+    Returns:
+        list[tuple]: [(i, j, faces_i, faces_j)] 有相交的对象对
+    """
+    if len(items) < 2:
+        return []
+
+    with profiling.span('broad_phase'):
+        bounds_min, bounds_max = bounds if bounds is not None else item_world_bounds(items)
+        candidate_pairs = broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=epsilon)
+
+    pair_faces = pair_batch.pair_intersect_batch(
+        [(items[i].geometry, items[i].matrix, items[j].geometry, items[j].matrix) for i, j in candidate_pairs],
+        epsilon, max_faces, workers
+    )
+    results = []
+    for (i, j), (faces1, faces2) in zip(candidate_pairs, pair_faces):
+        if len(faces1) or len(faces2):
+            results.append((int(i), int(j), faces1, faces2))
+        elif misses is not None:
+            misses.append((int(i), int(j)))
+    return results
+
+
+def inspect_instances(context, selected_objects, epsilon, max_faces=0, workers=1):
+    """
+    实例相交检测入口
+
+    Returns:
+        tuple: (items, 相交结果列表, 被包埋的 [(内侧索引, 外侧索引)])
+    """
+    geometry_cache = mesh_cache.get_session_cache()
+    items = collect_items(context, selected_objects, geometry_cache)
+    if len(items) < 2:
+        return items, [], []
+
+    bounds = item_world_bounds(items)
+    misses = []
+    results = check_item_intersections(items, epsilon, bounds, misses, max_faces, workers)
+    buried = containment.find_buried(items, misses, *bounds, epsilon)
+    return items, results, buried
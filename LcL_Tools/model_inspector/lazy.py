@@ -0,0 +1,38 @@
+"""
+延迟导入
+插件启用时只需要注册操作符、属性和面板，检测和绘制模块（NumPy、bmesh、gpu 等）
+在操作符第一次执行或面板第一次读取检测数据时才真正加载，缩短插件启用和 Blender 启动时间。
+"""
+
+import importlib.util
+import sys
+import types
+
+
+def lazy_import(name):
+    """
+    返回延迟加载的模块：首次访问模块属性时才执行模块代码（importlib.util.LazyLoader）
+    模块已经加载过时直接返回
+
+    Args:
+        name: 完整模块名（如 __package__ + ".mesh_helpers"）
+    """
+    module = sys.modules.get(name)
+    if module is not None:
+        return module
+
+    spec = importlib.util.find_spec(name)
+    loader = importlib.util.LazyLoader(spec.loader)
+    spec.loader = loader
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    loader.exec_module(module)
+    return module
+
+
+def is_loaded(module):
+    """
+    延迟导入的模块是否已经执行（LazyLoader 执行模块后会把模块类型恢复为 ModuleType）
+    只检查类型，不会触发加载
+    """
+    return type(module) is types.ModuleType
@@ -0,0 +1,747 @@
+"""
+网格几何缓存
+关联复制（共享同一网格数据）的对象按网格分组，每份唯一网格只提取一次局部空间几何、
+构建一次局部空间 BVH 并只做一次自相交检测，结果分发给所有使用该网格的对象。
+对象间检测通过相对矩阵把较小的一侧变换到较大一侧的局部空间，复用其缓存的 BVH。
+除顶点和三角形外，检测项需要的其他缓冲（边、面法线、UV 等）按需读取，同一次检测中每种缓冲只读取一次。
+"""
+
+from collections import OrderedDict
+from contextlib import contextmanager
+from itertools import islice
+
+import bpy
+import numpy as np
+from mathutils.bvhtree import BVHTree
+
+from . import profiling
+from . import result_cache
+
+EMPTY_FACES = np.empty(0, dtype=np.int32)
+EMPTY_TRI_PAIRS = np.empty((0, 2), dtype=np.int32)
+
+# 基础缓冲（每份几何都会提取）
+BASE_BUFFERS = ('positions', 'tris', 'tri_polys')
+
+# BVH 内存估算（每个三角形的字节数，mathutils 不提供 BVH 实际占用）
+BVH_BYTES_PER_TRI = 96
+
+# 流式检测中每批处理的对象对数（同一批的几何同时驻留在缓存中）
+STREAM_PAIR_CHUNK = 64
+
+# 淘汰前重新估算内存的最近使用几何数（获取后才构建的 BVH、派生缓冲会使估算变大）
+EVICT_REFRESH = 8
+
+# 当前检测会话的几何缓存（None 表示未在会话中，每次调用单独提取）
+_session_cache = None
+
+
+class MeshGeometry:
+    """单份唯一网格的局部空间几何（评估后，含修改器和动画）"""
+
+    def __init__(self, key, positions, tris, tri_polys, poly_count):
+        self.key = key
+        self.positions = positions    # (顶点数, 3) float32，局部空间
+        self.tris = tris              # (三角形数, 3) int32，顶点索引
+        self.tri_polys = tri_polys    # (三角形数,) int32，三角形所属的面索引
+        self.poly_count = poly_count
+        self.buffers = {}             # 按需读取或派生的其他缓冲
+        self.results = {}             # 与变换无关的检测结果（如自相交），按参数记忆
+        self._digest = None
+        self._bvhs = {}               # 局部空间 BVH {精度: BVHTree}
+        self._bounds = None
+
+    @property
+    def digest(self):
+        """几何内容哈希（用于结果缓存键）"""
+        if self._digest is None:
+            self._digest = result_cache.buffers_digest(self.positions, self.tris, self.tri_polys)
+        return self._digest
+
+    def buffer_digest(self, name):
+        """单个缓冲的内容哈希（检测结果依赖基础缓冲以外的数据时加入缓存键，如 UV）"""
+        key = ('DIGEST', name)
+        digest = self.results.get(key)
+        if digest is None:
+            digest = result_cache.buffers_digest(self.get_buffer(name))
+            self.results[key] = digest
+        return digest
+
+    @property
+    def local_bounds(self):
+        """局部空间包围盒 (min, max)"""
+        if self._bounds is None:
+            if len(self.positions):
+                self._bounds = (self.positions.min(axis=0), self.positions.max(axis=0))
+            else:
+                zero = np.zeros(3, dtype=np.float32)
+                self._bounds = (zero, zero)
+        return self._bounds
+
+    def get_bvh(self, epsilon=None):
+        """
+        获取局部空间 BVH（每种精度只构建一次）
+
+        Args:
+            epsilon: 重叠查询的精度；None 表示与精度无关的查询（射线投射），复用已构建的任意一棵树
+        """
+        if epsilon is None:
+            if self._bvhs:
+                return next(iter(self._bvhs.values()))
+            epsilon = 0.0
+        tree = self._bvhs.get(epsilon)
+        if tree is None:
+            with profiling.span('bvh_build'):
+                tree = BVHTree.FromPolygons(
+                    self.positions.tolist(), self.tris.tolist(),
+                    all_triangles=True, epsilon=epsilon
+                )
+            self._bvhs[epsilon] = tree
+        return tree
+
+    def missing_buffers(self, names):
+        """返回尚未读取的网格缓冲名称（派生缓冲展开为其依赖）"""
+        return [name for name in expand_buffers(names) if name not in self.buffers]
+
+    def get_buffer(self, name):
+        """
+        获取缓冲，派生缓冲首次访问时计算
+        需要从网格读取的缓冲必须已在提取时请求（见 GeometryCache.get 的 buffers 参数）
+        """
+        if name in BASE_BUFFERS:
+            return getattr(self, name)
+        buffer = self.buffers.get(name)
+        if buffer is None:
+            derive = DERIVED_BUFFERS.get(name)
+            if derive is None:
+                raise KeyError(f"网格缓冲 {name} 未提取")
+            buffer = derive(self)
+            self.buffers[name] = buffer
+        return buffer
+
+    def transformed_positions(self, matrix):
+        """用 4x4 矩阵变换顶点（NumPy 批量计算，不复制 bmesh）"""
+        m = np.array(matrix, dtype=np.float64)
+        return self.positions @ m[:3, :3].T + m[:3, 3]
+
+    @property
+    def has_bvh(self):
+        """是否已构建过 BVH"""
+        return bool(self._bvhs)
+
+    @property
+    def nbytes(self):
+        """估算占用的内存（缓冲、记忆的结果和 BVH）"""
+        total = self.positions.nbytes + self.tris.nbytes + self.tri_polys.nbytes
+        total += sum(getattr(buffer, 'nbytes', 0) for buffer in self.buffers.values())
+        total += sum(getattr(result, 'nbytes', 0) for result in self.results.values())
+        total += len(self._bvhs) * len(self.tris) * BVH_BYTES_PER_TRI
+        return total
+
+
+def geometry_key(obj):
+    """
+    几何分组键
+    没有修改器且不在编辑模式的对象，评估几何只取决于网格数据本身，
+    共享网格数据的对象（关联复制）使用同一个键；其余对象各自独立。
+    """
+    if obj.mode != 'EDIT' and len(obj.modifiers) == 0:
+        return ('MESH', obj.data.as_pointer())
+    return ('OBJECT', obj.as_pointer())
+
+
+# 网格缓冲读取
+#################################################
+
+
+def _read_edges(me):
+    edges = np.empty(len(me.edges) * 2, dtype=np.int32)
+    me.edges.foreach_get("vertices", edges)
+    return edges.reshape(-1, 2)
+
+
+def _read_poly_normals(me):
+    normals = np.empty(len(me.polygons) * 3, dtype=np.float32)
+    me.polygons.foreach_get("normal", normals)
+    return normals.reshape(-1, 3)
+
+
+def _read_poly_centers(me):
+    centers = np.empty(len(me.polygons) * 3, dtype=np.float32)
+    me.polygons.foreach_get("center", centers)
+    return centers.reshape(-1, 3)
+
+
+def _read_poly_loop_starts(me):
+    starts = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_start", starts)
+    return starts
+
+
+def _read_poly_loop_totals(me):
+    totals = np.empty(len(me.polygons), dtype=np.int32)
+    me.polygons.foreach_get("loop_total", totals)
+    return totals
+
+
+def _read_loop_edges(me):
+    loop_edges = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("edge_index", loop_edges)
+    return loop_edges
+
+
+def _read_loop_verts(me):
+    loop_verts = np.empty(len(me.loops), dtype=np.int32)
+    me.loops.foreach_get("vertex_index", loop_verts)
+    return loop_verts
+
+
+def _read_tri_loops(me):
+    tri_loops = np.empty(len(me.loop_triangles) * 3, dtype=np.int32)
+    me.loop_triangles.foreach_get("loops", tri_loops)
+    return tri_loops.reshape(-1, 3)
+
+
+def _read_uvs(me):
+    """活动 UV 层的每环 UV 坐标，没有 UV 层时返回空数组"""
+    layer = me.uv_layers.active
+    if layer is None:
+        return np.empty((0, 2), dtype=np.float32)
+    uvs = np.empty(len(me.loops) * 2, dtype=np.float32)
+    layer.data.foreach_get("uv", uvs)
+    return uvs.reshape(-1, 2)
+
+
+# 需要从网格读取的缓冲
+MESH_BUFFERS = {
+    'edges': _read_edges,                    # (边数, 2) int32
+    'poly_normals': _read_poly_normals,      # (面数, 3) float32
+    'poly_centers': _read_poly_centers,      # (面数, 3) float32
+    'poly_loop_starts': _read_poly_loop_starts,
+    'poly_loop_totals': _read_poly_loop_totals,
+    'loop_verts': _read_loop_verts,          # (环数,) int32
+    'loop_edges': _read_loop_edges,          # (环数,) int32
+    'tri_loops': _read_tri_loops,            # (三角形数, 3) int32，三角形的环索引
+    'uvs': _read_uvs,                        # (环数, 2) float32
+}
+
+
+def _derive_loop_polys(geometry):
+    """每个环所属的面索引（面的环在环数组中连续存放）"""
+    starts = geometry.get_buffer('poly_loop_starts')
+    totals = geometry.get_buffer('poly_loop_totals')
+    order = np.argsort(starts, kind='stable')
+    return np.repeat(order, totals[order]).astype(np.int32)
+
+
+# 由其他缓冲计算得到的缓冲（首次访问时计算）
+DERIVED_BUFFERS = {
+    'loop_polys': _derive_loop_polys,
+}
+
+# 派生缓冲依赖的网格缓冲
+DERIVED_DEPENDENCIES = {
+    'loop_polys': ('poly_loop_starts', 'poly_loop_totals'),
+}
+
+
+def expand_buffers(names):
+    """把缓冲名称展开为需要从网格读取的缓冲（去重，保持顺序）"""
+    expanded = []
+    for name in names:
+        for raw in DERIVED_DEPENDENCIES.get(name, (name,)):
+            if raw in MESH_BUFFERS and raw not in expanded:
+                expanded.append(raw)
+    return expanded
+
+
+def read_buffers(geometry, me, names):
+    """从网格读取缺失的缓冲"""
+    for name in geometry.missing_buffers(names):
+        geometry.buffers[name] = MESH_BUFFERS[name](me)
+
+
+@contextmanager
+def evaluated_mesh(obj, depsgraph=None):
+    """临时获取对象的评估网格（含修改器和动画），退出时释放"""
+    with profiling.span('depsgraph', obj):
+        if depsgraph is None:
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+        obj_eval = obj.evaluated_get(depsgraph)
+    with profiling.span('to_mesh', obj):
+        me = obj_eval.to_mesh()
+    try:
+        yield me
+    finally:
+        obj_eval.to_mesh_clear()
+
+
+def extract_geometry(obj, key=None, depsgraph=None, buffers=()):
+    """从对象的评估网格提取局部空间几何缓冲"""
+    if key is None:
+        key = geometry_key(obj)
+
+    with evaluated_mesh(obj, depsgraph) as me:
+        with profiling.span('extract', obj):
+            return geometry_from_mesh(key, me, buffers)
+
+
+def geometry_from_mesh(key, me, buffers=()):
+    """从网格数据（评估后）读取顶点和三角形缓冲，以及 buffers 中请求的其他缓冲"""
+    me.calc_loop_triangles()
+    positions = np.empty(len(me.vertices) * 3, dtype=np.float32)
+    me.vertices.foreach_get("co", positions)
+    tri_count = len(me.loop_triangles)
+    tris = np.empty(tri_count * 3, dtype=np.int32)
+    me.loop_triangles.foreach_get("vertices", tris)
+    tri_polys = np.empty(tri_count, dtype=np.int32)
+    me.loop_triangles.foreach_get("polygon_index", tri_polys)
+    geometry = MeshGeometry(key, positions.reshape(-1, 3), tris.reshape(-1, 3), tri_polys, len(me.polygons))
+    read_buffers(geometry, me, buffers)
+    return geometry
+
+
+class GeometryCache:
+    """
+    单次检测内的几何缓存，按几何分组键保存唯一网格
+    设置了内存上限（流式检测）时按最近使用顺序淘汰几何，淘汰的几何再次需要时重新提取；
+    调用方仍持有引用的几何在引用释放后才真正回收，因此同时使用的一批几何要固定（pin）在缓存中，
+    避免被淘汰后又重复提取。
+    """
+
+    def __init__(self, max_bytes=0):
+        self.geometries = OrderedDict()
+        self.pair_results = {}   # 对象对相交结果 {(对象1指针, 对象2指针, 阈值, 面数上限): (面1, 面2)}
+        self.pair_triangles = {}  # 完整检测的相交三角形对，供接触线复用 {(几何1, 矩阵1, 几何2, 矩阵2, 阈值): (k, 2)}
+        self.depsgraph = None
+        self.max_bytes = max_bytes   # 0 表示不限制
+        self.evictions = 0
+        self._sizes = {}             # 各几何最近一次估算的内存
+        self._total = 0
+        self._pinned = None          # 固定中的几何键（None 表示未在固定）
+
+    @property
+    def streaming(self):
+        """是否限制了缓存内存（流式检测）"""
+        return self.max_bytes > 0
+
+    def _measure(self, key):
+        """重新估算一份几何的内存"""
+        size = self.geometries[key].nbytes
+        self._total += size - self._sizes.get(key, 0)
+        self._sizes[key] = size
+
+    def _touch(self, key):
+        """标记几何为最近使用"""
+        if self.streaming:
+            self.geometries.move_to_end(key)
+            self._measure(key)
+
+    def _evict(self):
+        """淘汰最久未使用的几何，直到缓存估算内存不超过上限（至少保留最近使用的一份）"""
+        if not self.streaming:
+            return
+        for key in list(islice(reversed(self.geometries), EVICT_REFRESH)):
+            self._measure(key)
+        for key in list(self.geometries):
+            if self._total <= self.max_bytes or len(self.geometries) <= 1:
+                break
+            if self._pinned is not None and key in self._pinned:
+                continue
+            del self.geometries[key]
+            self._total -= self._sizes.pop(key, 0)
+            self.evictions += 1
+
+    def _pin(self, key):
+        if self._pinned is not None:
+            self._pinned.add(key)
+
+    def begin_pinning(self):
+        """开始固定：之后获取的几何在 release_pinned / end_pinning 之前不会被淘汰"""
+        if self.streaming:
+            self._pinned = set()
+
+    def release_pinned(self):
+        """释放已固定的几何（继续固定之后获取的几何），并按上限淘汰"""
+        if self._pinned is not None:
+            self._pinned.clear()
+            self._evict()
+
+    def end_pinning(self):
+        """结束固定并按上限淘汰"""
+        self._pinned = None
+        self._evict()
+
+    @property
+    def pinned_over_budget(self):
+        """固定的几何（含即将为其构建的 BVH）估算内存是否已超过上限"""
+        if not self._pinned:
+            return False
+        total = 0
+        for key in self._pinned:
+            geometry = self.geometries[key]
+            total += geometry.nbytes
+            if not geometry.has_bvh:
+                total += len(geometry.tris) * BVH_BYTES_PER_TRI
+        return total > self.max_bytes
+
+    def get(self, obj, buffers=()):
+        """
+        获取对象的几何（同组对象共享同一份）
+
+        Args:
+            buffers: 除基础缓冲外还需要的网格缓冲名称，已读取过的不会重复读取
+        """
+        key = geometry_key(obj)
+        geometry = self.geometries.get(key)
+        if self.depsgraph is None:
+            self.depsgraph = bpy.context.evaluated_depsgraph_get()
+        if geometry is None:
+            geometry = extract_geometry(obj, key, self.depsgraph, buffers)
+            self.geometries[key] = geometry
+            self._pin(key)
+            self._evict()
+        else:
+            self._pin(key)
+            self._touch(key)
+            if geometry.missing_buffers(buffers):
+                with evaluated_mesh(obj, self.depsgraph) as me:
+                    with profiling.span('extract', obj):
+                        read_buffers(geometry, me, buffers)
+        return geometry
+
+    def get_instanced(self, instance_object, buffers=()):
+        """
+        获取实例几何（depsgraph.object_instances 中的实例对象）
+        同一份实例几何（集合实例的源对象或几何节点实例引用的网格）只提取一次，
+        必须在遍历 object_instances 期间调用。
+        """
+        me = instance_object.data
+        key = ('INSTANCE', me.as_pointer())
+        geometry = self.geometries.get(key)
+        if geometry is None:
+            with profiling.span('extract', instance_object):
+                geometry = geometry_from_mesh(key, me, buffers)
+            self.geometries[key] = geometry
+            self._pin(key)
+            self._evict()
+        else:
+            self._pin(key)
+            self._touch(key)
+            if geometry.missing_buffers(buffers):
+                with profiling.span('extract', instance_object):
+                    read_buffers(geometry, me, buffers)
+        return geometry
+
+    def group_objects(self, objects):
+        """
+        按几何分组
+
+        Returns:
+            dict: {几何分组键: [对象]}
+        """
+        groups = {}
+        for obj in objects:
+            groups.setdefault(geometry_key(obj), []).append(obj)
+        return groups
+
+
+def begin_session(max_bytes=0):
+    """
+    开始检测会话，期间提取的几何和 BVH 会被复用
+
+    Args:
+        max_bytes: 大于 0 时为流式检测，几何缓存的估算内存不超过该值
+    """
+    global _session_cache
+    _session_cache = GeometryCache(max_bytes)
+
+
+def is_streaming():
+    """当前会话是否为流式检测"""
+    return _session_cache is not None and _session_cache.streaming
+
+
+@contextmanager
+def pinned_geometries():
+    """
+    流式检测中固定期间获取的几何（一批对象对同时使用），结束后再按上限淘汰
+    固定的几何超过上限时调用方应先处理手头的一批并调用 release_pinned_geometries
+
+    Yields:
+        GeometryCache: 当前会话缓存，不在会话中时为 None
+    """
+    cache = _session_cache
+    if cache is None:
+        yield None
+        return
+    cache.begin_pinning()
+    try:
+        yield cache
+    finally:
+        cache.end_pinning()
+
+
+def evaluated_world_bounds(objects, depsgraph=None):
+    """
+    对象评估后的世界空间包围盒（读取 bound_box，不提取网格）
+
+    Returns:
+        tuple: (bounds_min, bounds_max) 各为 (n, 3) float64
+    """
+    if depsgraph is None:
+        depsgraph = bpy.context.evaluated_depsgraph_get()
+    bounds_min = np.empty((len(objects), 3), dtype=np.float64)
+    bounds_max = np.empty((len(objects), 3), dtype=np.float64)
+    for i, obj in enumerate(objects):
+        m = np.array(obj.matrix_world, dtype=np.float64)
+        corners = np.array(obj.evaluated_get(depsgraph).bound_box, dtype=np.float64) @ m[:3, :3].T + m[:3, 3]
+        bounds_min[i] = corners.min(axis=0)
+        bounds_max[i] = corners.max(axis=0)
+    return bounds_min, bounds_max
+
+
+def spatial_order(objects, depsgraph=None):
+    """
+    按空间位置排序对象（包围盒中心的 Morton 顺序），相邻对象在空间上也相邻，
+    流式检测按此顺序处理时对象对的两侧几何大多仍在缓存中
+    """
+    from . import broad_phase
+
+    if len(objects) < 2:
+        return list(objects)
+    bounds_min, bounds_max = evaluated_world_bounds(objects, depsgraph)
+    order = broad_phase.morton_order((bounds_min + bounds_max) * 0.5)
+    return [objects[i] for i in order]
+
+
+def end_session():
+    """结束检测会话并释放缓存的几何"""
+    global _session_cache
+    _session_cache = None
+
+
+def get_geometry(obj, buffers=()):
+    """获取对象的局部空间几何（会话中复用缓存）"""
+    if _session_cache is not None:
+        return _session_cache.get(obj, buffers)
+    return extract_geometry(obj, buffers=buffers)
+
+
+def get_pair_result(obj1, obj2, epsilon, max_faces=0):
+    """
+    获取本次会话中已计算过的对象对相交结果（任意顺序），没有时返回 None
+    max_faces 大于 0 时也可以使用完整结果（截取前 max_faces 个面）
+    """
+    if _session_cache is None:
+        return None
+    for limit in ((0, max_faces) if max_faces > 0 else (0,)):
+        result = _session_cache.pair_results.get((obj1.as_pointer(), obj2.as_pointer(), epsilon, limit))
+        if result is None:
+            result = _session_cache.pair_results.get((obj2.as_pointer(), obj1.as_pointer(), epsilon, limit))
+            if result is not None:
+                result = (result[1], result[0])
+        if result is not None:
+            return _first_faces(result[0], max_faces), _first_faces(result[1], max_faces)
+    return None
+
+
+def store_pair_result(obj1, obj2, epsilon, faces1, faces2, max_faces=0):
+    """记录对象对相交结果（同一次检测中对象间检测和包含检测共用，部分结果按 max_faces 单独记录）"""
+    if _session_cache is not None:
+        _session_cache.pair_results[(obj1.as_pointer(), obj2.as_pointer(), epsilon, max_faces)] = (faces1, faces2)
+
+
+def _pair_triangles_key(geometry1, matrix1, geometry2, matrix2, epsilon):
+    return (
+        geometry1.key, np.asarray(matrix1, dtype=np.float64).tobytes(),
+        geometry2.key, np.asarray(matrix2, dtype=np.float64).tobytes(),
+        epsilon,
+    )
+
+
+def get_pair_triangles(geometry1, matrix1, geometry2, matrix2, epsilon):
+    """
+    获取本次会话中完整检测得到的相交三角形对（任意顺序），没有时返回 None
+
+    Returns:
+        np.ndarray: (k, 2) int32，每行 (geometry1 的三角形, geometry2 的三角形)
+    """
+    if _session_cache is None:
+        return None
+    pairs = _session_cache.pair_triangles.get(_pair_triangles_key(geometry1, matrix1, geometry2, matrix2, epsilon))
+    if pairs is not None:
+        return pairs
+    pairs = _session_cache.pair_triangles.get(_pair_triangles_key(geometry2, matrix2, geometry1, matrix1, epsilon))
+    return pairs[:, ::-1] if pairs is not None else None
+
+
+def store_pair_triangles(geometry1, matrix1, geometry2, matrix2, epsilon, pairs):
+    """记录完整检测得到的相交三角形对（计算接触线时不再重复重叠查询）"""
+    if _session_cache is not None:
+        _session_cache.pair_triangles[_pair_triangles_key(geometry1, matrix1, geometry2, matrix2, epsilon)] = pairs
+
+
+def get_session_cache():
+    """获取当前会话的几何缓存（不在会话中时返回一个临时缓存）"""
+    if _session_cache is not None:
+        return _session_cache
+    return GeometryCache()
+
+
+# 相交检测
+#################################################
+
+
+def _first_faces(faces, max_faces):
+    """限定数量模式下截取前 max_faces 个面（0 表示不限制）"""
+    return faces[:max_faces] if 0 < max_faces < len(faces) else faces
+
+
+def _unique_faces(tri_polys, tri_indices):
+    """三角形索引 -> 去重排序后的面索引"""
+    if len(tri_indices) == 0:
+        return EMPTY_FACES
+    return np.unique(tri_polys[tri_indices])
+
+
+def self_overlap_pairs(geometry, epsilon):
+    """
+    自相交的三角形对（局部空间 BVH 自重叠查询，已排除同一个面三角化出的三角形）
+
+    Returns:
+        np.ndarray: (k, 2) int32 三角形索引
+    """
+    tree = geometry.get_bvh(epsilon)
+    with profiling.span('overlap'):
+        overlap = tree.overlap(tree)
+    if not overlap:
+        return EMPTY_TRI_PAIRS
+
+    pairs = np.array(overlap, dtype=np.int32)
+    polys = geometry.tri_polys[pairs]
+    # 同一个面三角化出的三角形之间不算相交
+    return pairs[polys[:, 0] != polys[:, 1]]
+
+
+def local_epsilon(matrix, epsilon):
+    """
+    世界空间精度换算到 matrix 的局部空间（除以最大轴向缩放，任意方向上的世界容差都不超过 epsilon）
+    没有缩放时原样返回，与自相交等局部空间检测共用同一棵 BVH
+    """
+    scale = np.linalg.norm(np.array(matrix, dtype=np.float64)[:3, :3], axis=0).max()
+    if scale <= 0.0 or abs(scale - 1.0) <= 1e-9:
+        return epsilon
+    return epsilon / scale
+
+
+def pair_overlap(geometry1, matrix1, geometry2, matrix2, epsilon):
+    """
+    两份几何在各自世界矩阵下相交的三角形对
+    将三角形较少的一侧变换到另一侧的局部空间，与其缓存的局部 BVH 做重叠查询。
+    epsilon 为世界空间精度，查询前按该局部空间的缩放换算（见 local_epsilon）。
+
+    Returns:
+        np.ndarray: (k, 2) int32，每行 (geometry1 的三角形, geometry2 的三角形)
+    """
+    if len(geometry1.tris) == 0 or len(geometry2.tris) == 0:
+        return EMPTY_TRI_PAIRS
+
+    swap = len(geometry2.tris) > len(geometry1.tris)
+    if swap:
+        geometry1, matrix1, geometry2, matrix2 = geometry2, matrix2, geometry1, matrix1
+
+    # geometry2 局部空间 -> geometry1 局部空间
+    relative = matrix1.inverted_safe() @ matrix2
+    epsilon = local_epsilon(matrix1, epsilon)
+    with profiling.span('transform'):
+        positions = geometry2.transformed_positions(relative)
+
+    pairs = _full_pair_overlap(geometry1, geometry2, positions, epsilon)
+    if len(pairs) == 0:
+        return EMPTY_TRI_PAIRS
+    return pairs[:, ::-1].copy() if swap else pairs
+
+
+def _full_pair_overlap(geometry1, geometry2, positions, epsilon):
+    """geometry2（已变换到 geometry1 局部空间）整体构建 BVH 与 geometry1 做一次重叠查询"""
+    with profiling.span('bvh_build'):
+        query_tree = BVHTree.FromPolygons(
+            positions.tolist(), geometry2.tris.tolist(), all_triangles=True, epsilon=epsilon
+        )
+
+    tree = geometry1.get_bvh(epsilon)
+    with profiling.span('overlap'):
+        overlap = tree.overlap(query_tree)
+    if not overlap:
+        return EMPTY_TRI_PAIRS
+    return np.array(overlap, dtype=np.int32)
+
+
+def self_intersect_faces(geometry, epsilon, max_faces=0):
+    """
+    自相交检测（在局部空间进行，与对象变换无关，同一网格只计算一次）
+
+    Args:
+        max_faces: 大于 0 时只返回前 max_faces 个相交面（1 即通过 / 不通过判定）。
+            BVHTree.overlap 无法中途停止，分批查询在没有相交的网格上反而更慢（每批都要单独构建 BVH），
+            所以总是做一次完整的自重叠查询，完整结果照常记忆和写入磁盘缓存，之后的完整检测可以直接复用
+
+    Returns:
+        np.ndarray: 排序后的相交面索引 (int32)
+    """
+    memo_key = ('SELF', epsilon)
+    faces = geometry.results.get(memo_key)
+    if faces is not None:
+        return _first_faces(faces, max_faces)
+
+    cache_key = None
+    if result_cache.is_enabled():
+        cache_key = result_cache.make_key('SELF', [geometry.digest], (), (epsilon,))
+        cached = result_cache.load(cache_key)
+        if cached is not None:
+            geometry.results[memo_key] = cached[0]
+            return _first_faces(cached[0], max_faces)
+
+    pairs = self_overlap_pairs(geometry, epsilon)
+    with profiling.span('convert'):
+        faces = np.unique(geometry.tri_polys[pairs]).astype(np.int32) if len(pairs) else EMPTY_FACES
+
+    geometry.results[memo_key] = faces
+    # 三角形对留给接触线计算
+    geometry.results[('SELF_PAIRS', epsilon)] = pairs
+    if cache_key is not None:
+        result_cache.store(cache_key, [faces])
+    return _first_faces(faces, max_faces)
+
+
+def pair_intersect(geometry1, matrix1, geometry2, matrix2, epsilon, max_faces=0):
+    """
+    两份几何在各自世界矩阵下的相交检测（见 pair_overlap），不写入会话记忆（可在工作进程中执行）
+
+    Args:
+        max_faces: 大于 0 时每一侧最多返回 max_faces 个相交面（重叠查询总是完整进行，见 self_intersect_faces）
+
+    Returns:
+        tuple: (geometry1 的相交面, geometry2 的相交面, 完整的相交三角形对 (k, 2))
+    """
+    pairs = pair_overlap(geometry1, matrix1, geometry2, matrix2, epsilon)
+    if len(pairs) == 0:
+        return EMPTY_FACES, EMPTY_FACES, EMPTY_TRI_PAIRS
+
+    with profiling.span('convert'):
+        faces1 = _unique_faces(geometry1.tri_polys, pairs[:, 0])
+        faces2 = _unique_faces(geometry2.tri_polys, pairs[:, 1])
+    return _first_faces(faces1, max_faces), _first_faces(faces2, max_faces), pairs
+
+
+def pair_intersect_faces(geometry1, matrix1, geometry2, matrix2, epsilon, max_faces=0):
+    """
+    两份几何在各自世界矩阵下的相交检测，三角形对记入会话供接触线复用
+
+    Returns:
+        tuple: (geometry1 的相交面, geometry2 的相交面)
+    """
+    faces1, faces2, pairs = pair_intersect(geometry1, matrix1, geometry2, matrix2, epsilon, max_faces)
+    store_pair_triangles(geometry1, matrix1, geometry2, matrix2, epsilon, pairs)
+    return faces1, faces2
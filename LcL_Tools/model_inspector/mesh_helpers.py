@@ -4,22 +4,21 @@
 包含相交检测和扭曲检测功能
 """
 
+from collections import Counter
+
 import bmesh
 import bpy
-import gpu
-from gpu_extras.batch import batch_for_shader
 from mathutils.geometry import tessellate_polygon as tessellate
-import array
-import mathutils
+import numpy as np
+from . import broad_phase
+from . import contact
+from . import profiling
+from . import result_cache
+from . import mesh_cache
+from . import check_engine
 
-# GPU 着色器兼容性处理
-if not bpy.app.background:
-    if bpy.app.version >= (3, 4, 0):
-        single_color_shader = gpu.shader.from_builtin('UNIFORM_COLOR')
-    else:
-        single_color_shader = gpu.shader.from_builtin('3D_UNIFORM_COLOR')
-else:
-    single_color_shader = None
+# GPU 着色器（首次构建批次或绘制时才创建，后台模式和从未显示过叠加层时不加载 gpu 模块）
+_shaders = {}
 
 # 全局变量
 _inspection_data = []  # 重命名为更通用的检测数据
@@ -27,46 +26,511 @@ _draw_handler = None
 _is_display_enabled = False
 HAS_INSPECTION_DATA = False
 
+# 实例相交报告 [{'item1', 'item2', 'faces1', 'faces2'}]
+_instance_report = []
+
+# 被完全包埋在其他对象内部的对象 [{'inner': 名称, 'outer': 名称}]
+_buried_report = []
+
+# 相交接触线 [(m, 2, 3) float32 世界空间线段]，叠加层合并为一个线段批次绘制
+_contact_segments = []
+_contact_batch = None  # (检测数据版本号, GPUBatch)
+
+# 上一次检测的结果快照 {(对象名称, 检测类型, 序号): (排序后的面索引, 数值, 内容版本号, 缓存的叠加层批次)}
+# 清空检测数据时保存，重新加入结果时逐项比较：结果不变的项沿用原批次，变化的项用 np.setdiff1d 找出新增问题面
+_previous_results = {}
+
+_has_previous_results = False
+
+# 本次检测中每个 (对象名称, 检测类型) 已加入的结果项数，用于生成结果项比较键
+_result_counts = Counter()
+
+# 检测结果内容版本号（每个结果项一个，结果不变时沿用上一次的版本号）
+_content_version = 0
+
+# 检测数据版本号：检测数据每次变化时递增，UI 统计快照据此判断是否需要重建
+_inspection_generation = 0
+_stats_snapshot = None
+_stats_snapshot_generation = -1
+
+# 最近一次绘制的剔除统计 {'culled': 视锥体外的结果数, 'omitted': 因面数上限未绘制的面数}
+_overlay_draw_stats = {'culled': 0, 'omitted': 0}
+
+# 叠加层批次缓存 {id(检测数据): (缓存键, 对象名称, 批次)}
+# 检测数据、显示模式或颜色参数变化时按缓存键重建，对象几何（包括编辑模式下的编辑）或变换变化时由 depsgraph 回调清除，
+# 视口旋转等不改变网格的重绘直接复用批次
+_overlay_batches = {}
+
 # 默认颜色
 COLOR_INTERSECT_FACE = (0.96, 0.25, 0.006, 0.6)  # 相交面：红色半透明
 COLOR_INTERSECT_EDGE = (1.0, 0.5, 0.0, 0.8)      # 相交边：橙色
 COLOR_DISTORTION_FACE = (0.97, 0.26, 0.28, 0.6)  # 扭曲面：粉红色半透明
 COLOR_LINE_OUTLINE = (0.0, 0.0, 0.0, 0.3)        # 轮廓线：黑色
 
+# 检测类型显示名称
+INSPECTION_TYPE_LABELS = {
+    'INTERSECT': "相交",
+    'DISTORTION': "扭曲",
+    'NON_MANIFOLD': "非流形",
+    'ZERO_AREA': "零面积",
+    'DUPLICATE_VERTS': "重复顶点",
+    'UV_OVERLAP': "UV重叠",
+    'THIN_WALL': "过薄",
+    'CLEARANCE': "间隙不足",
+}
+
+# 带数值的检测结果（如间隙距离）在叠加层中分档着色的档数
+VALUE_COLOR_BANDS = 4
+
+# 热力图色带 [(位置, RGB)]：严重程度 0（刚超过阈值）-> 1（最严重）
+HEATMAP_RAMP = (
+    (0.0, (0.1, 0.35, 1.0)),
+    (0.35, (0.1, 0.9, 0.45)),
+    (0.7, (1.0, 0.85, 0.1)),
+    (1.0, (1.0, 0.1, 0.05)),
+)
+
+# 支持热力图显示的检测类型（结果带每个面的标量）
+HEATMAP_TYPES = {'DISTORTION', 'THIN_WALL', 'CLEARANCE'}
+
+# 拓扑检测类型 -> (显示开关属性, 颜色属性)
+TOPOLOGY_DISPLAY = {
+    'NON_MANIFOLD': ('check_non_manifold', 'non_manifold_color'),
+    'ZERO_AREA': ('check_zero_area', 'zero_area_color'),
+    'DUPLICATE_VERTS': ('check_duplicate_verts', 'duplicate_verts_color'),
+}
+
+
+def _get_shader(kind='UNIFORM'):
+    """
+    获取内置着色器（首次调用时创建并缓存，兼容 3.4 之前的着色器名称）
+
+    Args:
+        kind: 'UNIFORM' 单色 / 'SMOOTH' 顶点颜色
+    """
+    shader = _shaders.get(kind)
+    if shader is None:
+        import gpu
+        name = f"{kind}_COLOR" if bpy.app.version >= (3, 4, 0) else f"3D_{kind}_COLOR"
+        shader = _shaders[kind] = gpu.shader.from_builtin(name)
+    return shader
+
+
+def _create_batch(draw_type, content, kind='UNIFORM'):
+    """用指定着色器创建批次"""
+    from gpu_extras.batch import batch_for_shader
+    return batch_for_shader(_get_shader(kind), draw_type, content)
+
 
 def draw_poly(points, rgba):
     """绘制多边形面"""
     if len(points) < 3:
         return
-    batch = batch_for_shader(single_color_shader, "TRIS", {"pos": points})
-    single_color_shader.bind()
-    single_color_shader.uniform_float("color", rgba)
-    batch.draw(single_color_shader)
+    draw_batch(batch_from_points(points, "TRIS"), rgba)
 
 
 def draw_points(points, rgba):
     """绘制点"""
     if len(points) == 0:
         return
-    batch = batch_for_shader(single_color_shader, "POINTS", {"pos": points})
-    single_color_shader.bind()
-    single_color_shader.uniform_float("color", rgba)
-    batch.draw(single_color_shader)
+    draw_batch(batch_from_points(points, "POINTS"), rgba)
 
 
 def draw_line(points, rgba):
     """绘制线条"""
     if len(points) < 2:
         return
-    batch = batch_for_shader(single_color_shader, "LINES", {"pos": points})
-    single_color_shader.bind()
-    single_color_shader.uniform_float("color", rgba)
-    batch.draw(single_color_shader)
+    draw_batch(batch_from_points(points, "LINES"), rgba)
 
 
 def batch_from_points(points, draw_type):
     """从点创建批次"""
-    return batch_for_shader(single_color_shader, draw_type, {"pos": points})
+    return _create_batch(draw_type, {"pos": points})
+
+
+def collect_overlay_geometry(bm, face_indices, matrix_world):
+    """
+    收集问题面的世界空间三角形顶点和轮廓边顶点
+    
+    Returns:
+        tuple: (face_vertices, edge_vertices)
+    """
+    bm.faces.ensure_lookup_table()
+    
+    # Collect face vertices and edge vertices
+    face_vertices = []
+    edge_vertices = []
+    
+    for face_idx in face_indices:
+        if face_idx < len(bm.faces):
+            face = bm.faces[face_idx]
+            
+            # Get face vertices (apply world transform)
+            verts = [matrix_world @ v.co for v in face.verts]
+            
+            # Handle face rendering
+            if len(verts) == 3:
+                # Triangle direct draw
+                face_vertices.extend([v.to_3d() for v in verts])
+            elif len(verts) >= 4:
+                # Polygon needs triangulation
+                # Use tessellate for triangulation
+                tessellated = tessellate([verts])
+                
+                for tri_indices in tessellated:
+                    triangle = [verts[i] for i in tri_indices]
+                    face_vertices.extend([v.to_3d() for v in triangle])
+            
+            # Collect edge vertices for outline
+            for edge in face.edges:
+                if edge.is_valid:
+                    edge_verts = [matrix_world @ v.co for v in edge.verts]
+                    edge_vertices.extend([v.to_3d() for v in edge_verts])
+    
+    return face_vertices, edge_vertices
+
+
+def get_color_groups(inspect_info, face_color, edge_color, props):
+    """
+    按颜色分组问题面
+    带数值的结果（间隙距离）按数值分档，从近处颜色渐变到远处颜色；其余结果使用单一颜色
+    
+    Returns:
+        list[tuple]: [(面索引, 面颜色, 边颜色)]
+    """
+    values = inspect_info.get('values')
+    face_indices = inspect_info['faces']
+    if values is None or inspect_info.get('inspection_type') != 'CLEARANCE':
+        return [(face_indices, face_color, edge_color)]
+    
+    near = np.array(props.clearance_color, dtype=np.float64)
+    far = np.array(props.clearance_far_color, dtype=np.float64)
+    faces = np.asarray(face_indices)
+    limit = max(props.clearance_distance, 1e-12)
+    bands = np.minimum((values / limit * VALUE_COLOR_BANDS).astype(np.int32), VALUE_COLOR_BANDS - 1)
+    
+    groups = []
+    for band in range(VALUE_COLOR_BANDS):
+        band_faces = faces[bands == band]
+        if len(band_faces) == 0:
+            continue
+        t = band / max(VALUE_COLOR_BANDS - 1, 1)
+        color = tuple(near + (far - near) * t)
+        groups.append((band_faces.tolist(), color, color))
+    return groups
+
+
+def get_severity(inspect_type, values, props):
+    """
+    问题面标量 -> 严重程度 [0, 1]
+    间隙和壁厚越小越严重，扭曲角越大越严重；没有标量定义的检测类型返回 None
+    """
+    values = np.asarray(values, dtype=np.float64)
+    if inspect_type == 'CLEARANCE':
+        severity = 1.0 - values / max(props.clearance_distance, 1e-12)
+    elif inspect_type == 'THIN_WALL':
+        severity = 1.0 - values / max(props.min_thickness, 1e-12)
+    elif inspect_type == 'DISTORTION':
+        threshold = props.distortion_angle
+        severity = (values - threshold) / max(np.pi / 2 - threshold, 1e-6)
+    else:
+        return None
+    return np.clip(np.nan_to_num(severity, nan=1.0), 0.0, 1.0)
+
+
+def ramp_colors(severity, alpha):
+    """严重程度 -> 热力图色带颜色 (n, 4) float32"""
+    positions = [stop[0] for stop in HEATMAP_RAMP]
+    colors = np.empty((len(severity), 4), dtype=np.float32)
+    for channel in range(3):
+        colors[:, channel] = np.interp(severity, positions, [stop[1][channel] for stop in HEATMAP_RAMP])
+    colors[:, 3] = alpha
+    return colors
+
+
+def _overlay_key(inspect_info, props, *colors):
+    """叠加层批次缓存键：检测数据版本、显示模式和影响颜色的参数"""
+    return (
+        inspect_info['version'],
+        props.overlay_mode,
+        inspect_info['inspection_type'],
+        len(inspect_info['faces']),
+        props.heatmap_alpha,
+        props.clearance_distance,
+        tuple(props.clearance_far_color),
+        props.min_thickness,
+        props.distortion_angle,
+    ) + colors
+
+
+def build_heatmap_batch(obj, inspect_info, props):
+    """
+    构建单个检测结果的热力图批次（一次顶点颜色绘制）
+    直接从评估网格的 NumPy 快照取三角形，按面严重程度着色，不经过 bmesh
+
+    Returns:
+        GPUBatch or None: 没有可绘制的三角形时返回 None
+    """
+    severity = get_severity(inspect_info['inspection_type'], inspect_info['values'], props)
+    if severity is None:
+        return None
+    
+    geometry = mesh_cache.extract_geometry(obj)
+    faces = np.asarray(inspect_info['faces'], dtype=np.int32)
+    valid = faces < geometry.poly_count
+    face_severity = np.zeros(geometry.poly_count, dtype=np.float64)
+    face_severity[faces[valid]] = severity[valid]
+    
+    tri_mask = np.isin(geometry.tri_polys, faces[valid])
+    if not tri_mask.any():
+        return None
+    positions = geometry.transformed_positions(obj.matrix_world)
+    tri_positions = positions[geometry.tris[tri_mask].ravel()].astype(np.float32)
+    tri_colors = ramp_colors(face_severity[geometry.tri_polys[tri_mask]], props.heatmap_alpha)
+    return _create_batch(
+        'TRIS', {"pos": tri_positions, "color": np.repeat(tri_colors, 3, axis=0)}, kind='SMOOTH'
+    )
+
+
+def build_flag_batches(obj, inspect_info, face_color, edge_color, props):
+    """
+    构建单个检测结果的标记批次（按颜色分组，每组一个面批次和一个轮廓边批次）
+    编辑模式下的活动对象直接读取编辑网格，其余对象使用评估网格（与检测一致）
+
+    Returns:
+        list[tuple]: [(面批次, 边批次, 面颜色, 边颜色)]，没有顶点的批次为 None
+    """
+    is_edit_object = bpy.context.mode == 'EDIT_MESH' and obj == bpy.context.active_object
+    if is_edit_object:
+        bm = bmesh.from_edit_mesh(obj.data)
+    else:
+        bm = bmesh_copy_from_object(obj, transform=False, triangulate=False, apply_modifiers=True)
+    
+    batches = []
+    try:
+        for faces, group_face_color, group_edge_color in get_color_groups(inspect_info, face_color, edge_color, props):
+            face_vertices, edge_vertices = collect_overlay_geometry(bm, faces, obj.matrix_world)
+            batches.append((
+                batch_from_points(face_vertices, 'TRIS') if len(face_vertices) >= 3 else None,
+                batch_from_points(edge_vertices, 'LINES') if len(edge_vertices) >= 2 else None,
+                group_face_color,
+                group_edge_color,
+            ))
+    finally:
+        if not is_edit_object:
+            bm.free()
+    return batches
+
+
+def _get_cached_batches(obj, inspect_info, key, stage, build):
+    """获取缓存的叠加层批次，缓存键变化或被 depsgraph 回调清除后调用 build() 重建"""
+    cached = _overlay_batches.get(id(inspect_info))
+    if cached is not None and cached[0] == key:
+        return cached[2]
+    
+    with profiling.span(stage, obj):
+        batches = build()
+    _overlay_batches[id(inspect_info)] = (key, obj.name, batches)
+    return batches
+
+
+def get_heatmap_batch(obj, inspect_info, props):
+    """获取缓存的热力图批次"""
+    return _get_cached_batches(
+        obj, inspect_info, _overlay_key(inspect_info, props), 'heatmap_build',
+        lambda: build_heatmap_batch(obj, inspect_info, props)
+    )
+
+
+def get_flag_batches(obj, inspect_info, face_color, edge_color, props):
+    """获取缓存的标记批次（进入或退出编辑模式时数据来源不同，需要重建）"""
+    is_edit_object = bpy.context.mode == 'EDIT_MESH' and obj == bpy.context.active_object
+    return _get_cached_batches(
+        obj, inspect_info, _overlay_key(inspect_info, props, face_color, edge_color, is_edit_object), 'overlay_build',
+        lambda: build_flag_batches(obj, inspect_info, face_color, edge_color, props)
+    )
+
+
+def get_world_tris_batch(obj, inspect_info, face_color, props):
+    """获取缓存的实例结果批次（预先计算的世界空间三角形）"""
+    world_tris = inspect_info['world_tris']
+    return _get_cached_batches(
+        obj, inspect_info, _overlay_key(inspect_info, props, face_color), 'overlay_build',
+        lambda: batch_from_points(world_tris, 'TRIS') if len(world_tris) >= 3 else None
+    )
+
+
+def draw_batch(batch, rgba):
+    """用单色着色器绘制已构建的批次"""
+    shader = _get_shader()
+    shader.bind()
+    shader.uniform_float("color", rgba)
+    batch.draw(shader)
+
+
+def invalidate_overlay(object_names=None):
+    """清除叠加层批次缓存（object_names 为空时全部清除）"""
+    if object_names is None:
+        _overlay_batches.clear()
+        return
+    for entry_id in [k for k, cached in _overlay_batches.items() if cached[1] in object_names]:
+        del _overlay_batches[entry_id]
+
+
+@bpy.app.handlers.persistent
+def overlay_depsgraph_handler(scene, depsgraph):
+    """对象几何或变换变化时清除对应的叠加层批次（编辑模式下编辑网格也会触发几何更新）"""
+    if not _overlay_batches:
+        return
+    changed = {
+        update.id.original.name for update in depsgraph.updates
+        if isinstance(update.id, bpy.types.Object) and (update.is_updated_geometry or update.is_updated_transform)
+    }
+    if changed:
+        invalidate_overlay(changed)
+
+
+@bpy.app.handlers.persistent
+def overlay_frame_change_handler(scene, depsgraph=None):
+    """帧变化时清除被动画改变的对象的叠加层批次（拿不到 depsgraph 时全部清除）"""
+    if not _overlay_batches:
+        return
+    if depsgraph is None:
+        invalidate_overlay()
+        return
+    overlay_depsgraph_handler(scene, depsgraph)
+
+
+def _set_overlay_handlers(enabled):
+    """
+    添加或移除叠加层缓存失效回调
+    按函数名匹配：重载插件后回调是新的函数对象，旧模块留下的同名回调也要一并替换 / 移除
+    """
+    for handlers, handler in (
+        (bpy.app.handlers.depsgraph_update_post, overlay_depsgraph_handler),
+        (bpy.app.handlers.frame_change_post, overlay_frame_change_handler),
+    ):
+        for existing in [h for h in handlers if getattr(h, '__name__', None) == handler.__name__]:
+            handlers.remove(existing)
+        if enabled:
+            handlers.append(handler)
+
+
+def get_view_projection():
+    """当前视口的投影矩阵（世界空间 -> 裁剪空间），不在 3D 视口中绘制时返回 None"""
+    region_data = bpy.context.region_data
+    if region_data is None:
+        return None
+    return np.array(region_data.perspective_matrix, dtype=np.float64)
+
+
+def bounds_outside_view(bounds_min, bounds_max, view_projection):
+    """
+    世界空间包围盒是否完全在视锥体外
+    8 个角点变换到裁剪空间后，全部位于同一裁剪平面外侧即可剔除（保守判定，不会误剔可见物体）
+    """
+    corners = np.array([
+        [x, y, z, 1.0]
+        for x in (bounds_min[0], bounds_max[0])
+        for y in (bounds_min[1], bounds_max[1])
+        for z in (bounds_min[2], bounds_max[2])
+    ], dtype=np.float64)
+    clip = corners @ view_projection.T
+    w = clip[:, 3:4]
+    outside = np.concatenate((clip[:, :3] < -w, clip[:, :3] > w), axis=1)
+    return bool(outside.all(axis=0).any())
+
+
+def get_entry_world_bounds(inspect_info, obj):
+    """检测结果的世界空间包围盒：实例结果取预先计算的三角形范围，其余取对象包围盒"""
+    world_tris = inspect_info.get('world_tris')
+    if world_tris is not None:
+        bounds = inspect_info.get('world_bounds')
+        if bounds is None:
+            tris = np.asarray(world_tris, dtype=np.float64).reshape(-1, 3)
+            bounds = (tris.min(axis=0), tris.max(axis=0)) if len(tris) else (np.zeros(3), np.zeros(3))
+            inspect_info['world_bounds'] = bounds
+        return bounds
+    corners = np.array(obj.bound_box, dtype=np.float64)
+    return broad_phase.transform_bounds(corners.min(axis=0), corners.max(axis=0), obj.matrix_world)
+
+
+def limit_overlay_entry(inspect_info, budget, props):
+    """
+    将检测结果裁剪到 budget 个面（按检测数据版本和严重程度参数缓存）
+    带标量的结果保留最严重的面，其余结果保留前 budget 个面
+    """
+    faces = inspect_info['faces']
+    if len(faces) <= budget:
+        return inspect_info
+    
+    key = (inspect_info['version'], budget, props.clearance_distance, props.min_thickness, props.distortion_angle)
+    cached = inspect_info.get('limited')
+    if cached is not None and cached[0] == key:
+        return cached[1]
+    
+    faces = np.asarray(faces, dtype=np.int32)
+    values = inspect_info.get('values')
+    severity = None
+    if values is not None:
+        severity = get_severity(inspect_info['inspection_type'], values, props)
+    if severity is not None:
+        keep = np.sort(np.argsort(-severity, kind='stable')[:budget])
+    else:
+        keep = np.arange(budget)
+    
+    limited = {
+        'object': inspect_info['object'],
+        'faces': faces[keep].tolist(),
+        'inspection_type': inspect_info['inspection_type'],
+        'version': inspect_info['version'],
+    }
+    if values is not None:
+        limited['values'] = values[keep]
+    world_tris = inspect_info.get('world_tris')
+    if world_tris is not None:
+        # 实例结果按三角形比例截取
+        tri_budget = len(world_tris) // 3 * budget // len(faces)
+        limited['world_tris'] = world_tris[:tri_budget * 3]
+    inspect_info['limited'] = (key, limited)
+    return limited
+
+
+def get_contact_batch():
+    """获取缓存的接触线批次（检测数据变化后重建）"""
+    global _contact_batch
+    if _contact_batch is None or _contact_batch[0] != _inspection_generation:
+        segments = get_contact_segments()
+        batch = batch_from_points(segments.reshape(-1, 3), 'LINES') if len(segments) else None
+        _contact_batch = (_inspection_generation, batch)
+    return _contact_batch[1]
+
+
+def get_new_faces_entry(inspect_info):
+    """新增问题面的显示项（与原结果项共享对象和内容版本，缓存在原结果项中）"""
+    new_faces = inspect_info.get('new_faces')
+    if new_faces is None or len(new_faces) == 0:
+        return None
+    new_entry = inspect_info.get('new_entry')
+    if new_entry is None:
+        new_entry = {
+            'object': inspect_info['object'],
+            'faces': new_faces.tolist(),
+            'inspection_type': inspect_info['inspection_type'],
+            'version': inspect_info['version'],
+        }
+        inspect_info['new_entry'] = new_entry
+    return new_entry
+
+
+def get_new_problem_count():
+    """与上一次检测相比新增的问题面数"""
+    return sum(len(data.get('new_faces', ())) for data in _inspection_data)
+
+
+def get_overlay_draw_stats():
+    """获取最近一次叠加层绘制的剔除统计"""
+    return _overlay_draw_stats
 
 
 def draw_callback():
@@ -74,11 +538,18 @@ def draw_callback():
     if not _is_display_enabled or not _inspection_data:
         return
     
+    import gpu
+    
     # Set GPU state
     gpu.state.blend_set('ALPHA')
     gpu.state.depth_test_set('LESS_EQUAL')
     
     props = bpy.context.scene.model_inspector
+    heatmap = props.overlay_mode == 'HEATMAP'
+    view_projection = get_view_projection() if props.overlay_frustum_cull else None
+    highlight_new = props.highlight_new_problems and props.auto_update
+    total_faces = sum(len(data['faces']) for data in _inspection_data)
+    draw_stats = {'culled': 0, 'omitted': 0}
     
     # Draw all inspection object data
     for inspect_info in _inspection_data[:]:  # Use slice copy to avoid issues during iteration
@@ -92,12 +563,17 @@ def draw_callback():
         except ReferenceError:
             # Object was deleted, remove from list
             _inspection_data.remove(inspect_info)
+            mark_inspection_changed()
             continue
         
+        # 实例检测结果已预先计算世界空间三角形，实例化者不一定是网格对象
+        world_tris = inspect_info.get('world_tris')
+        
         # Check if object still exists and is valid
-        if not obj or not hasattr(obj, 'type') or obj.type != 'MESH':
+        if not obj or not hasattr(obj, 'type') or (obj.type != 'MESH' and world_tris is None):
             # Remove invalid object data from list
             _inspection_data.remove(inspect_info)
+            mark_inspection_changed()
             continue
         
         # Additional safety check - ensure object is still in scene
@@ -106,109 +582,141 @@ def draw_callback():
             scene_objects = bpy.context.scene.objects
             if obj.name not in scene_objects:
                 _inspection_data.remove(inspect_info)
+                mark_inspection_changed()
                 continue
         except ReferenceError:
             # Object reference is invalid
             _inspection_data.remove(inspect_info)
+            mark_inspection_changed()
             continue
             
         face_indices = inspect_info['faces']
         inspect_type = inspect_info.get('inspection_type', 'INTERSECT')
         
         # 根据检测功能开关状态过滤显示
-        if inspect_type == 'INTERSECT' and not props.check_intersection:
+        if inspect_type == 'INTERSECT' and (not props.check_intersection or props.intersect_display == 'LINES'):
             continue
         if inspect_type == 'DISTORTION' and not props.check_distortion:
             continue
+        if inspect_type == 'UV_OVERLAP' and not props.check_uv_overlap:
+            continue
+        if inspect_type == 'THIN_WALL' and not props.check_thickness:
+            continue
+        if inspect_type == 'CLEARANCE' and not props.check_clearance:
+            continue
+        if inspect_type in TOPOLOGY_DISPLAY:
+            toggle_prop, color_prop = TOPOLOGY_DISPLAY[inspect_type]
+            if not props.check_topology or not getattr(props, toggle_prop):
+                continue
+        
+        # 视锥体剔除：包围盒完全在视野外的结果不提交
+        if view_projection is not None and bounds_outside_view(
+                *get_entry_world_bounds(inspect_info, obj), view_projection):
+            draw_stats['culled'] += 1
+            continue
+        
+        source_info = inspect_info
+        
+        # 面数上限：按结果大小分配配额，超出时只绘制最严重的面
+        if props.overlay_face_limit > 0 and total_faces > props.overlay_face_limit:
+            budget = max(1, props.overlay_face_limit * len(face_indices) // total_faces)
+            inspect_info = limit_overlay_entry(inspect_info, budget, props)
+            draw_stats['omitted'] += len(face_indices) - len(inspect_info['faces'])
+            face_indices = inspect_info['faces']
+            world_tris = inspect_info.get('world_tris')
         
         # 根据检测类型选择颜色
-        if inspect_type == 'DISTORTION':
+        if inspect_type in TOPOLOGY_DISPLAY:
+            face_color = tuple(getattr(props, TOPOLOGY_DISPLAY[inspect_type][1]))
+            edge_color = face_color
+        elif inspect_type == 'UV_OVERLAP':
+            face_color = tuple(props.uv_overlap_color)
+            edge_color = face_color
+        elif inspect_type == 'THIN_WALL':
+            face_color = tuple(props.thickness_color)
+            edge_color = face_color
+        elif inspect_type == 'CLEARANCE':
+            face_color = tuple(props.clearance_color)
+            edge_color = face_color
+        elif inspect_type == 'DISTORTION':
             face_color = tuple(props.distortion_face_color)
             edge_color = tuple(props.distortion_face_color)  # 扭曲检测使用同样的颜色
         else:  # INTERSECT
             face_color = tuple(props.intersect_face_color)
             edge_color = tuple(props.intersect_edge_color)
         
-        # Get current frame mesh data (consistent with detection)
-        if bpy.context.mode == 'EDIT_MESH' and obj == bpy.context.active_object:
-            bm = bmesh.from_edit_mesh(obj.data)
-            use_world_transform = True
-            matrix_world = obj.matrix_world
-        else:
-            # Use evaluated mesh data for drawing
-            bm = bmesh_copy_from_object(obj, transform=False, triangulate=False, apply_modifiers=True)
-            use_world_transform = True
-            matrix_world = obj.matrix_world
-            
-        bm.faces.ensure_lookup_table()
-        
-        # Collect face vertices and edge vertices
-        face_vertices = []
-        edge_vertices = []
-        
-        for face_idx in face_indices:
-            if face_idx < len(bm.faces):
-                face = bm.faces[face_idx]
-                
-                # Get face vertices (apply world transform)
-                if use_world_transform:
-                    verts = [matrix_world @ v.co for v in face.verts]
-                else:
-                    verts = [v.co for v in face.verts]
-                
-                # Handle face rendering
-                if len(verts) == 3:
-                    # Triangle direct draw
-                    face_vertices.extend([v.to_3d() for v in verts])
-                elif len(verts) >= 4:
-                    # Polygon needs triangulation
-                    # Use tessellate for triangulation
-                    tessellated = tessellate([verts])
-                    
-                    for tri_indices in tessellated:
-                        triangle = [verts[i] for i in tri_indices]
-                        face_vertices.extend([v.to_3d() for v in triangle])
-                
-                # Collect edge vertices for outline
-                for edge in face.edges:
-                    if edge.is_valid:
-                        if use_world_transform:
-                            edge_verts = [matrix_world @ v.co for v in edge.verts]
-                        else:
-                            edge_verts = [v.co for v in edge.verts]
-                        edge_vertices.extend([v.to_3d() for v in edge_verts])
+        if world_tris is not None:
+            batch = get_world_tris_batch(obj, inspect_info, face_color, props)
+            if batch is not None:
+                draw_batch(batch, face_color)
+            continue
         
-        # Draw faces
-        if face_vertices:
-            draw_poly(face_vertices, face_color)
+        # 热力图模式：带标量的结果使用缓存的顶点颜色批次，一次绘制
+        if heatmap and inspect_type in HEATMAP_TYPES and 'values' in inspect_info:
+            batch = get_heatmap_batch(obj, inspect_info, props)
+            if batch is not None:
+                batch.draw(_get_shader('SMOOTH'))
         
-        # Draw edges
-        if edge_vertices:
-            draw_line(edge_vertices, edge_color)
+        # 标记模式：批次只在网格或检测数据变化后重建，视口旋转时直接复用
+        if not heatmap or inspect_type not in HEATMAP_TYPES or 'values' not in inspect_info:
+            for face_batch, edge_batch, group_face_color, group_edge_color in get_flag_batches(
+                    obj, inspect_info, face_color, edge_color, props):
+                if face_batch is not None:
+                    draw_batch(face_batch, group_face_color)
+                if edge_batch is not None:
+                    draw_batch(edge_batch, group_edge_color)
         
-        # Clean up resources
-        if bpy.context.mode != 'EDIT_MESH' or obj != bpy.context.active_object:
-            bm.free()
+        # 播放时高亮上一帧没有的问题面
+        if highlight_new:
+            new_entry = get_new_faces_entry(source_info)
+            if new_entry is not None:
+                new_color = tuple(props.new_problem_color)
+                for face_batch, edge_batch, _, _ in get_flag_batches(obj, new_entry, new_color, new_color, props):
+                    if face_batch is not None:
+                        draw_batch(face_batch, new_color)
+                    if edge_batch is not None:
+                        draw_batch(edge_batch, new_color)
+    
+    _overlay_draw_stats.update(draw_stats)
+    
+    # 相交接触线（穿过其他表面时也显示）
+    if props.check_intersection and props.intersect_display != 'FACES' and _contact_segments:
+        batch = get_contact_batch()
+        if batch is not None:
+            gpu.state.depth_test_set('NONE')
+            gpu.state.line_width_set(props.contact_line_width)
+            draw_batch(batch, tuple(props.contact_line_color))
+            gpu.state.line_width_set(1.0)
     
     # Restore GPU state
     gpu.state.blend_set('NONE')
     gpu.state.depth_test_set('LESS_EQUAL')
 
 
+def tag_redraw_view3d():
+    """刷新所有 3D 视口（后台模式下没有界面，直接跳过）"""
+    screen = bpy.context.screen
+    if screen is None:
+        return
+    for area in screen.areas:
+        if area.type == 'VIEW_3D':
+            area.tag_redraw()
+
+
 def enable_display():
     """启用相交颜色显示"""
     global _draw_handler, _is_display_enabled
     
-    if _draw_handler is None and single_color_shader is not None:
+    # 后台模式没有视口，不注册绘制回调
+    if _draw_handler is None and not bpy.app.background:
         _draw_handler = bpy.types.SpaceView3D.draw_handler_add(
             draw_callback, (), 'WINDOW', 'POST_VIEW'
         )
         _is_display_enabled = True
+        _set_overlay_handlers(True)
         
         # 刷新视口
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        tag_redraw_view3d()
 
 
 def disable_display():
@@ -219,11 +727,11 @@ def disable_display():
         bpy.types.SpaceView3D.draw_handler_remove(_draw_handler, 'WINDOW')
         _draw_handler = None
         _is_display_enabled = False
+        _set_overlay_handlers(False)
+        invalidate_overlay()
         
         # 刷新视口
-        for area in bpy.context.screen.areas:
-            if area.type == 'VIEW_3D':
-                area.tag_redraw()
+        tag_redraw_view3d()
 
 
 def toggle_display():
@@ -234,25 +742,94 @@ def toggle_display():
         enable_display()
 
 
+def mark_inspection_changed():
+    """标记检测数据已变化，使缓存的统计快照失效"""
+    global _inspection_generation
+    _inspection_generation += 1
+
+
+def get_inspection_generation():
+    """获取检测数据版本号"""
+    return _inspection_generation
+
+
+def _snapshot_results():
+    """保存当前检测结果和可复用的叠加层批次，供下一次检测比较"""
+    global _has_previous_results
+    _previous_results.clear()
+    _has_previous_results = True
+    for data in _inspection_data:
+        cached = None if 'world_tris' in data else _overlay_batches.get(id(data))
+        _previous_results[data['result_key']] = (data['sorted_faces'], data.get('values'), data['version'], cached)
+
+
 def clear_inspection_data():
-    """清空检测数据"""
+    """清空检测数据（保留结果快照，下一次检测据此比较变化）"""
     global _inspection_data
+    _snapshot_results()
     _inspection_data.clear()
+    _result_counts.clear()
+    _instance_report.clear()
+    _buried_report.clear()
+    _contact_segments.clear()
+    invalidate_overlay()
+    mark_inspection_changed()
     
     # 刷新视口
-    for area in bpy.context.screen.areas:
-        if area.type == 'VIEW_3D':
-            area.tag_redraw()
+    tag_redraw_view3d()
 
 
-def add_inspection_data(obj, face_indices, inspection_type="INTERSECT"):
-    """添加检测数据"""
-    global _inspection_data
-    _inspection_data.append({
+def add_inspection_data(obj, face_indices, inspection_type="INTERSECT", world_tris=None, values=None):
+    """
+    添加检测数据
+    
+    Args:
+        world_tris: 可选，预先计算的世界空间三角形顶点（实例检测结果无法从对象网格重建）
+        values: 可选，与 face_indices 一一对应的数值（如间隙距离），float32 数组
+    """
+    global _inspection_data, _content_version
+    # 结果项比较键 (对象名称, 检测类型, 同一对象同一类型中的序号)，加入时记录，对象之后被删除也能比较
+    base = (obj.name, inspection_type)
+    result_key = base + (_result_counts[base],)
+    _result_counts[base] += 1
+    data = {
         'object': obj,
+        'object_name': obj.name,
+        'result_key': result_key,
         'faces': face_indices,
-        'inspection_type': inspection_type
-    })
+        'inspection_type': inspection_type,
+        'sorted_faces': np.unique(np.asarray(face_indices, dtype=np.int32)),
+    }
+    if world_tris is not None:
+        data['world_tris'] = world_tris
+    if values is not None:
+        data['values'] = np.asarray(values, dtype=np.float32)
+    _inspection_data.append(data)
+    
+    # 与上一次检测的同一结果项比较
+    previous = _previous_results.pop(result_key, None)
+    if previous is None:
+        _content_version += 1
+        data['version'] = _content_version
+        if _has_previous_results:
+            # 上一次检测没有该结果项，全部为新增
+            data['new_faces'] = data['sorted_faces']
+    else:
+        previous_faces, previous_values, previous_version, cached = previous
+        unchanged = np.array_equal(previous_faces, data['sorted_faces']) and (
+            (values is None and previous_values is None) or
+            (values is not None and previous_values is not None and np.array_equal(previous_values, data['values']))
+        )
+        if unchanged:
+            # 结果不变：沿用版本号和已构建的批次
+            data['version'] = previous_version
+            if cached is not None:
+                _overlay_batches[id(data)] = cached
+        else:
+            _content_version += 1
+            data['version'] = _content_version
+        data['new_faces'] = np.setdiff1d(data['sorted_faces'], previous_faces, assume_unique=True)
+    mark_inspection_changed()
 
 
 # 兼容旧函数名
@@ -269,27 +846,33 @@ def bmesh_copy_from_object(obj, transform=True, triangulate=False, apply_modifie
     
     if apply_modifiers:
         # 强制获取当前帧的评估网格（包括骨骼动画、修改器等）
-        depsgraph = bpy.context.evaluated_depsgraph_get()
-        obj_eval = obj.evaluated_get(depsgraph)
-        me = obj_eval.to_mesh()
-        bm = bmesh.new()
-        bm.from_mesh(me)
+        with profiling.span('depsgraph', obj):
+            depsgraph = bpy.context.evaluated_depsgraph_get()
+            obj_eval = obj.evaluated_get(depsgraph)
+        with profiling.span('to_mesh', obj):
+            me = obj_eval.to_mesh()
+        with profiling.span('bmesh_build', obj):
+            bm = bmesh.new()
+            bm.from_mesh(me)
         obj_eval.to_mesh_clear()
     else:
         me = obj.data
-        if obj.mode == 'EDIT':
-            bm_orig = bmesh.from_edit_mesh(me)
-            bm = bm_orig.copy()
-        else:
-            bm = bmesh.new()
-            bm.from_mesh(me)
+        with profiling.span('bmesh_build', obj):
+            if obj.mode == 'EDIT':
+                bm_orig = bmesh.from_edit_mesh(me)
+                bm = bm_orig.copy()
+            else:
+                bm = bmesh.new()
+                bm.from_mesh(me)
     
     # 注意：当apply_modifiers=True时，评估网格已经包含了世界变换
     # 所以不需要再应用matrix_world
     if transform and not apply_modifiers:
-        bm.transform(obj.matrix_world)
+        with profiling.span('transform', obj):
+            bm.transform(obj.matrix_world)
     if triangulate:
-        bmesh.ops.triangulate(bm, faces=bm.faces)
+        with profiling.span('triangulate', obj):
+            bmesh.ops.triangulate(bm, faces=bm.faces)
     
     return bm
 
@@ -311,81 +894,500 @@ def bmesh_from_object(obj):
     return bm
 
 
-def bmesh_check_self_intersect_object(obj, threshold=0.00001):
+def merge_face_arrays(face_arrays):
+    """
+    合并多组面索引并去重（多个检测项或对象对的相交面合并时不会重复计数）
+
+    Returns:
+        np.ndarray: 排序后的面索引 (int32)
+    """
+    face_arrays = [faces for faces in face_arrays if len(faces)]
+    if not face_arrays:
+        return mesh_cache.EMPTY_FACES
+    if len(face_arrays) == 1:
+        return np.asarray(face_arrays[0], dtype=np.int32)
+    return np.unique(np.concatenate(face_arrays)).astype(np.int32, copy=False)
+
+
+def bmesh_check_self_intersect_object(obj, threshold=0.00001, max_faces=0):
     """
     检查对象的自相交
     从 check_toolbox 移植并优化的核心功能，支持动画模型
+    在局部空间检测，共享同一网格数据的对象（关联复制）在同一次检测中只计算一次
     
     Args:
         obj: Blender 对象
         threshold: BVH 树的精度阈值
+        max_faces: 大于 0 时最多报告该数量的相交面（1 即只判断是否存在相交）
     
     Returns:
-        array.array: 相交面的索引数组
+        np.ndarray: 排序后的相交面索引 (int32)
     """
     if not obj.data.polygons:
-        return array.array('i', ())
-    
-    # 获取当前帧的评估后网格数据（支持动画和修改器）
-    bm = bmesh_copy_from_object(obj, transform=False, triangulate=False, apply_modifiers=True)
-    
-    # 手动应用世界变换
-    bm.transform(obj.matrix_world)
-    
-    # 创建 BVH 树进行相交检测
-    tree = mathutils.bvhtree.BVHTree.FromBMesh(bm, epsilon=threshold)
+        return mesh_cache.EMPTY_FACES
     
-    # 检测重叠的面
-    overlap = tree.overlap(tree)
+    # 获取当前帧的评估后几何（支持动画和修改器，同组对象共享）
+    geometry = mesh_cache.get_geometry(obj)
     
-    # 提取相交的面索引
-    faces_error = {i for i_pair in overlap for i in i_pair}
+    with profiling.span('self_intersect', obj):
+        faces = mesh_cache.self_intersect_faces(geometry, threshold, max_faces)
     
-    bm.free()
-    return array.array('i', faces_error)
+    return faces
 
 
-def check_object_intersections(obj1, obj2, threshold=0.00001):
+def check_object_intersections(obj1, obj2, threshold=0.00001, max_faces=0):
     """
     检查两个对象间的相交，支持动画模型
     
     Args:
         obj1, obj2: 要检查的两个对象
         threshold: BVH 树的精度阈值
+        max_faces: 大于 0 时每一侧最多报告该数量的相交面，截取后的结果不写入磁盘缓存
     
     Returns:
-        tuple: (obj1_faces, obj2_faces) 相交面的索引数组
+        tuple: (obj1_faces, obj2_faces) 排序后的相交面索引 (int32)
     """
     if not (obj1.data.polygons and obj2.data.polygons):
-        return array.array('i', ()), array.array('i', ())
+        return mesh_cache.EMPTY_FACES, mesh_cache.EMPTY_FACES
     
-    # 获取两个对象的 bmesh（支持动画和修改器）
-    # 对于对象间检测，需要在各自的世界坐标系中处理
-    bm1 = bmesh_copy_from_object(obj1, transform=False, triangulate=False, apply_modifiers=True)
-    bm2 = bmesh_copy_from_object(obj2, transform=False, triangulate=False, apply_modifiers=True)
+    # 同一次检测中每对对象只计算一次（双向检测、包含检测都会再次用到）
+    memo = mesh_cache.get_pair_result(obj1, obj2, threshold, max_faces)
+    if memo is not None:
+        return memo
     
-    # 手动应用世界变换（因为评估网格不包含世界变换）
-    bm1.transform(obj1.matrix_world)
-    bm2.transform(obj2.matrix_world)
+    geometry1 = mesh_cache.get_geometry(obj1)
+    geometry2 = mesh_cache.get_geometry(obj2)
     
-    # 创建 BVH 树
-    tree1 = mathutils.bvhtree.BVHTree.FromBMesh(bm1, epsilon=threshold)
-    tree2 = mathutils.bvhtree.BVHTree.FromBMesh(bm2, epsilon=threshold)
+    # 优先从磁盘缓存读取
+    cache_key, cached = _load_cached_pair(obj1, obj2, geometry1, geometry2, threshold, max_faces)
+    if cached is not None:
+        return cached
     
-    # 检测重叠
-    overlap = tree1.overlap(tree2)
+    # 在较大一侧的局部空间中检测，复用其缓存的 BVH
+    with profiling.span('pair_intersect', obj1):
+        faces1, faces2 = mesh_cache.pair_intersect_faces(
+            geometry1, obj1.matrix_world, geometry2, obj2.matrix_world, threshold, max_faces
+        )
     
-    # 分别提取两个对象的相交面
-    obj1_faces = {pair[0] for pair in overlap}
-    obj2_faces = {pair[1] for pair in overlap}
+    _store_pair(obj1, obj2, threshold, max_faces, cache_key, faces1, faces2)
+    return faces1, faces2
+
+
+def _load_cached_pair(obj1, obj2, geometry1, geometry2, threshold, max_faces):
+    """
+    从磁盘缓存读取对象对相交结果（命中时写入会话记忆）
+
+    Returns:
+        tuple: (缓存键，未启用缓存时为 None, 结果，未命中时为 None)
+    """
+    if not result_cache.is_enabled():
+        return None, None
+    cache_key = result_cache.make_key(
+        'PAIR',
+        [geometry1.digest, geometry2.digest],
+        [obj1.matrix_world, obj2.matrix_world],
+        (threshold,)
+    )
+    cached = result_cache.load(cache_key)
+    if cached is None:
+        return cache_key, None
+    mesh_cache.store_pair_result(obj1, obj2, threshold, cached[0], cached[1])
+    return cache_key, mesh_cache.get_pair_result(obj1, obj2, threshold, max_faces)
+
+
+def _store_pair(obj1, obj2, threshold, max_faces, cache_key, faces1, faces2):
+    """记录对象对相交结果到会话记忆，完整结果同时写入磁盘缓存"""
+    mesh_cache.store_pair_result(obj1, obj2, threshold, faces1, faces2, max_faces)
+    if cache_key is not None and max_faces <= 0:
+        result_cache.store(cache_key, [faces1, faces2])
+
+
+def check_all_object_intersections(objects, threshold=0.00001, max_faces=0, workers=1):
+    """
+    批量检测一组对象两两之间的相交，结果写入会话记忆（随后的 check_object_intersections 直接读取），
+    需要在检测会话中调用。只检测包围盒重叠的对象对，窄相位可以并行执行（见 pair_batch）。
+    流式检测会话中只读取包围盒做粗筛，对象对按空间顺序分批处理，几何在处理到时才提取并按缓存上限淘汰。
+    
+    Args:
+        workers: 窄相位并行数，1 为逐对串行执行
+    
+    Returns:
+        list[tuple]: [(obj1, obj2, obj1_faces, obj2_faces)] 有相交的对象对
+    """
+    meshes = [obj for obj in objects if obj.type == 'MESH' and obj.data.polygons]
+    if len(meshes) < 2:
+        return []
+    streaming = mesh_cache.is_streaming()
     
-    bm1.free()
-    bm2.free()
+    with profiling.span('broad_phase'):
+        if streaming:
+            bounds_min, bounds_max = mesh_cache.evaluated_world_bounds(meshes)
+        else:
+            bounds = [
+                broad_phase.transform_bounds(*mesh_cache.get_geometry(obj).local_bounds, obj.matrix_world)
+                for obj in meshes
+            ]
+            bounds_min, bounds_max = [b[0] for b in bounds], [b[1] for b in bounds]
+        candidates = [
+            (int(i), int(j)) for i, j in broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=threshold)
+        ]
     
-    return array.array('i', obj1_faces), array.array('i', obj2_faces)
+    pending = [
+        (i, j) for i, j in candidates
+        if mesh_cache.get_pair_result(meshes[i], meshes[j], threshold, max_faces) is None
+    ]
+    if streaming:
+        pending = _spatial_pair_order(pending, bounds_min, bounds_max)
+    _intersect_object_pairs(meshes, pending, threshold, max_faces, workers)
+    
+    results = []
+    for i, j in candidates:
+        faces1, faces2 = mesh_cache.get_pair_result(meshes[i], meshes[j], threshold, max_faces)
+        if len(faces1) or len(faces2):
+            results.append((meshes[i], meshes[j], faces1, faces2))
+    return results
+
 
+def _spatial_pair_order(pairs, bounds_min, bounds_max):
+    """按对象的空间顺序（包围盒中心的 Morton 顺序）排列对象对，相邻的对象对共用缓存中的几何"""
+    centers = (np.asarray(bounds_min) + np.asarray(bounds_max)) * 0.5
+    rank = np.empty(len(centers), dtype=np.int64)
+    rank[broad_phase.morton_order(centers)] = np.arange(len(centers))
+    return sorted(pairs, key=lambda pair: (rank[pair[0]], rank[pair[1]]))
 
-def bmesh_check_intersect_objects(target_obj, other_objects, threshold=0.00001):
+
+def _pinned_pair_batches(pairs, fetch):
+    """
+    分批获取对象对的几何：fetch(i, j) 获取一对对象的几何并返回之后处理需要的数据
+    流式检测中一批用到的几何固定在缓存中，批内对象对达到 STREAM_PAIR_CHUNK
+    或固定的几何超过缓存上限时交给调用方处理这一批，处理完再释放固定，
+    因此批内不会淘汰后又重复提取，批外的几何按缓存上限淘汰。非流式检测时只有一批
+    
+    Yields:
+        list[tuple]: [(i, j, fetch 的返回值)]
+    """
+    with mesh_cache.pinned_geometries() as cache:
+        streaming = cache is not None and cache.streaming
+        batch = []
+        for i, j in pairs:
+            batch.append((i, j, fetch(i, j)))
+            if streaming and (len(batch) >= mesh_cache.STREAM_PAIR_CHUNK or cache.pinned_over_budget):
+                yield batch
+                batch = []
+                cache.release_pinned()
+        if batch:
+            yield batch
+
+
+def _intersect_object_pairs(meshes, pairs, threshold, max_faces, workers):
+    """
+    检测一组对象对（先读磁盘缓存，其余批量执行窄相位），结果写入会话记忆
+    流式检测中分批执行（见 _pinned_pair_batches）
+    """
+    from . import pair_batch
+    
+    def fetch(i, j):
+        obj1, obj2 = meshes[i], meshes[j]
+        geometry1 = mesh_cache.get_geometry(obj1)
+        geometry2 = mesh_cache.get_geometry(obj2)
+        cache_key, cached = _load_cached_pair(obj1, obj2, geometry1, geometry2, threshold, max_faces)
+        if cached is not None:
+            return None
+        return (geometry1, obj1.matrix_world, geometry2, obj2.matrix_world), cache_key
+    
+    for batch in _pinned_pair_batches(pairs, fetch):
+        pending = [(meshes[i], meshes[j], task) for i, j, task in batch if task is not None]
+        if not pending:
+            continue
+        with profiling.span('pair_intersect'):
+            pair_faces = pair_batch.pair_intersect_batch(
+                [task for _, _, (task, _) in pending], threshold, max_faces, workers
+            )
+        for (obj1, obj2, (_, cache_key)), (faces1, faces2) in zip(pending, pair_faces):
+            _store_pair(obj1, obj2, threshold, max_faces, cache_key, faces1, faces2)
+
+
+def _face_world_bounds(obj, faces):
+    """对象指定面的世界空间包围盒"""
+    geometry = mesh_cache.get_geometry(obj)
+    verts = np.unique(geometry.tris[np.isin(geometry.tri_polys, faces)])
+    m = np.array(obj.matrix_world, dtype=np.float64)
+    points = geometry.positions[verts].astype(np.float64) @ m[:3, :3].T + m[:3, 3]
+    return points.min(axis=0), points.max(axis=0)
+
+
+def collect_pair_report(pair_results):
+    """
+    根据 check_all_object_intersections 的结果生成对象间相交表（只包含两侧都有相交面的对象对）
+    重叠区域取两侧相交面包围盒的交集（交集为空时取并集）；限定数量模式下面数和区域只反映报告的部分
+
+    Returns:
+        list[dict]: [{'object1', 'object2', 'faces1', 'faces2', 'bounds_min', 'bounds_max'}]，按相交面数降序
+    """
+    rows = []
+    for obj1, obj2, faces1, faces2 in pair_results:
+        if len(faces1) == 0 or len(faces2) == 0:
+            continue
+        min1, max1 = _face_world_bounds(obj1, faces1)
+        min2, max2 = _face_world_bounds(obj2, faces2)
+        bounds_min, bounds_max = np.maximum(min1, min2), np.minimum(max1, max2)
+        if np.any(bounds_min > bounds_max):
+            bounds_min, bounds_max = np.minimum(min1, min2), np.maximum(max1, max2)
+        rows.append({
+            'object1': obj1.name,
+            'object2': obj2.name,
+            'faces1': len(faces1),
+            'faces2': len(faces2),
+            'bounds_min': tuple(bounds_min),
+            'bounds_max': tuple(bounds_max),
+        })
+    rows.sort(key=lambda row: row['faces1'] + row['faces2'], reverse=True)
+    return rows
+
+
+def check_instance_intersections(context, selected_objects, threshold=0.00001, contacts=False, max_faces=0,
+                                 workers=1):
+    """
+    检测选中对象产生的实例（几何节点 / 集合实例）之间以及实例与对象之间的相交，
+    结果写入检测数据和实例相交报告
+    
+    Args:
+        contacts: 是否同时计算相交对象对的接触线
+        max_faces: 大于 0 时每个对象对每一侧最多报告该数量的相交面
+        workers: 窄相位并行数（见 pair_batch）
+    
+    Returns:
+        int: 相交面总数
+    """
+    from . import instances
+    
+    items, results, buried = instances.inspect_instances(context, selected_objects, threshold, max_faces, workers)
+    _add_buried_report(items, buried)
+    
+    # 同一实例可能与多个对象相交，先合并去重再写入检测数据
+    item_faces = {}
+    for i, j, faces1, faces2 in results:
+        item_faces.setdefault(i, []).append(faces1)
+        item_faces.setdefault(j, []).append(faces2)
+        if contacts:
+            item1, item2 = items[i], items[j]
+            add_contact_segments(contact.pair_contact_segments(
+                item1.geometry, item1.matrix, item2.geometry, item2.matrix, threshold
+            ))
+        _instance_report.append({
+            'item1': items[i].label,
+            'item2': items[j].label,
+            'faces1': len(faces1),
+            'faces2': len(faces2),
+        })
+    
+    total_faces = 0
+    for index, face_arrays in item_faces.items():
+        item = items[index]
+        faces = merge_face_arrays(face_arrays)
+        if len(faces) == 0:
+            continue
+        total_faces += len(faces)
+        world_tris = instances.world_triangles(item.geometry, item.matrix, faces)
+        add_inspection_data(item.owner, faces, "INTERSECT", world_tris=world_tris)
+    
+    return total_faces
+
+
+def add_contact_segments(segments):
+    """添加世界空间接触线段 (m, 2, 3)"""
+    if len(segments) == 0:
+        return
+    _contact_segments.append(segments)
+    mark_inspection_changed()
+
+
+def get_contact_segments():
+    """
+    获取全部接触线段
+
+    Returns:
+        np.ndarray: (m, 2, 3) float32 世界空间线段
+    """
+    if not _contact_segments:
+        return contact.EMPTY_SEGMENTS
+    return np.concatenate(_contact_segments)
+
+
+def get_contact_segment_count():
+    """获取接触线段数"""
+    return sum(len(segments) for segments in _contact_segments)
+
+
+def collect_contact_segments(objects, threshold=0.00001, self_check=True, pair_check=True):
+    """
+    计算对象自相交和对象间相交的接触线（需要在检测会话中调用，复用会话中的几何和相交结果）
+    只处理已检测出相交的对象和对象对
+
+    Returns:
+        int: 接触线段数
+    """
+    meshes = [obj for obj in objects if obj.type == 'MESH' and obj.data.polygons]
+    count = 0
+    with profiling.span('contact'):
+        if self_check:
+            for obj in meshes:
+                geometry = mesh_cache.get_geometry(obj)
+                if len(mesh_cache.self_intersect_faces(geometry, threshold)) == 0:
+                    continue
+                segments = contact.self_contact_segments(geometry, obj.matrix_world, threshold)
+                add_contact_segments(segments)
+                count += len(segments)
+        if pair_check:
+            for i, obj1 in enumerate(meshes):
+                for obj2 in meshes[i + 1:]:
+                    memo = mesh_cache.get_pair_result(obj1, obj2, threshold)
+                    if memo is None or (len(memo[0]) == 0 and len(memo[1]) == 0):
+                        continue
+                    segments = contact.pair_contact_segments(
+                        mesh_cache.get_geometry(obj1), obj1.matrix_world,
+                        mesh_cache.get_geometry(obj2), obj2.matrix_world, threshold
+                    )
+                    add_contact_segments(segments)
+                    count += len(segments)
+    return count
+
+
+def get_instance_report():
+    """获取实例相交报告"""
+    return _instance_report
+
+
+def _add_buried_report(items, buried):
+    for inner, outer in buried:
+        _buried_report.append({'inner': items[inner].label, 'outer': items[outer].label})
+    if buried:
+        mark_inspection_changed()
+
+
+def check_object_containment(objects, threshold=0.00001, max_faces=0):
+    """
+    包含检测：找出完全埋在其他对象内部的对象（没有表面相交，对象间相交检测无法发现）
+    只用评估后的包围盒粗筛，包围盒嵌套的对象对才获取几何，按批做奇偶射线判定（见 _pinned_pair_batches），
+    流式检测中不会同时保留所有对象的几何。结果写入包埋报告
+    只需要知道对象对是否相交，max_faces 与对象间检测一致时可直接复用其（部分）结果
+    
+    Returns:
+        int: 被包埋的对象数量
+    """
+    from . import containment
+    from . import instances
+    
+    meshes = [obj for obj in objects if obj.type == 'MESH' and obj.data.polygons]
+    if len(meshes) < 2:
+        return 0
+    
+    with profiling.span('broad_phase'):
+        bounds_min, bounds_max = mesh_cache.evaluated_world_bounds(meshes)
+        candidate_pairs = broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=threshold)
+        nested = containment.nested_pairs(candidate_pairs, bounds_min, bounds_max, threshold)
+    if mesh_cache.is_streaming():
+        nested = _spatial_pair_order(nested, bounds_min, bounds_max)
+    
+    def fetch(inner, outer):
+        # 表面相交结果在本次检测中已缓存，这里不会重复计算
+        faces1, faces2 = check_object_intersections(meshes[min(inner, outer)], meshes[max(inner, outer)],
+                                                    threshold, max_faces)
+        if len(faces1) or len(faces2):
+            return None
+        return {
+            index: instances.InspectionItem(meshes[index].name, meshes[index], mesh_cache.get_geometry(meshes[index]),
+                                            meshes[index].matrix_world.copy(), False)
+            for index in (inner, outer)
+        }
+    
+    buried_count = 0
+    for batch in _pinned_pair_batches(nested, fetch):
+        items = {}
+        misses = []
+        for inner, outer, pair_items in batch:
+            if pair_items is not None:
+                items.update(pair_items)
+                misses.append((inner, outer))
+        buried = containment.find_buried(items, misses, bounds_min, bounds_max, threshold)
+        _add_buried_report(items, buried)
+        buried_count += len(buried)
+    return buried_count
+
+
+def check_clearance(objects, distance, max_samples=0, threshold=0.00001):
+    """
+    间隙检测：对象之间距离小于 distance 的面（不要求相交）
+    只用评估后的包围盒粗筛，候选对象对才获取几何，按批计算（见 _pinned_pair_batches）
+    结果以每个面的最小距离写入检测数据（'values'），可通过 get_inspection_values 获取
+    
+    Returns:
+        int: 间隙不足的面总数
+    """
+    from . import clearance
+    
+    objects = [obj for obj in objects if obj.type == 'MESH' and obj.data.polygons]
+    if len(objects) < 2:
+        return 0
+    
+    # 包围盒扩展间隙值后仍不重叠的对象对不可能间隙不足
+    with profiling.span('broad_phase'):
+        bounds_min, bounds_max = mesh_cache.evaluated_world_bounds(objects)
+        candidate_pairs = [
+            (int(i), int(j)) for i, j in broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=distance)
+        ]
+    if mesh_cache.is_streaming():
+        candidate_pairs = _spatial_pair_order(candidate_pairs, bounds_min, bounds_max)
+    
+    def fetch(i, j):
+        return [(objects[index], mesh_cache.get_geometry(objects[index], clearance.REQUIRED_BUFFERS)) for index in (i, j)]
+    
+    face_distances = {}
+    for batch in _pinned_pair_batches(candidate_pairs, fetch):
+        for _, _, (side1, side2) in batch:
+            for (obj_a, geometry_a), (obj_b, geometry_b) in ((side1, side2), (side2, side1)):
+                result = clearance.face_clearance(
+                    geometry_a, obj_a.matrix_world, geometry_b, obj_b.matrix_world, distance, max_samples, threshold
+                )
+                if obj_a in face_distances:
+                    np.minimum(face_distances[obj_a], result, out=face_distances[obj_a])
+                else:
+                    face_distances[obj_a] = result
+    
+    total_faces = 0
+    for obj, distances in face_distances.items():
+        faces = np.flatnonzero(distances <= distance).astype(np.int32)
+        if len(faces) == 0:
+            continue
+        total_faces += len(faces)
+        add_inspection_data(obj, faces, "CLEARANCE", values=distances[faces])
+    return total_faces
+
+
+def get_inspection_values(obj, inspection_type="CLEARANCE"):
+    """
+    获取对象带数值的检测结果（用于报告）
+    
+    Returns:
+        tuple: (面索引 np.ndarray int32, 数值 np.ndarray float32)，没有结果时为空数组
+    """
+    faces = []
+    values = []
+    for data in _inspection_data:
+        if data['object'] == obj and data.get('inspection_type') == inspection_type and 'values' in data:
+            faces.append(np.asarray(data['faces'], dtype=np.int32))
+            values.append(data['values'])
+    if not faces:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float32)
+    return np.concatenate(faces), np.concatenate(values)
+
+
+def get_buried_report():
+    """获取包埋对象报告"""
+    return _buried_report
+
+
+def bmesh_check_intersect_objects(target_obj, other_objects, threshold=0.00001, max_faces=0):
     """
     检查目标对象与其他对象的相交（兼容operators.py的调用方式）
     
@@ -393,21 +1395,25 @@ def bmesh_check_intersect_objects(target_obj, other_objects, threshold=0.00001):
         target_obj: 目标对象
         other_objects: 其他对象列表
         threshold: BVH 树的精度阈值
+        max_faces: 大于 0 时目标对象找到该数量的相交面后不再检测剩余对象
     
     Returns:
-        array.array: 目标对象中相交面的索引数组
+        np.ndarray: 目标对象中排序后的相交面索引 (int32)
     """
-    if not other_objects:
-        return array.array('i', ())
-    
-    all_intersect_faces = set()
-    
+    face_arrays = []
+    found = 0
     for other_obj in other_objects:
         if other_obj and other_obj.type == 'MESH' and other_obj != target_obj:
-            target_faces, _ = check_object_intersections(target_obj, other_obj, threshold)
-            all_intersect_faces.update(target_faces)
+            target_faces, _ = check_object_intersections(target_obj, other_obj, threshold, max_faces)
+            face_arrays.append(target_faces)
+            found += len(target_faces)
+            # 合并前的总数只会偏多，达到上限时再去重确认
+            if 0 < max_faces <= found:
+                faces = merge_face_arrays(face_arrays)
+                if len(faces) >= max_faces:
+                    return faces[:max_faces]
     
-    return array.array('i', all_intersect_faces)
+    return merge_face_arrays(face_arrays)
 
 
 def face_is_distorted(face, angle_threshold):
@@ -437,32 +1443,48 @@ def face_is_distorted(face, angle_threshold):
     return False
 
 
-def check_distorted_faces(obj, angle_threshold):
+def check_distorted_faces(obj, angle_threshold, values=None):
     """
     检查对象的扭曲面片
+    使用评估网格的 NumPy 快照批量计算（判定与 face_is_distorted 一致），
+    与其他检测项共享同一份快照
     
     Args:
         obj: Blender 对象
         angle_threshold: 角度阈值（弧度）
+        values: 可选字典，写入 {'DISTORTION': 扭曲面的最大扭曲角}
     
     Returns:
-        array.array: 扭曲面的索引数组
+        np.ndarray: 排序后的扭曲面索引 (int32)
     """
     if not obj.data.polygons:
-        return array.array('i', ())
+        return mesh_cache.EMPTY_FACES
     
-    bm = bmesh_from_object(obj)
-    bm.normal_update()
+    check = check_engine.DistortionCheck(angle_threshold=angle_threshold)
+    return check_engine.run_object_checks(obj, [check], values)[check.name]
+
+
+def select_faces_in_bmesh(bm, face_indices):
+    """
+    在 bmesh 中选择指定索引的面片
     
-    distorted_faces = []
-    for i, face in enumerate(bm.faces):
-        if face_is_distorted(face, angle_threshold):
-            distorted_faces.append(i)
+    Args:
+        bm: bmesh 对象
+        face_indices: 面索引序列（越界索引会被忽略）
     
-    if obj.mode != 'EDIT':
-        bm.free()
+    Returns:
+        int: 实际选中的面数
+    """
+    bm.faces.ensure_lookup_table()
     
-    return array.array('i', distorted_faces)
+    face_count = len(bm.faces)
+    selected_count = 0
+    for face_idx in face_indices:
+        if face_idx < face_count:
+            bm.faces[face_idx].select = True
+            selected_count += 1
+    
+    return selected_count
 
 
 def cleanup_handlers():
@@ -471,46 +1493,105 @@ def cleanup_handlers():
     clear_inspection_data()
 
 
-def get_inspection_stats():
-    """获取检测统计信息"""
-    total_objects = len(set(data['object'] for data in _inspection_data))
-    total_faces = sum(len(data['faces']) for data in _inspection_data)
+def _build_stats_snapshot():
+    """根据检测数据构建统计快照（仅在检测数据变化后调用一次）"""
+    object_names = []
+    per_object = {}
+    total_faces = 0
+    intersect_count = 0
+    distortion_count = 0
+    topology_count = 0
+    uv_overlap_count = 0
+    thin_wall_count = 0
+    clearance_count = 0
+    min_values = {}
     
-    # 分类统计
-    intersect_count = sum(len(data['faces']) for data in _inspection_data 
-                         if data.get('inspection_type', 'INTERSECT') == 'INTERSECT')
-    distortion_count = sum(len(data['faces']) for data in _inspection_data 
-                          if data.get('inspection_type', 'DISTORTION') == 'DISTORTION')
+    for data in _inspection_data:
+        face_count = len(data['faces'])
+        inspect_type = data.get('inspection_type', 'INTERSECT')
+        total_faces += face_count
+        if inspect_type == 'INTERSECT':
+            intersect_count += face_count
+        elif inspect_type == 'DISTORTION':
+            distortion_count += face_count
+        elif inspect_type in TOPOLOGY_DISPLAY:
+            topology_count += face_count
+        elif inspect_type == 'UV_OVERLAP':
+            uv_overlap_count += face_count
+        elif inspect_type == 'THIN_WALL':
+            thin_wall_count += face_count
+        elif inspect_type == 'CLEARANCE':
+            clearance_count += face_count
+        
+        obj = data.get('object')
+        try:
+            # 测试对象引用是否仍然有效
+            obj_name = obj.name if obj else "未知"
+        except ReferenceError:
+            # 对象已被删除，跳过
+            continue
+        
+        if obj_name not in per_object:
+            per_object[obj_name] = {'INTERSECT': 0, 'DISTORTION': 0}
+            if obj:
+                object_names.append(obj_name)
+        per_object[obj_name][inspect_type] = per_object[obj_name].get(inspect_type, 0) + face_count
+        
+        values = data.get('values')
+        if values is not None and len(values):
+            current = min_values.get(obj_name)
+            value = float(values.min())
+            min_values[obj_name] = value if current is None else min(current, value)
     
     return {
-        'objects_count': total_objects,
-        'faces_count': total_faces,
-        'intersect_faces': intersect_count,
-        'distorted_faces': distortion_count,
-        'is_display_enabled': _is_display_enabled
+        'stats': {
+            'objects_count': len(per_object),
+            'faces_count': total_faces,
+            'intersect_faces': intersect_count,
+            'distorted_faces': distortion_count,
+            'topology_faces': topology_count,
+            'uv_overlap_faces': uv_overlap_count,
+            'thin_wall_faces': thin_wall_count,
+            'clearance_faces': clearance_count,
+        },
+        'per_object': per_object,
+        'min_values': min_values,
+        'object_names': object_names,
     }
 
 
+def _get_stats_snapshot():
+    """获取统计快照，检测数据版本号未变化时直接返回缓存"""
+    global _stats_snapshot, _stats_snapshot_generation
+    if _stats_snapshot is None or _stats_snapshot_generation != _inspection_generation:
+        _stats_snapshot = _build_stats_snapshot()
+        _stats_snapshot_generation = _inspection_generation
+    return _stats_snapshot
+
+
+def get_inspection_stats():
+    """获取检测统计信息（来自缓存快照，面板重绘时为 O(1)）"""
+    stats = dict(_get_stats_snapshot()['stats'])
+    stats['is_display_enabled'] = _is_display_enabled
+    return stats
+
+
+def get_inspection_breakdown():
+    """获取按对象分类的检测面数 {对象名: {检测类型: 面数}}（来自缓存快照）"""
+    return _get_stats_snapshot()['per_object']
+
+
+def get_min_values():
+    """获取按对象的最小检测数值 {对象名: 最小值}（如最小间隙距离，来自缓存快照）"""
+    return _get_stats_snapshot()['min_values']
+
+
 def get_current_inspected_objects():
     """获取当前检测中的对象名称列表"""
     if not _inspection_data:
         return []
     
-    # 获取当前有效的对象名称
-    object_names = []
-    for data in _inspection_data:
-        obj = data.get('object')
-        if obj:
-            try:
-                # 测试对象引用是否仍然有效
-                name = obj.name
-                if name not in object_names:
-                    object_names.append(name)
-            except ReferenceError:
-                # 对象已被删除，跳过
-                continue
-    
-    return object_names
+    return _get_stats_snapshot()['object_names']
 
 
 def get_display_object_name(context):
@@ -6,9 +6,16 @@
 
 import bpy
 from bpy.types import Operator
-from bpy.props import EnumProperty
-import bmesh
-from . import mesh_helpers
+from bpy.props import EnumProperty, IntProperty, StringProperty
+from mathutils import Vector
+from . import profiling
+from .lazy import lazy_import
+
+# 检测模块在操作符第一次执行时才加载
+mesh_helpers = lazy_import(__package__ + ".mesh_helpers")
+result_cache = lazy_import(__package__ + ".result_cache")
+mesh_cache = lazy_import(__package__ + ".mesh_cache")
+check_engine = lazy_import(__package__ + ".check_engine")
 
 
 def update_last_inspected_objects(context, objects):
@@ -30,6 +37,88 @@ def update_last_inspected_objects(context, objects):
     props.last_inspected_objects = display_name
 
 
+def begin_inspection(context, label):
+    """开始一次检测：按面板设置启用性能分析、内存峰值记录、结果缓存和流式检测"""
+    props = context.scene.model_inspector
+    profiling.begin_run(label, props.enable_profiling, props.track_memory)
+    result_cache.configure(
+        props.use_result_cache,
+        bpy.path.abspath(props.cache_directory),
+        props.cache_max_size_mb
+    )
+    mesh_cache.begin_session(props.streaming_cache_mb * 1024 * 1024 if props.streaming_mode else 0)
+    props.intersection_pairs.clear()
+    props.intersection_pair_index = 0
+
+
+def end_inspection():
+    """结束一次检测（在 finally 中调用，检测出错时也要释放会话几何并结束计时）"""
+    try:
+        mesh_cache.end_session()
+    finally:
+        profiling.end_run()
+
+
+def add_check_results(check_results, checks, check_values=None):
+    """
+    将检测引擎的结果加入检测数据
+    
+    Args:
+        check_values: 可选，run_checks 输出的 {对象: {检测项名称: 问题面标量}}，用于热力图显示
+    
+    Returns:
+        dict: {检测类型: 问题面总数}
+    """
+    totals = {check.inspection_type: 0 for check in checks}
+    for obj, obj_results in check_results.items():
+        obj_values = check_values.get(obj, {}) if check_values else {}
+        for check in checks:
+            faces = obj_results.get(check.name)
+            if faces is not None and len(faces) > 0:
+                totals[check.inspection_type] += len(faces)
+                mesh_helpers.add_inspection_data(
+                    obj, faces, check.inspection_type, values=obj_values.get(check.name)
+                )
+    return totals
+
+
+def fill_pair_table(props, rows):
+    """将 collect_pair_report 生成的对象间相交表写入面板属性"""
+    props.intersection_pairs.clear()
+    for row in rows:
+        item = props.intersection_pairs.add()
+        item.object1 = row['object1']
+        item.object2 = row['object2']
+        item.faces1 = row['faces1']
+        item.faces2 = row['faces2']
+        item.bounds_min = row['bounds_min']
+        item.bounds_max = row['bounds_max']
+    props.intersection_pair_index = 0
+
+
+def intersect_max_faces(props):
+    """相交检测的面数上限（0 表示找出全部相交面）"""
+    if props.intersect_limit_mode == 'FIRST':
+        return 1
+    if props.intersect_limit_mode == 'FIRST_K':
+        return props.intersect_max_hits
+    return 0
+
+
+def wants_contact_lines(props):
+    """是否需要计算相交交线（限定数量模式只做通过判定，不计算交线）"""
+    return (props.check_intersection and props.intersect_display != 'FACES'
+            and intersect_max_faces(props) == 0)
+
+
+def format_check_totals(totals):
+    """格式化各检测类型的问题面数（如 3 非流形面, 2 零面积面）"""
+    return ', '.join(
+        f"{count} {mesh_helpers.INSPECTION_TYPE_LABELS.get(inspect_type, inspect_type)}面"
+        for inspect_type, count in totals.items() if count > 0
+    )
+
+
 def get_objects_for_inspection(context):
     """智能获取要检测的对象，优先使用当前选中对象，否则使用最后检测的对象"""
     # 首先尝试获取当前选中的mesh对象
@@ -79,11 +168,17 @@ class MESH_OT_ModelInspector_CheckSelfIntersect(Operator):
         
         # 清空之前的数据
         mesh_helpers.clear_inspection_data()
-        
-        # 执行自相交检测
-        faces_intersect = mesh_helpers.bmesh_check_self_intersect_object(
-            obj, threshold=props.intersect_threshold
-        )
+        begin_inspection(context, self.bl_label)
+        try:
+            # 执行自相交检测
+            with profiling.span('check_self', obj):
+                faces_intersect = mesh_helpers.bmesh_check_self_intersect_object(
+                    obj, threshold=props.intersect_threshold, max_faces=intersect_max_faces(props)
+                )
+            if len(faces_intersect) > 0 and wants_contact_lines(props):
+                mesh_helpers.collect_contact_segments([obj], props.intersect_threshold, pair_check=False)
+        finally:
+            end_inspection()
         
         # 更新检测对象记录
         update_last_inspected_objects(context, [obj])
@@ -124,18 +219,25 @@ class MESH_OT_ModelInspector_CheckDistortion(Operator):
         
         # 清空之前的数据
         mesh_helpers.clear_inspection_data()
-        
-        # 执行扭曲检测
-        faces_distorted = mesh_helpers.check_distorted_faces(
-            obj, angle_threshold=props.distortion_angle
-        )
+        begin_inspection(context, self.bl_label)
+        try:
+            # 执行扭曲检测（同时获取各面扭曲角，用于热力图）
+            distortion_values = {}
+            with profiling.span('check_distortion', obj):
+                faces_distorted = mesh_helpers.check_distorted_faces(
+                    obj, angle_threshold=props.distortion_angle, values=distortion_values
+                )
+        finally:
+            end_inspection()
         
         # 更新检测对象记录
         update_last_inspected_objects(context, [obj])
         
         if len(faces_distorted) > 0:
             # 添加到显示数据
-            mesh_helpers.add_inspection_data(obj, faces_distorted, "DISTORTION")
+            mesh_helpers.add_inspection_data(
+                obj, faces_distorted, "DISTORTION", values=distortion_values.get('DISTORTION')
+            )
             
             # 自动启用显示
             mesh_helpers.enable_display()
@@ -148,6 +250,171 @@ class MESH_OT_ModelInspector_CheckDistortion(Operator):
         return {'FINISHED'}
 
 
+class MESH_OT_ModelInspector_CheckTopology(Operator):
+    """检查拓扑问题"""
+    bl_idname = "mesh.model_inspector_check_topology"
+    bl_label = "检查拓扑"
+    bl_description = "检测选中对象的非流形边、零面积面和重复顶点"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        
+        # 智能获取检测对象
+        inspection_objects = get_objects_for_inspection(context)
+        if not inspection_objects:
+            self.report({'ERROR'}, "请选择一个网格对象或确保之前检测过的对象仍存在于场景中")
+            return {'CANCELLED'}
+        
+        checks = check_engine.topology_checks_from_props(props)
+        if not checks:
+            self.report({'ERROR'}, "请至少开启一种拓扑检测")
+            return {'CANCELLED'}
+        
+        # 清空之前的数据
+        mesh_helpers.clear_inspection_data()
+        begin_inspection(context, self.bl_label)
+        try:
+            with profiling.span('check_topology'):
+                check_results = check_engine.run_checks(inspection_objects, checks)
+        finally:
+            end_inspection()
+        
+        # 更新检测对象记录
+        update_last_inspected_objects(context, inspection_objects)
+        
+        totals = add_check_results(check_results, checks)
+        if any(totals.values()):
+            # 自动启用显示
+            mesh_helpers.enable_display()
+            props.last_check_results = f"发现: {format_check_totals(totals)}"
+        else:
+            props.last_check_results = "未发现拓扑问题"
+        
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_CheckUVOverlap(Operator):
+    """检查 UV 重叠"""
+    bl_idname = "mesh.model_inspector_check_uv_overlap"
+    bl_label = "检查 UV 重叠"
+    bl_description = "检测选中对象活动 UV 层中互相重叠的面"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        
+        # 智能获取检测对象
+        inspection_objects = get_objects_for_inspection(context)
+        if not inspection_objects:
+            self.report({'ERROR'}, "请选择一个网格对象或确保之前检测过的对象仍存在于场景中")
+            return {'CANCELLED'}
+        
+        # 清空之前的数据
+        mesh_helpers.clear_inspection_data()
+        begin_inspection(context, self.bl_label)
+        try:
+            checks = [check_engine.UVOverlapCheck(epsilon=props.uv_overlap_epsilon)]
+            with profiling.span('check_uv'):
+                check_results = check_engine.run_checks(inspection_objects, checks)
+        finally:
+            end_inspection()
+        
+        # 更新检测对象记录
+        update_last_inspected_objects(context, inspection_objects)
+        
+        totals = add_check_results(check_results, checks)
+        if totals['UV_OVERLAP'] > 0:
+            # 自动启用显示
+            mesh_helpers.enable_display()
+            props.last_check_results = f"发现 {totals['UV_OVERLAP']} 个 UV 重叠面"
+        else:
+            props.last_check_results = "未发现 UV 重叠"
+        
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_CheckThickness(Operator):
+    """检查壁厚"""
+    bl_idname = "mesh.model_inspector_check_thickness"
+    bl_label = "检查壁厚"
+    bl_description = "从面中心向内投射射线，检测壁厚小于最小值的面"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        
+        # 智能获取检测对象
+        inspection_objects = get_objects_for_inspection(context)
+        if not inspection_objects:
+            self.report({'ERROR'}, "请选择一个网格对象或确保之前检测过的对象仍存在于场景中")
+            return {'CANCELLED'}
+        
+        # 清空之前的数据
+        mesh_helpers.clear_inspection_data()
+        begin_inspection(context, self.bl_label)
+        try:
+            checks = [check_engine.thickness_check_from_props(props)]
+            check_values = {}
+            with profiling.span('check_thickness'):
+                check_results = check_engine.run_checks(inspection_objects, checks, check_values)
+        finally:
+            end_inspection()
+        
+        # 更新检测对象记录
+        update_last_inspected_objects(context, inspection_objects)
+        
+        totals = add_check_results(check_results, checks, check_values)
+        if totals['THIN_WALL'] > 0:
+            # 自动启用显示
+            mesh_helpers.enable_display()
+            props.last_check_results = f"发现 {totals['THIN_WALL']} 个过薄面"
+        else:
+            props.last_check_results = "未发现过薄面"
+        
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_CheckClearance(Operator):
+    """检查对象间隙"""
+    bl_idname = "mesh.model_inspector_check_clearance"
+    bl_label = "检查间隙"
+    bl_description = "检测选中对象之间距离小于间隙值的面（按距离着色）"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        
+        selected_objects = [obj for obj in context.selected_objects if obj.type == 'MESH']
+        if len(selected_objects) < 2:
+            self.report({'ERROR'}, "请选择至少两个网格对象进行间隙检测")
+            return {'CANCELLED'}
+        
+        # 清空之前的数据
+        mesh_helpers.clear_inspection_data()
+        begin_inspection(context, self.bl_label)
+        try:
+            with profiling.span('check_clearance'):
+                total_faces = mesh_helpers.check_clearance(
+                    selected_objects, props.clearance_distance,
+                    max_samples=props.clearance_samples, threshold=props.intersect_threshold
+                )
+        finally:
+            end_inspection()
+        
+        # 更新检测对象记录
+        update_last_inspected_objects(context, selected_objects)
+        
+        if total_faces > 0:
+            # 自动启用显示
+            mesh_helpers.enable_display()
+            props.last_check_results = f"发现 {total_faces} 个间隙不足面"
+        else:
+            props.last_check_results = "未发现间隙不足"
+        
+        return {'FINISHED'}
+
+
 class MESH_OT_ModelInspector_CheckAll(Operator):
     """全面检查"""
     bl_idname = "mesh.model_inspector_check_all"
@@ -164,60 +431,126 @@ class MESH_OT_ModelInspector_CheckAll(Operator):
             return {'CANCELLED'}
         
         # 检查是否有功能开启
-        if not props.check_intersection and not props.check_distortion:
+        topology_checks = check_engine.topology_checks_from_props(props)
+        if (not props.check_intersection and not props.check_distortion and
+                not topology_checks and not props.check_uv_overlap and not props.check_thickness and
+                not props.check_clearance):
             self.report({'ERROR'}, "请至少开启一种检测功能")
             return {'CANCELLED'}
         
         # 清空之前的数据
         mesh_helpers.clear_inspection_data()
-        
-        total_intersect_faces = 0
-        total_distorted_faces = 0
-        
-        # 执行检查
-        for obj in selected_objects:
-            # 1. 检查相交（如果启用）
-            if props.check_intersection:
-                if props.intersect_type == 'SELF':
-                    faces_intersect = mesh_helpers.bmesh_check_self_intersect_object(
-                        obj, threshold=props.intersect_threshold
-                    )
-                elif props.intersect_type == 'OBJECTS':
-                    # 对象间相交检测
-                    other_objects = [o for o in selected_objects if o != obj]
-                    faces_intersect = mesh_helpers.bmesh_check_intersect_objects(
-                        obj, other_objects, threshold=props.intersect_threshold
-                    )
-                else:  # BOTH
-                    # 先检查自相交
-                    faces_intersect = mesh_helpers.bmesh_check_self_intersect_object(
-                        obj, threshold=props.intersect_threshold
+        begin_inspection(context, self.bl_label)
+        try:
+            if mesh_cache.is_streaming():
+                # 相邻对象依次检测，几何缓存中保留的都是接下来还会用到的对象
+                selected_objects = mesh_cache.spatial_order(selected_objects)
+            
+            total_intersect_faces = 0
+            total_distorted_faces = 0
+            max_faces = intersect_max_faces(props)
+            
+            # 实例相交在所有对象上统一检测一次
+            if props.check_intersection and props.intersect_type == 'INSTANCES':
+                with profiling.span('check_instances'):
+                    total_intersect_faces += mesh_helpers.check_instance_intersections(
+                        context, context.selected_objects or selected_objects,
+                        threshold=props.intersect_threshold, contacts=wants_contact_lines(props),
+                        max_faces=max_faces, workers=props.intersect_workers
                     )
-                    # 再检查对象间相交
-                    other_objects = [o for o in selected_objects if o != obj]
-                    faces_intersect_between = mesh_helpers.bmesh_check_intersect_objects(
-                        obj, other_objects, threshold=props.intersect_threshold
+            
+            # 单对象检测项：每个对象只提取一次网格快照，所有检测项共享
+            object_checks = []
+            if props.check_intersection and props.intersect_type in {'SELF', 'BOTH'}:
+                object_checks.append(check_engine.SelfIntersectCheck(
+                    threshold=props.intersect_threshold, max_faces=max_faces
+                ))
+            if props.check_distortion:
+                object_checks.append(check_engine.DistortionCheck(angle_threshold=props.distortion_angle))
+            # 拓扑、UV 和壁厚检测项的结果统一在最后加入检测数据
+            extra_checks = list(topology_checks)
+            if props.check_uv_overlap:
+                extra_checks.append(check_engine.UVOverlapCheck(epsilon=props.uv_overlap_epsilon))
+            if props.check_thickness:
+                extra_checks.append(check_engine.thickness_check_from_props(props))
+            object_checks.extend(extra_checks)
+            check_values = {}
+            check_results = check_engine.run_checks(selected_objects, object_checks, check_values) if object_checks else {}
+            
+            # 对象间相交：所有对象对批量（可并行）检测一次，两侧的相交面分别记入各自对象
+            pair_results = []
+            object_faces = {}
+            if props.check_intersection and props.intersect_type in {'OBJECTS', 'BOTH'}:
+                with profiling.span('check_objects'):
+                    pair_results = mesh_helpers.check_all_object_intersections(
+                        selected_objects, props.intersect_threshold, max_faces, props.intersect_workers
                     )
-                    faces_intersect.extend(faces_intersect_between)
+                for obj1, obj2, faces1, faces2 in pair_results:
+                    object_faces.setdefault(obj1, []).append(faces1)
+                    object_faces.setdefault(obj2, []).append(faces2)
+            
+            # 执行检查
+            for obj in selected_objects:
+                obj_results = check_results.get(obj, {})
                 
-                if len(faces_intersect) > 0:
-                    total_intersect_faces += len(faces_intersect)
-                    mesh_helpers.add_inspection_data(obj, faces_intersect, "INTERSECT")
+                # 1. 检查相交（如果启用，实例相交已在上面处理）
+                if props.check_intersection and props.intersect_type != 'INSTANCES':
+                    face_arrays = [obj_results.get('SELF_INTERSECT', mesh_cache.EMPTY_FACES)]
+                    face_arrays.extend(object_faces.get(obj, ()))
+                    # 同时自相交和与其他对象相交的面只计一次，合并后再按上限截断
+                    faces_intersect = mesh_helpers.merge_face_arrays(face_arrays)
+                    if 0 < max_faces < len(faces_intersect):
+                        faces_intersect = faces_intersect[:max_faces]
+                    
+                    if len(faces_intersect) > 0:
+                        total_intersect_faces += len(faces_intersect)
+                        mesh_helpers.add_inspection_data(obj, faces_intersect, "INTERSECT")
+                
+                # 2. 检查扭曲（如果启用）
+                faces_distorted = obj_results.get('DISTORTION')
+                if faces_distorted is not None and len(faces_distorted) > 0:
+                    total_distorted_faces += len(faces_distorted)
+                    mesh_helpers.add_inspection_data(
+                        obj, faces_distorted, "DISTORTION", values=check_values.get(obj, {}).get('DISTORTION')
+                    )
             
-            # 2. 检查扭曲（如果启用）
-            if props.check_distortion:
-                faces_distorted = mesh_helpers.check_distorted_faces(
-                    obj, angle_threshold=props.distortion_angle
+            # 相交交线（对象间和自相交模式，实例交线已在实例检测中计算）
+            if total_intersect_faces > 0 and wants_contact_lines(props) and props.intersect_type != 'INSTANCES':
+                mesh_helpers.collect_contact_segments(
+                    selected_objects, props.intersect_threshold,
+                    self_check=props.intersect_type in {'SELF', 'BOTH'},
+                    pair_check=props.intersect_type in {'OBJECTS', 'BOTH'}
                 )
-                if len(faces_distorted) > 0:
-                    total_distorted_faces += len(faces_distorted)
-                    mesh_helpers.add_inspection_data(obj, faces_distorted, "DISTORTION")
+            
+            # 包含检测（对象间相交模式）
+            buried_count = 0
+            pair_rows = []
+            if props.check_intersection and props.intersect_type in {'OBJECTS', 'BOTH'}:
+                buried_count = mesh_helpers.check_object_containment(
+                    selected_objects, props.intersect_threshold, max_faces
+                )
+                pair_rows = mesh_helpers.collect_pair_report(pair_results)
+            
+            # 3. 拓扑、UV 重叠和壁厚检测（如果启用）
+            extra_totals = add_check_results(check_results, extra_checks, check_values)
+            
+            # 4. 间隙检测（如果启用）
+            if props.check_clearance:
+                with profiling.span('check_clearance'):
+                    extra_totals['CLEARANCE'] = mesh_helpers.check_clearance(
+                        selected_objects, props.clearance_distance,
+                        max_samples=props.clearance_samples, threshold=props.intersect_threshold
+                    )
+            
+        finally:
+            end_inspection()
+        fill_pair_table(props, pair_rows)
         
         # 更新检测对象记录
         update_last_inspected_objects(context, selected_objects)
         
         # 结果报告
-        if total_intersect_faces > 0 or total_distorted_faces > 0:
+        if total_intersect_faces > 0 or total_distorted_faces > 0 or any(extra_totals.values()):
             # 自动启用显示
             mesh_helpers.enable_display()
             
@@ -226,11 +559,15 @@ class MESH_OT_ModelInspector_CheckAll(Operator):
                 result_parts.append(f"{total_intersect_faces} 相交面")
             if total_distorted_faces > 0:
                 result_parts.append(f"{total_distorted_faces} 扭曲面")
+            if any(extra_totals.values()):
+                result_parts.append(format_check_totals(extra_totals))
             
             result_msg = f"发现: {', '.join(result_parts)}"
             props.last_check_results = result_msg
         else:
             props.last_check_results = "未发现问题"
+        if buried_count > 0:
+            props.last_check_results += f"，{buried_count} 个对象被完全包埋"
         
         return {'FINISHED'}
 
@@ -261,6 +598,8 @@ class MESH_OT_ModelInspector_SelectProblemFaces(Operator):
     bl_options = {'REGISTER', 'UNDO'}
     
     def execute(self, context):
+        import bmesh
+        
         obj = context.active_object
         
         if not obj or obj.type != 'MESH':
@@ -272,12 +611,13 @@ class MESH_OT_ModelInspector_SelectProblemFaces(Operator):
             return {'CANCELLED'}
         
         # 查找当前对象的检测数据
-        problem_faces = []
-        for data in mesh_helpers._inspection_data:
-            if data['object'] == obj:
-                problem_faces.extend(data['faces'])
+        problem_faces = mesh_helpers.merge_face_arrays([
+            data['sorted_faces'] for data in mesh_helpers._inspection_data
+            # 实例检测结果的面索引属于实例几何，不能在实例化者上选择
+            if data['object'] == obj and 'world_tris' not in data
+        ])
         
-        if not problem_faces:
+        if len(problem_faces) == 0:
             self.report({'WARNING'}, "当前对象无检测数据")
             return {'CANCELLED'}
         
@@ -287,13 +627,7 @@ class MESH_OT_ModelInspector_SelectProblemFaces(Operator):
         
         # 获取 bmesh 并选择问题面片
         bm = bmesh.from_edit_mesh(obj.data)
-        bm.faces.ensure_lookup_table()
-        
-        selected_count = 0
-        for face_idx in problem_faces:
-            if face_idx < len(bm.faces):
-                bm.faces[face_idx].select = True
-                selected_count += 1
+        selected_count = mesh_helpers.select_faces_in_bmesh(bm, problem_faces)
         
         # 更新网格
         bmesh.update_edit_mesh(obj.data)
@@ -335,21 +669,40 @@ class MESH_OT_ModelInspector_CheckObjectIntersect(Operator):
         
         # 清空之前的数据
         mesh_helpers.clear_inspection_data()
-        
-        total_faces = 0
-        intersection_pairs = []
-        
-        # 检测每对对象之间的相交
-        for i, obj1 in enumerate(selected_objects):
-            other_objects = [obj for obj in selected_objects[i+1:]]
-            faces_intersect = mesh_helpers.bmesh_check_intersect_objects(
-                obj1, other_objects, threshold=props.intersect_threshold
+        begin_inspection(context, self.bl_label)
+        try:
+            # 检测每对对象之间的相交，两侧的相交面都记入各自对象
+            max_faces = intersect_max_faces(props)
+            object_faces = {}
+            with profiling.span('check_objects'):
+                pair_results = mesh_helpers.check_all_object_intersections(
+                    selected_objects, props.intersect_threshold, max_faces, props.intersect_workers
+                )
+            for obj1, obj2, faces1, faces2 in pair_results:
+                object_faces.setdefault(obj1, []).append(faces1)
+                object_faces.setdefault(obj2, []).append(faces2)
+            
+            total_faces = 0
+            for obj in selected_objects:
+                faces = mesh_helpers.merge_face_arrays(object_faces.get(obj, ()))
+                if len(faces) > 0:
+                    total_faces += len(faces)
+                    mesh_helpers.add_inspection_data(obj, faces, "INTERSECT")
+            
+            # 相交表直接由窄相位结果生成
+            pair_rows = mesh_helpers.collect_pair_report(pair_results)
+            
+            if total_faces > 0 and wants_contact_lines(props):
+                mesh_helpers.collect_contact_segments(selected_objects, props.intersect_threshold, self_check=False)
+            
+            # 包含检测：完全埋在其他对象内部的对象没有表面相交
+            buried_count = mesh_helpers.check_object_containment(
+                selected_objects, props.intersect_threshold, max_faces
             )
             
-            if len(faces_intersect) > 0:
-                total_faces += len(faces_intersect)
-                mesh_helpers.add_inspection_data(obj1, faces_intersect, "INTERSECT")
-                intersection_pairs.extend([(obj1.name, obj2.name) for obj2 in other_objects])
+        finally:
+            end_inspection()
+        fill_pair_table(props, pair_rows)
         
         # 更新检测对象记录
         update_last_inspected_objects(context, selected_objects)
@@ -358,10 +711,214 @@ class MESH_OT_ModelInspector_CheckObjectIntersect(Operator):
             # 自动启用显示
             mesh_helpers.enable_display()
             
-            result_msg = f"发现 {total_faces} 个对象间相交面"
+            result_msg = f"发现 {len(pair_rows)} 对对象相交，共 {total_faces} 个相交面"
             props.last_check_results = result_msg
         else:
             props.last_check_results = "未发现对象间相交"
+        if buried_count > 0:
+            props.last_check_results += f"，{buried_count} 个对象被完全包埋"
+        
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_ClearCache(Operator):
+    """清空结果缓存"""
+    bl_idname = "mesh.model_inspector_clear_cache"
+    bl_label = "清空结果缓存"
+    bl_description = "删除磁盘上缓存的检测结果"
+    bl_options = {'REGISTER'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        result_cache.configure(
+            props.use_result_cache,
+            bpy.path.abspath(props.cache_directory),
+            props.cache_max_size_mb
+        )
+        file_count, total_size = result_cache.get_cache_info()
+        result_cache.clear()
+        self.report({'INFO'}, f"已删除 {file_count} 个缓存文件 ({total_size / 1024 / 1024:.1f} MB)")
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_ExportProfile(Operator):
+    """导出性能分析数据"""
+    bl_idname = "mesh.model_inspector_export_profile"
+    bl_label = "导出性能分析"
+    bl_description = "将最近一次检测的阶段耗时导出为 JSON 或 Chrome Trace 文件"
+    bl_options = {'REGISTER'}
+    
+    filepath: StringProperty(  #type: ignore
+        name="文件路径",
+        subtype='FILE_PATH'
+    )
+    
+    export_format: EnumProperty(  #type: ignore
+        name="格式",
+        items=[
+            ('CHROME', "Chrome Trace", "可在 chrome://tracing 或 Perfetto 中打开"),
+            ('JSON', "JSON 汇总", "按阶段和对象汇总的耗时"),
+        ],
+        default='CHROME'
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        return profiling.get_last_run() is not None
+    
+    def invoke(self, context, event):
+        if not self.filepath:
+            self.filepath = "model_inspector_profile.json"
+        context.window_manager.fileselect_add(self)
+        return {'RUNNING_MODAL'}
+    
+    def execute(self, context):
+        filepath = bpy.path.abspath(self.filepath)
+        try:
+            if self.export_format == 'CHROME':
+                exported = profiling.export_chrome_trace(filepath)
+            else:
+                exported = profiling.export_json(filepath)
+        except OSError as e:
+            self.report({'ERROR'}, f"导出失败: {e}")
+            return {'CANCELLED'}
+        
+        if not exported:
+            self.report({'WARNING'}, "没有可导出的性能分析数据")
+            return {'CANCELLED'}
+        
+        self.report({'INFO'}, f"性能分析已导出: {filepath}")
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_CheckInstances(Operator):
+    """检查实例相交"""
+    bl_idname = "mesh.model_inspector_check_instances"
+    bl_label = "检查实例相交"
+    bl_description = "检测选中对象产生的几何节点/集合实例之间，以及实例与对象之间的相交"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        
+        # 实例化者可以是空物体（集合实例）或带几何节点的对象，不限于网格
+        selected_objects = list(context.selected_objects)
+        if not selected_objects:
+            self.report({'ERROR'}, "请选择产生实例的对象（集合实例或几何节点对象）")
+            return {'CANCELLED'}
+        
+        # 清空之前的数据
+        mesh_helpers.clear_inspection_data()
+        begin_inspection(context, self.bl_label)
+        try:
+            with profiling.span('check_instances'):
+                total_faces = mesh_helpers.check_instance_intersections(
+                    context, selected_objects, threshold=props.intersect_threshold,
+                    contacts=wants_contact_lines(props), max_faces=intersect_max_faces(props),
+                    workers=props.intersect_workers
+                )
+            
+        finally:
+            end_inspection()
+        
+        # 更新检测对象记录
+        update_last_inspected_objects(context, selected_objects)
+        
+        pair_count = len(mesh_helpers.get_instance_report())
+        if total_faces > 0:
+            # 自动启用显示
+            mesh_helpers.enable_display()
+            props.last_check_results = f"发现 {pair_count} 对实例相交，共 {total_faces} 个相交面"
+        else:
+            props.last_check_results = "未发现实例相交"
+        buried_count = len(mesh_helpers.get_buried_report())
+        if buried_count > 0:
+            props.last_check_results += f"，{buried_count} 个实例被完全包埋"
+        
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_ExportContacts(Operator):
+    """导出接触线网格"""
+    bl_idname = "mesh.model_inspector_export_contacts"
+    bl_label = "导出接触线网格"
+    bl_description = "将最近一次检测的相交交线导出为一个只有边的网格对象（每条交线一条边，可再转换为曲线）"
+    bl_options = {'REGISTER', 'UNDO'}
+    
+    @classmethod
+    def poll(cls, context):
+        return mesh_helpers.get_contact_segment_count() > 0
+    
+    def execute(self, context):
+        import numpy as np
+        
+        segments = mesh_helpers.get_contact_segments()
+        
+        # 每条线段两个独立顶点、一条边，整体用 foreach_set 写入
+        mesh = bpy.data.meshes.new("相交交线")
+        mesh.vertices.add(len(segments) * 2)
+        mesh.vertices.foreach_set("co", segments.ravel())
+        mesh.edges.add(len(segments))
+        mesh.edges.foreach_set("vertices", np.arange(len(segments) * 2, dtype=np.int32))
+        mesh.update()
+        
+        mesh_obj = bpy.data.objects.new("相交交线", mesh)
+        context.collection.objects.link(mesh_obj)
+        
+        self.report({'INFO'}, f"已导出 {len(segments)} 条交线到 {mesh_obj.name}")
+        return {'FINISHED'}
+
+
+class MESH_OT_ModelInspector_FramePair(Operator):
+    """定位相交对"""
+    bl_idname = "mesh.model_inspector_frame_pair"
+    bl_label = "定位相交对"
+    bl_description = "选中相交表中的对象对，并将视图对准它们的重叠区域"
+    bl_options = {'REGISTER'}
+    
+    index: IntProperty(  #type: ignore
+        name="索引",
+        description="相交表中的行号，-1 表示当前选中行",
+        default=-1
+    )
+    
+    @classmethod
+    def poll(cls, context):
+        return len(context.scene.model_inspector.intersection_pairs) > 0
+    
+    def execute(self, context):
+        props = context.scene.model_inspector
+        index = self.index if self.index >= 0 else props.intersection_pair_index
+        if not 0 <= index < len(props.intersection_pairs):
+            self.report({'ERROR'}, "相交表中没有该行")
+            return {'CANCELLED'}
+        props.intersection_pair_index = index
+        row = props.intersection_pairs[index]
+        
+        objects = [context.scene.objects.get(name) for name in (row.object1, row.object2)]
+        objects = [obj for obj in objects if obj is not None]
+        if not objects:
+            self.report({'ERROR'}, "相交对中的对象已不存在")
+            return {'CANCELLED'}
+        
+        # 物体模式下同时选中两个对象
+        if context.mode == 'OBJECT':
+            for obj in context.selected_objects:
+                obj.select_set(False)
+            for obj in objects:
+                obj.select_set(True)
+            context.view_layer.objects.active = objects[0]
+        
+        bounds_min = Vector(row.bounds_min)
+        bounds_max = Vector(row.bounds_max)
+        center = (bounds_min + bounds_max) / 2
+        distance = max((bounds_max - bounds_min).length * 2.0, 0.1)
+        for area in context.screen.areas:
+            if area.type == 'VIEW_3D':
+                region_3d = area.spaces.active.region_3d
+                region_3d.view_location = center
+                region_3d.view_distance = distance
+                area.tag_redraw()
         
         return {'FINISHED'}
 
@@ -370,10 +927,19 @@ class MESH_OT_ModelInspector_CheckObjectIntersect(Operator):
 classes = [
     MESH_OT_ModelInspector_CheckSelfIntersect,
     MESH_OT_ModelInspector_CheckObjectIntersect,
+    MESH_OT_ModelInspector_CheckInstances,
     MESH_OT_ModelInspector_CheckDistortion,
+    MESH_OT_ModelInspector_CheckTopology,
+    MESH_OT_ModelInspector_CheckUVOverlap,
+    MESH_OT_ModelInspector_CheckThickness,
+    MESH_OT_ModelInspector_CheckClearance,
     MESH_OT_ModelInspector_CheckAll,
     MESH_OT_ModelInspector_ToggleDisplay,
     MESH_OT_ModelInspector_SelectProblemFaces,
+    MESH_OT_ModelInspector_ClearCache,
+    MESH_OT_ModelInspector_ExportProfile,
+    MESH_OT_ModelInspector_ExportContacts,
+    MESH_OT_ModelInspector_FramePair,
 ]
 
 
@@ -0,0 +1,69 @@
+"""
+对象对窄相位批量执行
+各对象对的 BVH 重叠查询互相独立，后台模式下可以用多进程并行执行
+（子进程直接继承已构建的几何和 BVH，只需回传相交面索引，条件见 ray_batch.can_use_processes）。
+mathutils 的 BVHTree.overlap 执行期间不释放 GIL，线程池没有加速效果，不能 fork 时串行执行。
+"""
+
+import multiprocessing
+
+from . import mesh_cache
+from . import profiling
+from . import ray_batch
+
+# 当前任务（fork 前设置，子进程继承）
+_job = None
+
+
+def _run_task(index):
+    """执行第 index 个对象对的窄相位，返回 (面1, 面2, 三角形对)"""
+    tasks, epsilon, max_faces = _job
+    geometry1, matrix1, geometry2, matrix2 = tasks[index]
+    return mesh_cache.pair_intersect(geometry1, matrix1, geometry2, matrix2, epsilon, max_faces)
+
+
+def _prepare(tasks, epsilon):
+    """在主进程中预先构建每个对象对查询时使用的 BVH（较大一侧及其局部精度，与 pair_overlap 一致），工作进程只读取"""
+    for geometry1, matrix1, geometry2, matrix2 in tasks:
+        if len(geometry1.tris) == 0 or len(geometry2.tris) == 0:
+            continue
+        larger, matrix = (geometry2, matrix2) if len(geometry2.tris) > len(geometry1.tris) else (geometry1, matrix1)
+        larger.get_bvh(mesh_cache.local_epsilon(matrix, epsilon))
+
+
+def pair_intersect_batch(tasks, epsilon, max_faces=0, workers=1):
+    """
+    批量执行对象对相交检测
+
+    Args:
+        tasks: [(geometry1, matrix1, geometry2, matrix2)]
+        max_faces: 见 mesh_cache.pair_intersect_faces（三角形对在主进程中记入会话，供接触线复用）
+        workers: 进程数，大于 1 且可以 fork 时并行执行，否则串行
+
+    Returns:
+        list[tuple]: 与 tasks 一一对应的 (geometry1 的相交面, geometry2 的相交面)
+    """
+    global _job
+    if not tasks:
+        return []
+
+    _prepare(tasks, epsilon)
+    _job = (tasks, epsilon, max_faces)
+    indices = range(len(tasks))
+    workers = min(workers, len(tasks))
+
+    try:
+        if workers <= 1 or not ray_batch.can_use_processes():
+            results = [_run_task(i) for i in indices]
+        else:
+            with profiling.span('pair_parallel'):
+                # 每个进程一次领取多个对象对，减少进程间通信次数
+                chunksize = max(1, len(tasks) // (workers * 4))
+                with multiprocessing.get_context('fork').Pool(workers) as pool:
+                    results = pool.map(_run_task, indices, chunksize)
+    finally:
+        _job = None
+
+    for (geometry1, matrix1, geometry2, matrix2), (_, _, pairs) in zip(tasks, results):
+        mesh_cache.store_pair_triangles(geometry1, matrix1, geometry2, matrix2, epsilon, pairs)
+    return [(faces1, faces2) for faces1, faces2, _ in results]
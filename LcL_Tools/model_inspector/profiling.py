@@ -0,0 +1,292 @@
+"""
+模型检测性能分析
+轻量的阶段计时（span），按对象和单次检测汇总，可导出 JSON / Chrome Trace 文件离线分析
+可选用 tracemalloc 记录单次检测的内存峰值（只统计 Python / NumPy 分配，不含 Blender 内部的网格和 BVH 内存）
+"""
+
+import json
+import threading
+import time
+import tracemalloc
+
+# 阶段名称（显示用）
+STAGE_LABELS = {
+    'depsgraph': "依赖图评估",
+    'to_mesh': "评估网格",
+    'bmesh_build': "构建 bmesh",
+    'transform': "坐标变换",
+    'triangulate': "三角化",
+    'bvh_build': "构建 BVH",
+    'overlap': "BVH 重叠查询",
+    'convert': "结果转换",
+    'extract': "提取几何缓冲",
+    'self_intersect': "自相交计算",
+    'pair_intersect': "对象对相交计算",
+    'pair_parallel': "对象对并行计算",
+    'collect_instances': "收集实例",
+    'broad_phase': "包围盒粗筛",
+    'containment': "包含判定",
+    'contact': "交线计算",
+    'check_instances': "实例相交检测",
+    'digest': "网格哈希",
+    'distortion_eval': "扭曲计算",
+    'non_manifold': "非流形计算",
+    'zero_area': "零面积计算",
+    'duplicate_verts': "重复顶点计算",
+    'uv_overlap': "UV 重叠计算",
+    'thickness': "壁厚射线投射",
+    'clearance': "最近点查询",
+    'overlay_build': "叠加层构建",
+    'heatmap_build': "热力图构建",
+    'check_self': "自相交检测",
+    'check_objects': "对象间检测",
+    'check_distortion': "扭曲检测",
+    'check_topology': "拓扑检测",
+    'check_uv': "UV 重叠检测",
+    'check_thickness': "壁厚检测",
+    'check_clearance': "间隙检测",
+}
+
+# 全局状态
+_enabled = False      # 是否启用计时（由面板开关控制）
+_current_run = None   # 正在进行的检测
+_last_run = None      # 最近一次完成的检测
+_overlay_stats = {}   # 检测之外的计时（视口叠加层构建）{阶段: [次数, 总耗时]}
+_lock = threading.Lock()  # 计时可能来自多个线程
+_track_memory = False     # 本次检测是否记录内存峰值
+_memory_tracing = False   # 本次检测是否由这里启动了 tracemalloc
+_last_memory_peak = None  # 最近一次检测的内存峰值（字节），未记录时为 None
+
+
+class _NullSpan:
+    """未启用时返回的空计时器，几乎无开销"""
+    __slots__ = ()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+
+_NULL_SPAN = _NullSpan()
+
+
+class _Span:
+    """阶段计时器"""
+    __slots__ = ('stage', 'obj_name', 'start')
+
+    def __init__(self, stage, obj_name):
+        self.stage = stage
+        self.obj_name = obj_name
+        self.start = 0.0
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        end = time.perf_counter()
+        _record(self.stage, self.obj_name, self.start, end - self.start)
+        return False
+
+
+def _accumulate(table, stage, duration):
+    entry = table.get(stage)
+    if entry is None:
+        table[stage] = [1, duration]
+    else:
+        entry[0] += 1
+        entry[1] += duration
+
+
+def _record(stage, obj_name, start, duration):
+    """记录一次阶段耗时"""
+    with _lock:
+        run = _current_run
+        if run is None:
+            _accumulate(_overlay_stats, stage, duration)
+            return
+
+        _accumulate(run['stages'], stage, duration)
+        if obj_name is not None:
+            _accumulate(run['objects'].setdefault(obj_name, {}), stage, duration)
+
+        # Chrome Trace 事件（时间单位：微秒），不同线程的计时显示在各自的轨道上
+        run['events'].append({
+            'name': stage,
+            'cat': obj_name or "run",
+            'ph': "X",
+            'ts': (start - run['start']) * 1e6,
+            'dur': duration * 1e6,
+            'pid': 0,
+            'tid': threading.get_ident(),
+            'args': {'object': obj_name} if obj_name else {},
+        })
+
+
+def _object_name(obj):
+    if obj is None:
+        return None
+    try:
+        return obj.name
+    except ReferenceError:
+        return None
+
+
+def set_enabled(enabled):
+    """启用或禁用计时"""
+    global _enabled
+    _enabled = bool(enabled)
+    if not _enabled:
+        _overlay_stats.clear()
+
+
+def is_enabled():
+    """是否启用计时"""
+    return _enabled
+
+
+def span(stage, obj=None):
+    """
+    阶段计时上下文
+
+    用法:
+        with profiling.span('bvh_build', obj):
+            tree = BVHTree.FromBMesh(bm)
+    """
+    if not _enabled:
+        return _NULL_SPAN
+    return _Span(stage, _object_name(obj))
+
+
+def begin_run(label, enabled=None, track_memory=False):
+    """
+    开始一次检测计时（enabled 通常传入面板上的开关状态）
+
+    Args:
+        track_memory: 用 tracemalloc 记录本次检测的内存峰值，与计时开关无关；
+                      tracemalloc 会明显拖慢分配密集的阶段，计时与内存峰值最好分开测量
+    """
+    global _current_run, _track_memory, _memory_tracing
+    if enabled is not None:
+        set_enabled(enabled)
+    _track_memory = track_memory
+    if track_memory:
+        _memory_tracing = not tracemalloc.is_tracing()
+        if _memory_tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+    if not _enabled:
+        _current_run = None
+        return
+    _current_run = {
+        'label': label,
+        'start': time.perf_counter(),
+        'total': 0.0,
+        'stages': {},
+        'objects': {},
+        'events': [],
+    }
+
+
+def end_run():
+    """结束当前检测计时"""
+    global _current_run, _last_run, _track_memory, _memory_tracing, _last_memory_peak
+    memory_peak = None
+    if _track_memory and tracemalloc.is_tracing():
+        memory_peak = tracemalloc.get_traced_memory()[1]
+        if _memory_tracing:
+            tracemalloc.stop()
+    _track_memory = _memory_tracing = False
+    _last_memory_peak = memory_peak
+    
+    if _current_run is None:
+        return
+    _current_run['total'] = time.perf_counter() - _current_run['start']
+    _current_run['memory_peak'] = memory_peak
+    _last_run = _current_run
+    _current_run = None
+
+
+def get_last_run():
+    """获取最近一次完成的检测计时数据"""
+    return _last_run
+
+
+def get_last_memory_peak():
+    """最近一次检测的内存峰值（字节），未记录时为 None"""
+    return _last_memory_peak
+
+
+def get_stage_summary(stages=None):
+    """
+    获取按总耗时降序排列的阶段汇总
+
+    Returns:
+        list: [(阶段, 次数, 总耗时秒)]
+    """
+    if stages is None:
+        stages = _last_run['stages'] if _last_run else {}
+    return sorted(((stage, count, total) for stage, (count, total) in stages.items()),
+                  key=lambda item: item[2], reverse=True)
+
+
+def get_object_summary(limit=5):
+    """
+    获取耗时最多的对象
+
+    Returns:
+        list: [(对象名, 总耗时秒)]
+    """
+    if not _last_run:
+        return []
+    totals = [(name, sum(total for _, total in stages.values()))
+              for name, stages in _last_run['objects'].items()]
+    totals.sort(key=lambda item: item[1], reverse=True)
+    return totals[:limit]
+
+
+def get_overlay_summary():
+    """获取视口叠加层构建的计时汇总"""
+    return get_stage_summary(_overlay_stats)
+
+
+def get_stage_label(stage):
+    """获取阶段显示名称"""
+    return STAGE_LABELS.get(stage, stage)
+
+
+def export_json(filepath):
+    """导出最近一次检测的汇总数据为 JSON"""
+    if not _last_run:
+        return False
+    data = {
+        'label': _last_run['label'],
+        'total': _last_run['total'],
+        'memory_peak': _last_run.get('memory_peak'),
+        'stages': {stage: {'count': count, 'total': total}
+                   for stage, (count, total) in _last_run['stages'].items()},
+        'objects': {name: {stage: {'count': count, 'total': total}
+                           for stage, (count, total) in stages.items()}
+                    for name, stages in _last_run['objects'].items()},
+        'overlay': {stage: {'count': count, 'total': total}
+                    for stage, (count, total) in _overlay_stats.items()},
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+    return True
+
+
+def export_chrome_trace(filepath):
+    """导出最近一次检测为 Chrome Trace 文件（可在 chrome://tracing 或 Perfetto 中打开）"""
+    if not _last_run:
+        return False
+    data = {
+        'traceEvents': _last_run['events'],
+        'displayTimeUnit': "ms",
+        'otherData': {'label': _last_run['label']},
+    }
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False)
+    return True
@@ -4,13 +4,30 @@
 
 import bpy
 import math
-from bpy.props import BoolProperty, FloatProperty, EnumProperty, FloatVectorProperty
-from . import mesh_helpers
+from bpy.props import (
+    BoolProperty, CollectionProperty, FloatProperty, EnumProperty, FloatVectorProperty, IntProperty, StringProperty
+)
+from . import profiling
+from .lazy import lazy_import
+
+# 属性更新回调第一次触发时才加载
+mesh_helpers = lazy_import(__package__ + ".mesh_helpers")
 
 # 自动更新处理器
 _auto_update_handler = None
 
 
+def count_enabled_checks(props):
+    """开启的检测功能数量"""
+    return sum((props.check_intersection, props.check_distortion, props.check_topology,
+                props.check_uv_overlap, props.check_thickness, props.check_clearance))
+
+
+def any_check_enabled(props):
+    """是否有任何检测功能开启"""
+    return count_enabled_checks(props) > 0
+
+
 def update_display_based_on_checks(context):
     """根据检测功能开关状态更新显示"""
     if not hasattr(context.scene, 'model_inspector'):
@@ -20,7 +37,7 @@ def update_display_based_on_checks(context):
     stats = mesh_helpers.get_inspection_stats()
     
     # 如果有任何检测功能开启且有数据，则启用显示
-    if ((props.check_intersection or props.check_distortion) and 
+    if (any_check_enabled(props) and 
         stats['objects_count'] > 0):
         mesh_helpers.enable_display()
     else:
@@ -37,6 +54,32 @@ def update_distortion_check_toggle(self, context):
     update_display_based_on_checks(context)
 
 
+def update_topology_check_toggle(self, context):
+    """拓扑检测开关回调"""
+    update_display_based_on_checks(context)
+    mesh_helpers.tag_redraw_view3d()
+
+
+def update_uv_overlap_check_toggle(self, context):
+    """UV 重叠检测开关回调"""
+    update_display_based_on_checks(context)
+
+
+def update_thickness_check_toggle(self, context):
+    """壁厚检测开关回调"""
+    update_display_based_on_checks(context)
+
+
+def update_clearance_check_toggle(self, context):
+    """间隙检测开关回调"""
+    update_display_based_on_checks(context)
+
+
+def update_overlay_display(self, context):
+    """叠加层的显示设置（颜色、线宽、显示模式、间隙距离等）变化时重绘视口"""
+    mesh_helpers.tag_redraw_view3d()
+
+
 def update_distortion_check(self, context):
     """扭曲检查参数更新回调"""
     # 如果自动更新开启，触发重新检查
@@ -44,6 +87,11 @@ def update_distortion_check(self, context):
         trigger_auto_update(context.scene)
 
 
+def update_profiling(self, context):
+    """性能分析开关回调"""
+    profiling.set_enabled(self.enable_profiling)
+
+
 def update_auto_update(self, context):
     """自动更新开关回调"""
     global _auto_update_handler
@@ -71,7 +119,7 @@ def frame_change_handler(scene):
     if hasattr(scene, 'model_inspector') and scene.model_inspector.auto_update:
         # 检查是否有任何检测功能开启
         props = scene.model_inspector
-        if props.check_intersection or props.check_distortion:
+        if any_check_enabled(props):
             trigger_auto_update(scene)
 
 
@@ -81,7 +129,8 @@ def trigger_auto_update(scene):
         props = scene.model_inspector
         
         # 根据开启的功能执行相应的检测
-        if props.check_intersection and props.check_distortion:
+        enabled_count = count_enabled_checks(props)
+        if enabled_count > 1:
             # 全面检测
             bpy.ops.mesh.model_inspector_check_all()
         elif props.check_intersection:
@@ -90,17 +139,41 @@ def trigger_auto_update(scene):
                 bpy.ops.mesh.model_inspector_check_self()
             elif props.intersect_type == 'OBJECTS':
                 bpy.ops.mesh.model_inspector_check_objects()
+            elif props.intersect_type == 'INSTANCES':
+                bpy.ops.mesh.model_inspector_check_instances()
             else:  # BOTH
                 bpy.ops.mesh.model_inspector_check_all()
         elif props.check_distortion:
             # 仅扭曲检测
             bpy.ops.mesh.model_inspector_check_distortion()
+        elif props.check_topology:
+            # 仅拓扑检测
+            bpy.ops.mesh.model_inspector_check_topology()
+        elif props.check_uv_overlap:
+            # 仅 UV 重叠检测
+            bpy.ops.mesh.model_inspector_check_uv_overlap()
+        elif props.check_thickness:
+            # 仅壁厚检测
+            bpy.ops.mesh.model_inspector_check_thickness()
+        elif props.check_clearance:
+            # 仅间隙检测
+            bpy.ops.mesh.model_inspector_check_clearance()
             
     except Exception as e:
         # 静默处理错误，避免在动画播放时频繁报错
         pass
 
 
+class ModelInspectorPairItem(bpy.types.PropertyGroup):
+    """对象间相交表中的一行（由窄相位结果直接生成）"""
+    object1: StringProperty(name="对象 A")  #type: ignore
+    object2: StringProperty(name="对象 B")  #type: ignore
+    faces1: IntProperty(name="A 相交面数")  #type: ignore
+    faces2: IntProperty(name="B 相交面数")  #type: ignore
+    bounds_min: FloatVectorProperty(name="重叠区域最小点", size=3, subtype='XYZ')  #type: ignore
+    bounds_max: FloatVectorProperty(name="重叠区域最大点", size=3, subtype='XYZ')  #type: ignore
+
+
 class ModelInspectorProperties(bpy.types.PropertyGroup):
     """模型检测器属性组"""
     
@@ -120,6 +193,7 @@ class ModelInspectorProperties(bpy.types.PropertyGroup):
             ('SELF', "自相交", "检测单个网格的自相交问题"),
             ('OBJECTS', "对象间相交", "检测多个对象之间的相交"),
             ('BOTH', "全面相交", "同时检测自相交和对象间相交"),
+            ('INSTANCES', "实例相交", "检测几何节点/集合实例之间以及实例与对象之间的相交"),
         ],
         default='SELF'
     )
@@ -152,6 +226,38 @@ class ModelInspectorProperties(bpy.types.PropertyGroup):
         max=1.0
     )
     
+    intersect_display: EnumProperty(  #type: ignore
+        name="相交显示",
+        description="相交结果的显示方式（交线需要在检测时额外计算）",
+        items=[
+            ('FACES', "相交面", "高亮整个相交面"),
+            ('LINES', "交线", "只绘制三角形之间的实际交线"),
+            ('BOTH', "面和交线", "同时显示相交面和交线"),
+        ],
+        default='FACES',
+        update=update_overlay_display
+    )
+    
+    contact_line_color: FloatVectorProperty(  #type: ignore
+        name="交线颜色",
+        description="相交交线的显示颜色",
+        default=(1.0, 1.0, 0.0, 1.0),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0,
+        update=update_overlay_display
+    )
+    
+    contact_line_width: FloatProperty(  #type: ignore
+        name="交线宽度",
+        description="相交交线的线宽（像素）",
+        default=2.0,
+        min=1.0,
+        max=10.0,
+        update=update_overlay_display
+    )
+    
     # 检测参数
     intersect_threshold: FloatProperty(  #type: ignore
         name="相交阈值",
@@ -162,6 +268,32 @@ class ModelInspectorProperties(bpy.types.PropertyGroup):
         precision=6
     )
     
+    intersect_limit_mode: EnumProperty(  #type: ignore
+        name="相交结果范围",
+        description="每个对象 / 对象对最多报告多少相交面（只需判断是否通过时使用，不计算交线）",
+        items=[
+            ('ALL', "全部", "找出全部相交面"),
+            ('FIRST', "是否相交", "每个对象 / 对象对只报告第一个相交面"),
+            ('FIRST_K', "前 K 个", "每个对象 / 对象对最多报告指定数量的相交面"),
+        ],
+        default='ALL'
+    )
+    
+    intersect_max_hits: IntProperty(  #type: ignore
+        name="最多相交面数",
+        description="前 K 个模式下每个对象 / 对象对最多找出的相交面数",
+        default=100,
+        min=1
+    )
+    
+    intersect_workers: IntProperty(  #type: ignore
+        name="并行数",
+        description="对象间 / 实例相交检测中对象对窄相位的进程数，1 为串行。只在 Linux/macOS 上用 blender -b 运行的脚本中生效，面板中不显示（界面中始终串行）",
+        default=1,
+        min=1,
+        max=64
+    )
+    
     # 扭曲检测属性
     check_distortion: BoolProperty(  #type: ignore
         name="启用扭曲检测",
@@ -190,6 +322,309 @@ class ModelInspectorProperties(bpy.types.PropertyGroup):
         max=1.0
     )
     
+    # 拓扑检测属性（导出前的非流形、零面积、重复顶点检查）
+    check_topology: BoolProperty(  #type: ignore
+        name="启用拓扑检测",
+        description="检查非流形边、零面积面和重复顶点",
+        default=False,
+        update=update_topology_check_toggle
+    )
+    
+    check_non_manifold: BoolProperty(  #type: ignore
+        name="非流形",
+        description="检查边界边、被三个及以上面共用的边以及相邻面法线方向不一致的边",
+        default=True,
+        update=update_topology_check_toggle
+    )
+    
+    check_zero_area: BoolProperty(  #type: ignore
+        name="零面积",
+        description="检查面积小于阈值的退化面",
+        default=True,
+        update=update_topology_check_toggle
+    )
+    
+    check_duplicate_verts: BoolProperty(  #type: ignore
+        name="重复顶点",
+        description="检查位置重合（在合并距离内）的顶点",
+        default=True,
+        update=update_topology_check_toggle
+    )
+    
+    zero_area_threshold: FloatProperty(  #type: ignore
+        name="面积阈值",
+        description="面积小于等于该值的面视为零面积面（局部空间）",
+        default=1e-8,
+        min=0.0,
+        max=1.0,
+        precision=8
+    )
+    
+    merge_distance: FloatProperty(  #type: ignore
+        name="合并距离",
+        description="距离在该值以内的顶点视为重复顶点",
+        default=0.0001,
+        min=0.0000001,
+        max=1.0,
+        precision=6,
+        subtype='DISTANCE'
+    )
+    
+    non_manifold_color: FloatVectorProperty(  #type: ignore
+        name="非流形颜色",
+        description="非流形边相邻面的显示颜色",
+        default=(0.9, 0.8, 0.1, 0.6),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0
+    )
+    
+    zero_area_color: FloatVectorProperty(  #type: ignore
+        name="零面积颜色",
+        description="零面积面的显示颜色",
+        default=(0.1, 0.8, 0.9, 0.6),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0
+    )
+    
+    duplicate_verts_color: FloatVectorProperty(  #type: ignore
+        name="重复顶点颜色",
+        description="包含重复顶点的面的显示颜色",
+        default=(0.3, 0.9, 0.3, 0.6),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0
+    )
+    
+    # UV 重叠检测属性（光照贴图 UV 重叠会导致烘焙渗色）
+    check_uv_overlap: BoolProperty(  #type: ignore
+        name="启用 UV 重叠检测",
+        description="检查活动 UV 层中互相重叠的面",
+        default=False,
+        update=update_uv_overlap_check_toggle
+    )
+    
+    uv_overlap_epsilon: FloatProperty(  #type: ignore
+        name="UV 容差",
+        description="UV 空间中重叠深度小于该值的面不视为重叠（共边的相邻面不会被标记）",
+        default=0.00001,
+        min=0.0,
+        max=0.01,
+        precision=6
+    )
+    
+    uv_overlap_color: FloatVectorProperty(  #type: ignore
+        name="UV 重叠颜色",
+        description="UV 重叠面的显示颜色",
+        default=(0.2, 0.4, 1.0, 0.6),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0
+    )
+    
+    # 壁厚检测属性（3D 打印和碰撞代理模型）
+    check_thickness: BoolProperty(  #type: ignore
+        name="启用壁厚检测",
+        description="从面中心向内投射射线，检查壁厚小于最小值的面",
+        default=False,
+        update=update_thickness_check_toggle
+    )
+    
+    min_thickness: FloatProperty(  #type: ignore
+        name="最小壁厚",
+        description="对侧表面距离小于该值的面视为过薄（世界空间，按对象缩放换算）",
+        default=0.001,
+        min=0.0000001,
+        soft_max=1.0,
+        precision=5,
+        subtype='DISTANCE'
+    )
+    
+    thickness_samples: IntProperty(  #type: ignore
+        name="采样面数",
+        description="每个对象最多检测的面数（均匀抽样），0 表示检测全部面",
+        default=0,
+        min=0
+    )
+    
+    thickness_workers: IntProperty(  #type: ignore
+        name="进程数",
+        description="射线投射使用的进程数。只在 Linux/macOS 上用 blender -b 运行的脚本中生效，面板中不显示（界面中始终单进程）",
+        default=1,
+        min=1,
+        max=64
+    )
+    
+    thickness_color: FloatVectorProperty(  #type: ignore
+        name="过薄面颜色",
+        description="壁厚不足的面的显示颜色",
+        default=(1.0, 0.6, 0.0, 0.6),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0
+    )
+    
+    # 间隙检测属性（如服装层与身体之间的最小距离）
+    check_clearance: BoolProperty(  #type: ignore
+        name="启用间隙检测",
+        description="检查对象之间距离小于间隙值的面（不要求相交）",
+        default=False,
+        update=update_clearance_check_toggle
+    )
+    
+    clearance_distance: FloatProperty(  #type: ignore
+        name="间隙距离",
+        description="对象之间的距离小于该值时标记（世界空间）",
+        default=0.005,
+        min=0.0000001,
+        soft_max=1.0,
+        precision=5,
+        subtype='DISTANCE',
+        update=update_overlay_display
+    )
+    
+    clearance_samples: IntProperty(  #type: ignore
+        name="采样顶点数",
+        description="每个对象最多采样的顶点数（均匀抽样），0 表示全部顶点",
+        default=0,
+        min=0
+    )
+    
+    clearance_color: FloatVectorProperty(  #type: ignore
+        name="间隙近处颜色",
+        description="距离接近 0 的面的显示颜色",
+        default=(1.0, 0.0, 0.3, 0.7),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0,
+        update=update_overlay_display
+    )
+    
+    clearance_far_color: FloatVectorProperty(  #type: ignore
+        name="间隙远处颜色",
+        description="距离接近间隙值的面的显示颜色",
+        default=(1.0, 0.9, 0.2, 0.4),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0,
+        update=update_overlay_display
+    )
+    
+    # 叠加层显示模式
+    overlay_mode: EnumProperty(  #type: ignore
+        name="显示模式",
+        description="问题面的叠加层显示方式",
+        items=[
+            ('FLAGS', "标记", "按检测类型使用单一颜色标记问题面"),
+            ('HEATMAP', "热力图", "按严重程度（扭曲角、壁厚、间隙距离）通过色带着色，其余结果仍按类型颜色显示"),
+        ],
+        default='FLAGS',
+        update=update_overlay_display
+    )
+    
+    heatmap_alpha: FloatProperty(  #type: ignore
+        name="热力图透明度",
+        description="热力图叠加层的不透明度",
+        default=0.7,
+        min=0.0,
+        max=1.0,
+        subtype='FACTOR',
+        update=update_overlay_display
+    )
+    
+    highlight_new_problems: BoolProperty(  #type: ignore
+        name="高亮新增问题",
+        description="自动更新时用单独颜色高亮上一帧没有的问题面，便于定位问题从哪一帧开始出现",
+        default=True,
+        update=update_overlay_display
+    )
+    
+    new_problem_color: FloatVectorProperty(  #type: ignore
+        name="新增问题颜色",
+        description="上一帧没有的问题面的高亮颜色",
+        default=(0.0, 1.0, 1.0, 0.8),
+        size=4,
+        subtype='COLOR',
+        min=0.0,
+        max=1.0,
+        update=update_overlay_display
+    )
+    
+    overlay_frustum_cull: BoolProperty(  #type: ignore
+        name="视锥体剔除",
+        description="不绘制包围盒完全在视野外的检测结果",
+        default=True,
+        update=update_overlay_display
+    )
+    
+    overlay_face_limit: IntProperty(  #type: ignore
+        name="绘制面数上限",
+        description="叠加层最多绘制的问题面数，超出时按结果大小分配配额并优先绘制最严重的面，0 表示不限制",
+        default=200000,
+        min=0,
+        soft_max=2000000,
+        update=update_overlay_display
+    )
+    
+    # 性能分析
+    enable_profiling: BoolProperty(  #type: ignore
+        name="性能分析",
+        description="记录检测各阶段耗时（依赖图评估、BVH 构建、重叠查询等）并在检测信息中显示",
+        default=False,
+        update=update_profiling
+    )
+    
+    track_memory: BoolProperty(  #type: ignore
+        name="记录内存峰值",
+        description="用 tracemalloc 记录每次检测的内存峰值（只统计 Python / NumPy 分配），会拖慢检测",
+        default=False
+    )
+    
+    # 流式检测
+    streaming_mode: BoolProperty(  #type: ignore
+        name="流式检测",
+        description="大量对象检测时按空间顺序处理对象，几何缓存超过上限时释放最久未使用的网格快照，限制内存占用",
+        default=False
+    )
+    
+    streaming_cache_mb: IntProperty(  #type: ignore
+        name="几何缓存上限 (MB)",
+        description="流式检测时同时保留的网格快照（顶点、三角形和 BVH）的估算内存上限",
+        default=4096,
+        min=64,
+        soft_max=65536
+    )
+    
+    # 结果缓存
+    use_result_cache: BoolProperty(  #type: ignore
+        name="结果缓存",
+        description="将检测结果按网格内容哈希缓存到磁盘，未改动的对象直接读取缓存结果",
+        default=False
+    )
+    
+    cache_directory: StringProperty(  #type: ignore
+        name="缓存目录",
+        description="结果缓存目录（留空使用系统临时目录）",
+        default="",
+        subtype='DIR_PATH'
+    )
+    
+    cache_max_size_mb: IntProperty(  #type: ignore
+        name="缓存上限 (MB)",
+        description="缓存目录超过该大小时删除最久未使用的结果",
+        default=512,
+        min=1,
+        soft_max=8192
+    )
+    
     # 统计信息
     last_check_results: bpy.props.StringProperty(  #type: ignore
         name="最后检测结果",
@@ -203,10 +638,19 @@ class ModelInspectorProperties(bpy.types.PropertyGroup):
         description="最后一次检测的对象名称",
         default=""
     )
+    
+    # 对象间相交表
+    intersection_pairs: CollectionProperty(type=ModelInspectorPairItem)  #type: ignore
+    
+    intersection_pair_index: IntProperty(  #type: ignore
+        name="当前相交对",
+        default=0
+    )
 
 
 def register():
     """注册属性"""
+    bpy.utils.register_class(ModelInspectorPairItem)
     bpy.utils.register_class(ModelInspectorProperties)
     bpy.types.Scene.model_inspector = bpy.props.PointerProperty(type=ModelInspectorProperties)  #type: ignore
 
@@ -227,3 +671,4 @@ def unregister():
     
     del bpy.types.Scene.model_inspector
     bpy.utils.unregister_class(ModelInspectorProperties)
+    bpy.utils.unregister_class(ModelInspectorPairItem)
@@ -0,0 +1,167 @@
+"""
+批量 BVH 查询（射线投射、最近点）
+BVHTree.ray_cast / find_nearest 每次只能查询一个点，这里把查询按批次组织，批内在紧凑循环中调用，
+射线投射可选择用多进程并行处理各批（仅限后台模式且支持 fork 的平台：子进程直接继承已构建的 BVH，无需序列化）。
+"""
+
+import multiprocessing
+import sys
+
+import bpy
+import numpy as np
+from mathutils import Vector
+
+# 每批射线数量
+RAY_BATCH_SIZE = 65536
+
+# 射线起点沿射线方向前移的距离（跳过起点所在面时使用）
+SKIP_OFFSET = 1e-6
+
+# 当前任务（fork 前设置，子进程继承）
+_job = None
+
+
+def can_use_processes():
+    """
+    当前进程能否 fork 工作进程（Windows 不支持 fork）
+    交互式 Blender 进程有多个线程并持有 GL 上下文，fork 后子进程可能死锁或崩溃，因此只在后台模式（-b）下使用
+    """
+    return (bpy.app.background and sys.platform != 'win32'
+            and 'fork' in multiprocessing.get_all_start_methods())
+
+
+def _cast_range(start, end):
+    """投射 [start, end) 范围内的射线，返回 (命中三角形索引列表, 命中距离列表)"""
+    tree, origins, directions, distance, ray_owners, tri_owners = _job
+    ray_cast = tree.ray_cast
+    hit_indices = []
+    hit_distances = []
+
+    for i in range(start, end):
+        origin = origins[i]
+        direction = directions[i]
+        location, _, index, dist = ray_cast(origin, direction, distance)
+        if index is not None and ray_owners is not None:
+            # 命中射线所属的面（非平面面的其他三角形）时，从命中点之后继续投射
+            travelled = 0.0
+            while index is not None and tri_owners[index] == ray_owners[i]:
+                travelled += dist + SKIP_OFFSET
+                if travelled >= distance:
+                    index = None
+                    break
+                location, _, index, dist = ray_cast(
+                    location + Vector(direction) * SKIP_OFFSET, direction, distance - travelled
+                )
+            if index is not None:
+                dist += travelled
+        if index is None:
+            hit_indices.append(-1)
+            hit_distances.append(np.inf)
+        else:
+            hit_indices.append(index)
+            hit_distances.append(dist)
+
+    return hit_indices, hit_distances
+
+
+def cast_rays(tree, origins, directions, distance, ray_owners=None, tri_owners=None, workers=1):
+    """
+    批量投射射线
+
+    Args:
+        tree: BVHTree
+        origins, directions: (n, 3) 射线起点和方向
+        distance: 最大投射距离
+        ray_owners, tri_owners: 可选，射线和三角形所属的面索引，命中自身所属面时忽略
+        workers: 进程数，大于 1 且可以 fork 时（见 can_use_processes）并行投射，否则串行
+
+    Returns:
+        tuple: (命中三角形索引 (n,) int32，未命中为 -1, 命中距离 (n,) float64，未命中为 inf)
+    """
+    global _job
+    count = len(origins)
+    if count == 0:
+        return np.empty(0, dtype=np.int32), np.empty(0, dtype=np.float64)
+
+    _job = (tree, np.asarray(origins, dtype=np.float64).tolist(),
+            np.asarray(directions, dtype=np.float64).tolist(), float(distance),
+            ray_owners, tri_owners)
+    ranges = [(start, min(start + RAY_BATCH_SIZE, count)) for start in range(0, count, RAY_BATCH_SIZE)]
+
+    try:
+        if workers > 1 and len(ranges) > 1 and can_use_processes():
+            with multiprocessing.get_context('fork').Pool(min(workers, len(ranges))) as pool:
+                chunks = pool.starmap(_cast_range, ranges)
+        else:
+            chunks = [_cast_range(start, end) for start, end in ranges]
+    finally:
+        _job = None
+
+    hit_indices = np.fromiter((i for chunk in chunks for i in chunk[0]), dtype=np.int32, count=count)
+    hit_distances = np.fromiter((d for chunk in chunks for d in chunk[1]), dtype=np.float64, count=count)
+    return hit_indices, hit_distances
+
+
+def count_crossings(tree, origins, direction, max_crossings=10000):
+    """
+    批量统计射线穿过表面的次数（奇偶判定点是否在封闭网格内部）
+    每条射线命中后从命中点之后继续投射，直到没有命中。
+
+    Args:
+        tree: BVHTree
+        origins: (n, 3) 射线起点
+        direction: (3,) 所有射线共用的方向
+
+    Returns:
+        np.ndarray: (n,) int32 穿过次数
+    """
+    ray_cast = tree.ray_cast
+    direction = Vector(direction).normalized()
+    step = direction * SKIP_OFFSET
+    counts = np.zeros(len(origins), dtype=np.int32)
+
+    for i, origin in enumerate(np.asarray(origins, dtype=np.float64).tolist()):
+        location, _, index, _ = ray_cast(origin, direction)
+        crossings = 0
+        while index is not None and crossings < max_crossings:
+            crossings += 1
+            location, _, index, _ = ray_cast(location + step, direction)
+        counts[i] = crossings
+
+    return counts
+
+
+def find_nearest_batch(tree, points, distance):
+    """
+    批量最近点查询
+
+    Args:
+        tree: BVHTree
+        points: (n, 3) 查询点
+        distance: 最大查询距离（超出范围视为没有最近点）
+
+    Returns:
+        tuple: (最近点 (n, 3) float64，未找到为 nan, 是否找到 (n,) bool)
+    """
+    count = len(points)
+    locations = np.full((count, 3), np.nan, dtype=np.float64)
+    found = np.zeros(count, dtype=bool)
+    if count == 0:
+        return locations, found
+
+    find_nearest = tree.find_nearest
+    point_list = np.asarray(points, dtype=np.float64).tolist()
+    for start in range(0, count, RAY_BATCH_SIZE):
+        end = min(start + RAY_BATCH_SIZE, count)
+        hit_rows = []
+        hit_locations = []
+        for i in range(start, end):
+            location, _, index, _ = find_nearest(point_list[i], distance)
+            if index is not None:
+                hit_rows.append(i)
+                hit_locations.append(location[:])
+        if hit_rows:
+            locations[hit_rows] = hit_locations
+            found[hit_rows] = True
+
+    return locations, found
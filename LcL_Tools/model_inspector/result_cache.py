@@ -0,0 +1,241 @@
+"""
+模型检测结果磁盘缓存
+以评估网格内容哈希 + 世界矩阵 + 检测参数为键，保存压缩后的问题面索引数组，
+未改动的对象在重新打开场景或批处理检测时可直接从磁盘读取结果
+"""
+
+import hashlib
+import os
+import struct
+import tempfile
+import zlib
+
+import numpy as np
+
+# 常量定义
+CACHE_FOLDER = "LcL_ModelInspector_Cache"
+CACHE_SUFFIX = ".lclcache"
+CACHE_MAGIC = b"LCLC"
+CACHE_VERSION = 3  # 检测算法或文件格式变化时递增，使旧缓存失效
+
+# 缓存设置
+_enabled = False
+_directory = ""
+_max_size_bytes = 512 * 1024 * 1024
+_approx_size = None  # 缓存目录的大致大小（惰性统计）
+
+# 命中统计
+_hits = 0
+_misses = 0
+
+
+def get_default_cache_directory():
+    """获取默认缓存目录（系统临时目录下）"""
+    return os.path.join(tempfile.gettempdir(), CACHE_FOLDER)
+
+
+def configure(enabled, directory="", max_size_mb=512):
+    """配置缓存（目录为空时使用默认目录）"""
+    global _enabled, _directory, _max_size_bytes, _approx_size
+    directory = directory or get_default_cache_directory()
+    if directory != _directory:
+        _approx_size = None
+    _enabled = bool(enabled)
+    _directory = directory
+    _max_size_bytes = max(1, int(max_size_mb)) * 1024 * 1024
+
+
+def is_enabled():
+    """缓存是否启用"""
+    return _enabled
+
+
+def get_cache_directory():
+    """获取当前缓存目录"""
+    return _directory or get_default_cache_directory()
+
+
+def get_hit_stats():
+    """获取命中统计 (命中, 未命中)"""
+    return _hits, _misses
+
+
+# 键计算
+#################################################
+
+
+def buffers_digest(*arrays):
+    """计算一组 NumPy 缓冲的内容哈希"""
+    h = hashlib.blake2b(digest_size=20)
+    for a in arrays:
+        a = np.ascontiguousarray(a)
+        h.update(f"{a.dtype.str}{a.shape}".encode())
+        h.update(a.tobytes())
+    return h.hexdigest()
+
+
+def make_key(check_type, digests, matrices=(), params=()):
+    """
+    组合缓存键
+
+    Args:
+        check_type: 检测类型（如 'SELF', 'PAIR', 'DISTORTION'）
+        digests: 参与检测的网格哈希列表
+        matrices: 对应的世界矩阵列表（结果与位置无关时可为空）
+        params: 检测参数（阈值、角度等）
+    """
+    h = hashlib.blake2b(digest_size=20)
+    h.update(f"{CACHE_VERSION}:{check_type}".encode())
+    for digest in digests:
+        h.update(digest.encode())
+    for matrix in matrices:
+        h.update(np.array(matrix, dtype=np.float64).tobytes())
+    h.update(repr(tuple(float(p) for p in params)).encode())
+    return h.hexdigest()
+
+
+# 读写
+#################################################
+
+
+def _cache_path(key):
+    # 两级目录，避免单个目录下文件过多
+    return os.path.join(get_cache_directory(), key[:2], key + CACHE_SUFFIX)
+
+
+def load(key):
+    """
+    读取缓存
+
+    Returns:
+        list[np.ndarray] | None: 面索引数组列表，未命中时返回 None
+    """
+    global _hits, _misses
+    path = _cache_path(key)
+    try:
+        with open(path, "rb") as f:
+            data = f.read()
+    except OSError:
+        _misses += 1
+        return None
+
+    arrays = _decode(data)
+    if arrays is None:
+        _misses += 1
+        return None
+
+    # 更新访问时间，驱逐时按最近使用排序
+    try:
+        os.utime(path, None)
+    except OSError:
+        pass
+    _hits += 1
+    return arrays
+
+
+def store(key, arrays):
+    """写入缓存（先写临时文件再替换，避免并行批处理时读到半个文件）"""
+    global _approx_size
+    path = _cache_path(key)
+    data = _encode(arrays)
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "wb") as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    except OSError:
+        return False
+
+    if _approx_size is None:
+        _approx_size = _scan_directory()[1]
+    else:
+        _approx_size += len(data)
+    if _approx_size > _max_size_bytes:
+        evict()
+    return True
+
+
+def _encode(arrays):
+    arrays = [np.ascontiguousarray(a, dtype=np.int32) for a in arrays]
+    header = CACHE_MAGIC + struct.pack("<II", CACHE_VERSION, len(arrays))
+    header += struct.pack(f"<{len(arrays)}I", *(len(a) for a in arrays))
+    payload = b"".join(a.tobytes() for a in arrays)
+    return header + zlib.compress(payload, 6)
+
+
+def _decode(data):
+    try:
+        if data[:4] != CACHE_MAGIC:
+            return None
+        version, count = struct.unpack_from("<II", data, 4)
+        if version != CACHE_VERSION:
+            return None
+        offset = 12
+        lengths = struct.unpack_from(f"<{count}I", data, offset)
+        offset += 4 * count
+        flat = np.frombuffer(zlib.decompress(data[offset:]), dtype=np.int32)
+    except (struct.error, zlib.error, ValueError):
+        # 文件损坏或被截断（解压后的长度不是 int32 的整数倍时 np.frombuffer 抛出 ValueError），视为未命中
+        return None
+
+    if len(flat) != sum(lengths):
+        return None
+    return np.split(flat, np.cumsum(lengths)[:-1]) if count else []
+
+
+# 容量管理
+#################################################
+
+
+def _scan_directory():
+    """扫描缓存目录，返回 ([(修改时间, 大小, 路径)], 总大小)"""
+    entries = []
+    total = 0
+    for root, _, files in os.walk(get_cache_directory()):
+        for name in files:
+            if not name.endswith(CACHE_SUFFIX):
+                continue
+            path = os.path.join(root, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+            total += stat.st_size
+    return entries, total
+
+
+def evict(target_ratio=0.8):
+    """按最近使用时间删除旧缓存，直到总大小低于上限的 target_ratio"""
+    global _approx_size
+    entries, total = _scan_directory()
+    target = _max_size_bytes * target_ratio
+    entries.sort()
+    for _, size, path in entries:
+        if total <= target:
+            break
+        try:
+            os.remove(path)
+            total -= size
+        except OSError:
+            continue
+    _approx_size = total
+
+
+def clear():
+    """删除全部缓存文件"""
+    global _approx_size
+    entries, _ = _scan_directory()
+    for _, _, path in entries:
+        try:
+            os.remove(path)
+        except OSError:
+            continue
+    _approx_size = 0
+
+
+def get_cache_info():
+    """获取缓存目录信息 (文件数, 总大小字节)"""
+    entries, total = _scan_directory()
+    return len(entries), total
@@ -4,9 +4,77 @@ Model Inspector User Interface
 """
 
 import bpy
-from bpy.types import Panel
-from . import mesh_helpers
-import math
+from bpy.props import EnumProperty
+from bpy.types import Panel, UIList
+from . import profiling
+from .lazy import is_loaded, lazy_import
+from .properties import count_enabled_checks
+
+# 第一次执行检测时才加载，在此之前面板显示空统计，重绘不会触发加载
+mesh_helpers = lazy_import(__package__ + ".mesh_helpers")
+result_cache = lazy_import(__package__ + ".result_cache")
+
+# 还没有执行过检测时的统计
+EMPTY_STATS = {
+    'objects_count': 0,
+    'faces_count': 0,
+    'intersect_faces': 0,
+    'distorted_faces': 0,
+    'topology_faces': 0,
+    'uv_overlap_faces': 0,
+    'thin_wall_faces': 0,
+    'clearance_faces': 0,
+    'is_display_enabled': False,
+}
+
+
+def get_inspection_stats():
+    """获取检测统计（检测模块还没有加载时返回空统计，不触发加载）"""
+    if not is_loaded(mesh_helpers):
+        return EMPTY_STATS
+    return mesh_helpers.get_inspection_stats()
+
+
+class MESH_UL_ModelInspector_Pairs(UIList):
+    """对象间相交表（可按相交面数或名称排序，按名称过滤）"""
+    
+    sort_by: EnumProperty(  #type: ignore
+        name="排序",
+        items=[
+            ('FACES', "面数", "按相交面总数降序"),
+            ('NAME', "名称", "按对象名称排序"),
+        ],
+        default='FACES'
+    )
+    
+    def draw_item(self, context, layout, data, item, icon, active_data, active_propname, index):
+        row = layout.row(align=True)
+        row.label(text=f"{item.object1} ↔ {item.object2}", icon='MOD_BOOLEAN')
+        row.label(text=f"{item.faces1} / {item.faces2}")
+        op = row.operator("mesh.model_inspector_frame_pair", text="", icon='VIEWZOOM', emboss=False)
+        op.index = index
+    
+    def draw_filter(self, context, layout):
+        row = layout.row(align=True)
+        row.prop(self, "filter_name", text="")
+        row.prop(self, "sort_by", expand=True)
+    
+    def filter_items(self, context, data, propname):
+        items = getattr(data, propname)
+        pattern = self.filter_name.lower()
+        flags = [
+            self.bitflag_filter_item
+            if not pattern or pattern in item.object1.lower() or pattern in item.object2.lower() else 0
+            for item in items
+        ]
+        helper = bpy.types.UI_UL_list
+        if self.sort_by == 'FACES':
+            order = helper.sort_items_helper(
+                [(i, -(item.faces1 + item.faces2)) for i, item in enumerate(items)], key=lambda entry: entry[1]
+            )
+        else:
+            order = helper.sort_items_by_name(items, "object1")
+        return flags, order
 
 
 class VIEW3D_PT_ModelInspectorMain(Panel):
@@ -22,7 +90,7 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
         props = context.scene.model_inspector
         
         # 获取统计数据
-        stats = mesh_helpers.get_inspection_stats()
+        stats = get_inspection_stats()
         
         # 检测功能开关区域 - 参考check_toolbox布局
         box = layout.box()
@@ -49,6 +117,15 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
             sub_row.enabled = props.check_intersection
             sub_row.prop(props, "intersect_type", text="类型")
             sub_row.prop(props, "intersect_threshold", text="阈值")
+            sub_row = box.row(align=True)
+            sub_row.prop(props, "intersect_limit_mode", text="范围")
+            if props.intersect_limit_mode == 'FIRST_K':
+                sub_row.prop(props, "intersect_max_hits", text="K")
+            sub_row = box.row(align=True)
+            sub_row.prop(props, "intersect_display", text="显示")
+            if props.intersect_display != 'FACES':
+                sub_row.prop(props, "contact_line_color", text="")
+                sub_row.prop(props, "contact_line_width", text="线宽")
         
         # 扭曲检测行
         row = box.row()
@@ -71,6 +148,107 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
             sub_row.enabled = props.check_distortion
             sub_row.prop(props, "distortion_angle", text="扭曲角度")
         
+        # 拓扑检测行
+        row = box.row()
+        col = row.column()
+        col.prop(props, "check_topology", text="拓扑检测")
+        
+        col2 = row.column_flow(columns=3)
+        col2.enabled = props.check_topology
+        col2.label(text="")
+        if stats['topology_faces'] > 0:
+            col2.label(text=f"{stats['topology_faces']}", icon='MESH_DATA')
+        else:
+            col2.label(text="0")
+        # 占位符
+        col2.label(text="")
+        
+        # 拓扑检测子选项
+        if props.check_topology:
+            sub_col = box.column(align=True)
+            row = sub_col.row(align=True)
+            row.prop(props, "check_non_manifold")
+            row.prop(props, "non_manifold_color", text="")
+            row = sub_col.row(align=True)
+            row.prop(props, "check_zero_area")
+            row.prop(props, "zero_area_color", text="")
+            row.prop(props, "zero_area_threshold", text="阈值")
+            row = sub_col.row(align=True)
+            row.prop(props, "check_duplicate_verts")
+            row.prop(props, "duplicate_verts_color", text="")
+            row.prop(props, "merge_distance", text="距离")
+        
+        # UV 重叠检测行
+        row = box.row()
+        col = row.column()
+        col.prop(props, "check_uv_overlap", text="UV 重叠")
+        
+        col2 = row.column_flow(columns=3)
+        col2.enabled = props.check_uv_overlap
+        col2.prop(props, "uv_overlap_color", text="")
+        if stats['uv_overlap_faces'] > 0:
+            col2.label(text=f"{stats['uv_overlap_faces']}", icon='UV')
+        else:
+            col2.label(text="0")
+        # 占位符
+        col2.label(text="")
+        
+        if props.check_uv_overlap:
+            sub_row = box.row()
+            sub_row.prop(props, "uv_overlap_epsilon", text="UV 容差")
+        
+        # 壁厚检测行
+        row = box.row()
+        col = row.column()
+        col.prop(props, "check_thickness", text="壁厚检测")
+        
+        col2 = row.column_flow(columns=3)
+        col2.enabled = props.check_thickness
+        col2.prop(props, "thickness_color", text="")
+        if stats['thin_wall_faces'] > 0:
+            col2.label(text=f"{stats['thin_wall_faces']}", icon='MOD_THICKNESS')
+        else:
+            col2.label(text="0")
+        # 占位符
+        col2.label(text="")
+        
+        if props.check_thickness:
+            sub_col = box.column(align=True)
+            sub_col.prop(props, "min_thickness", text="最小壁厚")
+            row = sub_col.row(align=True)
+            row.prop(props, "thickness_samples", text="采样")
+        
+        # 间隙检测行
+        row = box.row()
+        col = row.column()
+        col.prop(props, "check_clearance", text="间隙检测")
+        
+        col2 = row.column_flow(columns=3)
+        col2.enabled = props.check_clearance
+        col2.prop(props, "clearance_color", text="")
+        if stats['clearance_faces'] > 0:
+            col2.label(text=f"{stats['clearance_faces']}", icon='DRIVER_DISTANCE')
+        else:
+            col2.label(text="0")
+        col2.prop(props, "clearance_far_color", text="")
+        
+        if props.check_clearance:
+            sub_row = box.row(align=True)
+            sub_row.prop(props, "clearance_distance", text="间隙")
+            sub_row.prop(props, "clearance_samples", text="采样")
+        
+        # 叠加层显示模式
+        row = box.row(align=True)
+        row.prop(props, "overlay_mode", expand=True)
+        if props.overlay_mode == 'HEATMAP':
+            row.prop(props, "heatmap_alpha", text="透明度")
+        row = box.row(align=True)
+        row.prop(props, "overlay_frustum_cull", text="视锥剔除", toggle=True)
+        row.prop(props, "overlay_face_limit", text="面数上限")
+        omitted = mesh_helpers.get_overlay_draw_stats()['omitted'] if is_loaded(mesh_helpers) else 0
+        if omitted > 0:
+            box.label(text=f"已省略 {omitted} 个较轻的问题面（面数上限）", icon='INFO')
+        
         # 检测操作按钮和自动更新
         layout.separator(factor=0.5)
         box = layout.box()
@@ -83,8 +261,8 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
         # 当自动更新关闭时显示检测按钮
         if not props.auto_update:
             # 根据开启的功能显示相应按钮
-            if props.check_intersection and props.check_distortion:
-                # 两个功能都开启
+            if count_enabled_checks(props) > 1:
+                # 多个功能开启
                 row.scale_y = 1.4
                 row.operator("mesh.model_inspector_check_all", 
                             text="检测", icon='NONE')
@@ -98,6 +276,9 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
                 elif props.intersect_type == 'OBJECTS':
                     row.operator("mesh.model_inspector_check_objects", 
                                text="检测", icon='NONE')
+                elif props.intersect_type == 'INSTANCES':
+                    row.operator("mesh.model_inspector_check_instances", 
+                               text="检测", icon='NONE')
                 else:  # BOTH
                     row.operator("mesh.model_inspector_check_all", 
                                text="检测", icon='NONE')
@@ -108,6 +289,30 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
                 row.operator("mesh.model_inspector_check_distortion", 
                             text="检测", icon='NONE')
             
+            elif props.check_topology:
+                # 仅拓扑检测
+                row.scale_y = 1.4
+                row.operator("mesh.model_inspector_check_topology", 
+                            text="检测", icon='NONE')
+            
+            elif props.check_uv_overlap:
+                # 仅 UV 重叠检测
+                row.scale_y = 1.4
+                row.operator("mesh.model_inspector_check_uv_overlap", 
+                            text="检测", icon='NONE')
+            
+            elif props.check_thickness:
+                # 仅壁厚检测
+                row.scale_y = 1.4
+                row.operator("mesh.model_inspector_check_thickness", 
+                            text="检测", icon='NONE')
+            
+            elif props.check_clearance:
+                # 仅间隙检测
+                row.scale_y = 1.4
+                row.operator("mesh.model_inspector_check_clearance", 
+                            text="检测", icon='NONE')
+            
             else:
                 # 都未开启
                 row.enabled = False
@@ -116,6 +321,27 @@ class VIEW3D_PT_ModelInspectorMain(Panel):
             # 自动更新开启时的提示
             info_row = col.row()
             info_row.label(text="自动更新已启用，检测将在每帧自动执行", icon='TIME')
+            row = col.row(align=True)
+            row.prop(props, "highlight_new_problems", text="高亮新增问题")
+            row.prop(props, "new_problem_color", text="")
+            new_count = mesh_helpers.get_new_problem_count() if is_loaded(mesh_helpers) else 0
+            if props.highlight_new_problems and new_count > 0:
+                col.label(text=f"本帧新增 {new_count} 个问题面", icon='ERROR')
+        
+        row = col.row(align=True)
+        row.prop(props, "enable_profiling", text="性能分析", icon='TIME')
+        row.prop(props, "track_memory", text="内存峰值", icon='MEMORY')
+        row = col.row(align=True)
+        row.prop(props, "streaming_mode", text="流式检测", icon='SORTTIME')
+        if props.streaming_mode:
+            row.prop(props, "streaming_cache_mb", text="上限 (MB)")
+        col.prop(props, "use_result_cache", text="结果缓存", icon='FILE_CACHE')
+        if props.use_result_cache:
+            sub_col = col.column(align=True)
+            sub_col.prop(props, "cache_directory", text="")
+            row = sub_col.row(align=True)
+            row.prop(props, "cache_max_size_mb", text="上限 (MB)")
+            row.operator("mesh.model_inspector_clear_cache", text="", icon='TRASH')
         
         # 当前检测对象显示
         if stats['objects_count'] > 0:
@@ -148,8 +374,9 @@ class VIEW3D_PT_ModelInspectorResults(Panel):
         layout = self.layout
         props = context.scene.model_inspector
         
-        # 详细统计信息
-        stats = mesh_helpers.get_inspection_stats()
+        # 详细统计信息（还没有执行过检测时下面的报告都为空）
+        inspected = is_loaded(mesh_helpers)
+        stats = get_inspection_stats()
         
         if stats['objects_count'] > 0:
             layout.separator()
@@ -164,35 +391,131 @@ class VIEW3D_PT_ModelInspectorResults(Panel):
                 col.label(text=f"• 相交面: {stats['intersect_faces']}")
             if stats['distorted_faces'] > 0:
                 col.label(text=f"• 扭曲面: {stats['distorted_faces']}")
+            if stats['topology_faces'] > 0:
+                col.label(text=f"• 拓扑问题面: {stats['topology_faces']}")
+            if stats['uv_overlap_faces'] > 0:
+                col.label(text=f"• UV 重叠面: {stats['uv_overlap_faces']}")
+            if stats['thin_wall_faces'] > 0:
+                col.label(text=f"• 过薄面: {stats['thin_wall_faces']}")
+            if stats['clearance_faces'] > 0:
+                col.label(text=f"• 间隙不足面: {stats['clearance_faces']}")
             
-            # 按对象显示详细信息
-            inspection_objects = {}
-            for data in mesh_helpers._inspection_data:
-                obj_name = data['object'].name if data['object'] else "未知"
-                face_count = len(data['faces'])
-                inspect_type = data.get('inspection_type', 'INTERSECT')
-                
-                if obj_name not in inspection_objects:
-                    inspection_objects[obj_name] = {'INTERSECT': 0, 'DISTORTION': 0}
-                inspection_objects[obj_name][inspect_type] += face_count
+            # 按对象显示详细信息（缓存快照，仅在检测结果变化时重建）
+            inspection_objects = mesh_helpers.get_inspection_breakdown()
             
             if inspection_objects:
                 col.separator()
                 col.label(text="按对象分类:")
                 for obj_name, counts in inspection_objects.items():
-                    info_parts = []
-                    if counts['INTERSECT'] > 0:
-                        info_parts.append(f"相交{counts['INTERSECT']}")
-                    if counts['DISTORTION'] > 0:
-                        info_parts.append(f"扭曲{counts['DISTORTION']}")
+                    info_parts = [
+                        f"{mesh_helpers.INSPECTION_TYPE_LABELS.get(inspect_type, inspect_type)}{count}"
+                        for inspect_type, count in counts.items() if count > 0
+                    ]
                     
                     if info_parts:
                         info_text = f"• {obj_name}: {', '.join(info_parts)}"
                         col.label(text=info_text, icon='OBJECT_DATA')
+        
+        # 间隙检测的最小距离
+        min_values = mesh_helpers.get_min_values() if inspected else {}
+        if min_values:
+            box = layout.box()
+            box.label(text="最小间隙:", icon='DRIVER_DISTANCE')
+            col = box.column()
+            for obj_name, value in sorted(min_values.items(), key=lambda item: item[1])[:20]:
+                col.label(text=f"• {obj_name}: {value:.5f}")
+        
+        # 实例相交报告
+        instance_report = mesh_helpers.get_instance_report() if inspected else []
+        if instance_report:
+            box = layout.box()
+            box.label(text=f"实例相交: {len(instance_report)} 对", icon='OUTLINER_OB_GROUP_INSTANCE')
+            col = box.column()
+            for row_data in instance_report[:20]:
+                col.label(text=f"• {row_data['item1']} ↔ {row_data['item2']}: "
+                               f"{row_data['faces1']}/{row_data['faces2']}")
+            if len(instance_report) > 20:
+                col.label(text=f"... 还有 {len(instance_report) - 20} 对")
+        
+        # 对象间相交表（由检测时的窄相位结果生成）
+        if props.intersection_pairs:
+            box = layout.box()
+            box.label(text=f"对象间相交: {len(props.intersection_pairs)} 对", icon='MOD_BOOLEAN')
+            box.template_list(
+                "MESH_UL_ModelInspector_Pairs", "", props, "intersection_pairs",
+                props, "intersection_pair_index", rows=4
+            )
+            box.operator("mesh.model_inspector_frame_pair", text="定位选中的相交对", icon='VIEWZOOM')
+        
+        # 相交交线
+        contact_count = mesh_helpers.get_contact_segment_count() if inspected else 0
+        if contact_count > 0:
+            row = layout.row(align=True)
+            row.label(text=f"交线段: {contact_count}", icon='IPO_LINEAR')
+            row.operator("mesh.model_inspector_export_contacts", text="导出接触线网格", icon='MESH_DATA')
+        
+        # 被完全包埋的对象（没有表面相交，不在上面的统计中）
+        buried_report = mesh_helpers.get_buried_report() if inspected else []
+        if buried_report:
+            box = layout.box()
+            box.label(text=f"被包埋对象: {len(buried_report)}", icon='MOD_SHRINKWRAP')
+            col = box.column()
+            for row_data in buried_report[:20]:
+                col.label(text=f"• {row_data['inner']} ⊂ {row_data['outer']}")
+            if len(buried_report) > 20:
+                col.label(text=f"... 还有 {len(buried_report) - 20} 个")
+        
+        # 结果缓存命中统计
+        if props.use_result_cache and is_loaded(result_cache):
+            hits, misses = result_cache.get_hit_stats()
+            if hits or misses:
+                layout.label(text=f"缓存命中 {hits} / 未命中 {misses}", icon='FILE_CACHE')
+        
+        # 内存峰值
+        memory_peak = profiling.get_last_memory_peak()
+        if props.track_memory and memory_peak is not None:
+            layout.label(text=f"内存峰值 {memory_peak / (1024 * 1024):.1f} MB", icon='MEMORY')
+        
+        # 性能分析结果
+        if props.enable_profiling:
+            self.draw_profiling(layout)
+    
+    def draw_profiling(self, layout):
+        """绘制性能分析信息"""
+        last_run = profiling.get_last_run()
+        
+        box = layout.box()
+        box.label(text="性能分析:", icon='TIME')
+        col = box.column()
+        
+        if last_run is None:
+            col.label(text="执行一次检测后显示各阶段耗时")
+            return
+        
+        col.label(text=f"{last_run['label']}: {last_run['total'] * 1000:.1f} ms")
+        for stage, count, total in profiling.get_stage_summary():
+            col.label(text=f"• {profiling.get_stage_label(stage)}: {total * 1000:.1f} ms ({count}次)")
+        
+        object_summary = profiling.get_object_summary()
+        if object_summary:
+            col.separator()
+            col.label(text="耗时最多的对象:")
+            for obj_name, total in object_summary:
+                col.label(text=f"• {obj_name}: {total * 1000:.1f} ms", icon='OBJECT_DATA')
+        
+        overlay_summary = profiling.get_overlay_summary()
+        if overlay_summary:
+            col.separator()
+            col.label(text="视口绘制（累计）:")
+            for stage, count, total in overlay_summary:
+                col.label(text=f"• {profiling.get_stage_label(stage)}: {total * 1000:.1f} ms ({count}次)")
+        
+        box.operator("mesh.model_inspector_export_profile", text="导出性能数据", icon='EXPORT')
 
 
 # 面板类列表
 classes = [
+    MESH_UL_ModelInspector_Pairs,
     VIEW3D_PT_ModelInspectorMain,
     VIEW3D_PT_ModelInspectorResults,
 ]
@@ -71,7 +71,8 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
         description="Minimum subdivision level for sphere detail",
         default=2,
         min=1,
-        max=6
+        max=256,
+        soft_max=6
     )
     
     max_subdivisions: bpy.props.IntProperty(# type: ignore
@@ -79,7 +80,8 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
         description="Maximum subdivision level for sphere detail",
         default=4,
         min=1,
-        max=6
+        max=256,
+        soft_max=6
     )
     
     deform_chance: bpy.props.FloatProperty(# type: ignore
@@ -121,6 +123,13 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
         description="Keep spheres above Z=0",
         default=True
     )
+    
+    seed: bpy.props.IntProperty(# type: ignore
+        name="Seed",
+        description="Random seed for reproducible scenes (0 = random every run)",
+        default=0,
+        min=0
+    )
 
     def execute(self, context):
         # Clear existing selection
@@ -128,6 +137,9 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
         
         created_objects = []
         
+        # Seeded generator keeps benchmark scenes reproducible
+        rng = random.Random(self.seed) if self.seed else random.Random()
+        
         for i in range(self.sphere_count):
             # Create mesh and object
             mesh = bpy.data.meshes.new(f"RandomSphere_{i+1}")
@@ -140,15 +152,16 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
             bm = bmesh.new()
             
             # Random radius
-            radius = random.uniform(self.min_radius, self.max_radius)
+            radius = rng.uniform(self.min_radius, self.max_radius)
             
             # Create sphere with configurable subdivision levels
-            subdivisions = random.randint(self.min_subdivisions, self.max_subdivisions)
+            subdivisions = rng.randint(self.min_subdivisions, self.max_subdivisions)
             bmesh.ops.create_uvsphere(bm, u_segments=subdivisions*8, v_segments=subdivisions*4, radius=radius)
             
             # Optional: Add random deformation based on chance setting
-            if random.random() < self.deform_chance:
-                bmesh.ops.randomize(bm, geom=bm.verts, offset=radius * self.deform_strength)
+            if rng.random() < self.deform_chance:
+                bmesh.ops.randomize(bm, geom=bm.verts, offset=radius * self.deform_strength,
+                                    seed=rng.randint(0, 2**31 - 1))
             
             # Update mesh
             bm.to_mesh(mesh)
@@ -159,21 +172,21 @@ class LCL_OT_RandomSpheres(bpy.types.Operator):
             z_max = self.spread_range
             
             obj.location = Vector((
-                random.uniform(-self.spread_range, self.spread_range),
-                random.uniform(-self.spread_range, self.spread_range),
-                random.uniform(z_min, z_max)
+                rng.uniform(-self.spread_range, self.spread_range),
+                rng.uniform(-self.spread_range, self.spread_range),
+                rng.uniform(z_min, z_max)
             ))
             
             # Random rotation
             import math
             obj.rotation_euler = (
-                random.uniform(0, 2 * math.pi),
-                random.uniform(0, 2 * math.pi),
-                random.uniform(0, 2 * math.pi)
+                rng.uniform(0, 2 * math.pi),
+                rng.uniform(0, 2 * math.pi),
+                rng.uniform(0, 2 * math.pi)
             )
             
             # Random scale variation using configurable range
-            scale_factor = random.uniform(self.min_scale, self.max_scale)
+            scale_factor = rng.uniform(self.min_scale, self.max_scale)
             obj.scale = (scale_factor, scale_factor, scale_factor)
             
             created_objects.append(obj)
@@ -1,4 +1,5 @@
 import bpy
+import json
 import typing
 import inspect
 import pkgutil
@@ -13,6 +14,12 @@ __all__ = (
 
 blender_version = bpy.app.version
 
+# Registration manifest written next to the package. It stores the module list and
+# the sorted class order, and is reused while no source file's mtime or size changed.
+MANIFEST_NAME = ".auto_load_manifest.json"
+MANIFEST_VERSION = 1
+use_manifest = True
+
 modules = None
 ordered_classes = None
 
@@ -21,8 +28,17 @@ def init():
     global modules
     global ordered_classes
 
-    modules = get_all_submodules(Path(__file__).parent)
+    directory = Path(__file__).parent
+    if use_manifest:
+        cached = load_from_manifest(directory)
+        if cached is not None:
+            modules, ordered_classes = cached
+            return
+
+    modules = get_all_submodules(directory)
     ordered_classes = get_ordered_classes_to_register(modules)
+    if use_manifest:
+        save_manifest(directory, modules, ordered_classes)
 
 
 def register():
@@ -164,6 +180,76 @@ def get_register_base_types():
     )
 
 
+# Registration manifest
+#################################################
+
+
+def get_manifest_path(directory):
+    return directory / MANIFEST_NAME
+
+
+def get_source_fingerprint(directory):
+    fingerprint = {}
+    for path in sorted(directory.rglob("*.py")):
+        stat = path.stat()
+        fingerprint[path.relative_to(directory).as_posix()] = [stat.st_mtime_ns, stat.st_size]
+    return fingerprint
+
+
+def load_from_manifest(directory):
+    try:
+        manifest = json.loads(get_manifest_path(directory).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+    if manifest.get("blender") != list(blender_version):
+        return None
+    if manifest.get("sources") != get_source_fingerprint(directory):
+        return None
+
+    try:
+        cached_modules = [importlib.import_module("." + name, __package__) for name in manifest["modules"]]
+        cached_classes = [
+            resolve_class(importlib.import_module(module_name), qualname)
+            for module_name, qualname in manifest["classes"]
+        ]
+    except (ImportError, KeyError, AttributeError, TypeError, ValueError):
+        return None
+
+    return cached_modules, [cls for cls in cached_classes if not getattr(cls, "is_registered", False)]
+
+
+def resolve_class(module, qualname):
+    value = module
+    for part in qualname.split("."):
+        value = getattr(value, part)
+    return value
+
+
+def save_manifest(directory, modules, classes):
+    manifest = {
+        "version": MANIFEST_VERSION,
+        "blender": list(blender_version),
+        "sources": get_source_fingerprint(directory),
+        "modules": [module.__name__[len(__package__) + 1:] for module in modules],
+        "classes": [[cls.__module__, cls.__qualname__] for cls in classes],
+    }
+    try:
+        get_manifest_path(directory).write_text(json.dumps(manifest, indent=1), encoding="utf-8")
+    except OSError:
+        # Read-only install locations simply fall back to discovery on every start
+        pass
+
+
+def clear_manifest(directory=None):
+    try:
+        get_manifest_path(directory or Path(__file__).parent).unlink()
+    except OSError:
+        pass
+
+
 # Find order to register to solve dependencies
 #################################################
 
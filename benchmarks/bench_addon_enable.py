@@ -0,0 +1,113 @@
+"""
+LcL_Tools add-on enable benchmark (headless)
+
+Times what enabling the add-on costs: importing the LcL_Tools package and
+calling register(). Every run happens in a fresh Blender process so module
+execution is included (a warm process would only time the registration).
+Also lists the model_inspector modules that actually executed during enable;
+the lazily imported check/draw modules should not appear.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/bench_addon_enable.py -- --repeat 10
+    python benchmarks/bench_addon_enable.py -- --repeat 10    (bpy installed as a module)
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+import types
+from pathlib import Path
+
+import bpy
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+RESULT_PREFIX = "LCL_ENABLE_JSON:"
+
+
+def get_script_args():
+    argv = sys.argv
+    return argv[argv.index("--") + 1:] if "--" in argv else []
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="bench_addon_enable")
+    parser.add_argument("--repeat", type=int, default=10, help="Fresh processes to time")
+    parser.add_argument("--output", help="Write results JSON to this file")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    return parser
+
+
+def measure_enable():
+    """Import and register the add-on once (runs in the child process)"""
+    start = time.perf_counter()
+    import LcL_Tools
+    imported = time.perf_counter()
+    LcL_Tools.register()
+    registered = time.perf_counter()
+
+    # Lazy modules sit in sys.modules as LazyLoader stubs until first used
+    prefix = "LcL_Tools.model_inspector."
+    executed = sorted(
+        name[len(prefix):] for name, module in list(sys.modules.items())
+        if name.startswith(prefix) and type(module) is types.ModuleType
+    )
+    LcL_Tools.unregister()
+    return {"import": imported - start, "register": registered - imported, "executed_modules": executed}
+
+
+def child_command():
+    script = str(Path(__file__).resolve())
+    if bpy.app.binary_path:
+        return [bpy.app.binary_path, "-b", "--factory-startup", "--python", script, "--", "--child"]
+    return [sys.executable, script, "--", "--child"]
+
+
+def run_child():
+    process = subprocess.run(child_command(), capture_output=True, text=True, errors="replace", check=False)
+    for line in process.stdout.splitlines():
+        if line.startswith(RESULT_PREFIX):
+            return json.loads(line[len(RESULT_PREFIX):])
+    raise RuntimeError(f"enable run failed (exit {process.returncode}):\n{process.stderr[-2000:]}")
+
+
+def summarize(timings):
+    return {"min": min(timings), "median": statistics.median(timings), "runs": timings}
+
+
+def main():
+    args = build_arg_parser().parse_args(get_script_args())
+    if args.child:
+        print(RESULT_PREFIX + json.dumps(measure_enable()), flush=True)
+        return
+
+    runs = [run_child() for _ in range(max(1, args.repeat))]
+    results = {
+        "meta": {
+            "blender": bpy.app.version_string,
+            "repeat": len(runs),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        },
+        "timings": {
+            stage: summarize([run[stage] for run in runs]) for stage in ("import", "register")
+        },
+        "executed_modules": runs[-1]["executed_modules"],
+    }
+    results["timings"]["total"] = summarize([run["import"] + run["register"] for run in runs])
+
+    for stage, timing in results["timings"].items():
+        print(f"{stage:<10} min {timing['min'] * 1000:.1f} ms  median {timing['median'] * 1000:.1f} ms")
+    print("model_inspector modules executed at enable: " + ", ".join(results["executed_modules"]))
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
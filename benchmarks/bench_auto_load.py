@@ -0,0 +1,90 @@
+"""
+SimpleDemo auto_load startup benchmark (headless)
+
+Times auto_load.init() with and without the registration manifest:
+  - discovery: manifest disabled, every run walks the package with pkgutil,
+    resolves type hints and topologically sorts the classes
+  - manifest:  manifest present and valid, init() only checks source mtimes
+    and resolves the cached class order
+
+Modules are imported once before timing, so both variants exclude module
+execution and measure only the registration bookkeeping init() adds on top.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/bench_auto_load.py -- --repeat 50
+"""
+
+import argparse
+import json
+import statistics
+import sys
+import time
+from pathlib import Path
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+from SimpleDemo import auto_load  # noqa: E402
+
+
+def get_script_args():
+    argv = sys.argv
+    return argv[argv.index("--") + 1:] if "--" in argv else []
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="bench_auto_load")
+    parser.add_argument("--repeat", type=int, default=50, help="Timed init() calls per variant")
+    parser.add_argument("--output", help="Write results JSON to this file")
+    return parser
+
+
+def time_init(repeat, use_manifest):
+    auto_load.use_manifest = use_manifest
+    timings = []
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        auto_load.init()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def summarize(timings):
+    return {"min": min(timings), "median": statistics.median(timings), "runs": timings}
+
+
+def main():
+    args = build_arg_parser().parse_args(get_script_args())
+    directory = Path(auto_load.__file__).parent
+
+    # Warm up imports and write a fresh manifest
+    auto_load.clear_manifest(directory)
+    auto_load.use_manifest = True
+    auto_load.init()
+    if not auto_load.get_manifest_path(directory).exists():
+        print("Manifest could not be written (read-only package directory?)", file=sys.stderr)
+        sys.exit(2)
+
+    results = {
+        "classes": len(auto_load.ordered_classes),
+        "modules": len(auto_load.modules),
+        "discovery": summarize(time_init(args.repeat, use_manifest=False)),
+        "manifest": summarize(time_init(args.repeat, use_manifest=True)),
+    }
+    auto_load.use_manifest = True
+
+    print(f"{results['modules']} modules, {results['classes']} classes")
+    for variant in ("discovery", "manifest"):
+        timing = results[variant]
+        print(f"{variant:<10} min {timing['min'] * 1000:.3f}ms  median {timing['median'] * 1000:.3f}ms")
+    speedup = results["discovery"]["median"] / max(results["manifest"]["median"], 1e-12)
+    print(f"manifest speedup {speedup:.1f}x")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,312 @@
+"""
+Model Inspector benchmark runner (headless)
+
+Builds deterministic synthetic scenes with SimpleDemo's LCL_OT_RandomSpheres
+(fixed seed) and times the model_inspector hot paths separately:
+self intersection, pair intersection, distortion and face selection.
+
+Usage:
+    blender -b --factory-startup --python benchmarks/bench_model_inspector.py -- --output bench.json
+    blender -b --factory-startup --python benchmarks/bench_model_inspector.py -- --baseline bench.json
+
+With --baseline the run is compared against a stored result file and the
+process exits with code 1 when any timing regresses beyond --tolerance.
+
+Pair narrow phase scaling (one "pair_w<N>" timing per extra worker count):
+    blender -b --factory-startup --python benchmarks/bench_model_inspector.py -- \
+        --scales 1000obj_1m --stages pair --workers 1,8,16,32
+
+Pass/fail (limited result) mode on a clean scene, next to the full run:
+    blender -b --factory-startup --python benchmarks/bench_model_inspector.py -- \
+        --stages self,pair --overlap-ratio 0 --deform-chance 0 --max-faces 0,1
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import bpy
+import bmesh
+from mathutils import Vector
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+import SimpleDemo  # noqa: E402
+from LcL_Tools.model_inspector import mesh_cache, mesh_helpers  # noqa: E402
+
+# Scene scales: name -> (object count, total face count)
+SCALES = {
+    "10obj_10k": (10, 10_000),
+    "100obj_100k": (100, 100_000),
+    "1000obj_1m": (1000, 1_000_000),
+    "10obj_5m": (10, 5_000_000),
+}
+
+STAGES = ("self", "pair", "distortion", "selection")
+
+
+def get_script_args():
+    argv = sys.argv
+    return argv[argv.index("--") + 1:] if "--" in argv else []
+
+
+def build_arg_parser():
+    parser = argparse.ArgumentParser(prog="bench_model_inspector")
+    parser.add_argument("--scales", default=",".join(SCALES),
+                        help="Comma separated scale names: " + ", ".join(SCALES))
+    parser.add_argument("--stages", default=",".join(STAGES),
+                        help="Comma separated stages to time: " + ", ".join(STAGES))
+    parser.add_argument("--seed", type=int, default=1234, help="Scene generation seed")
+    parser.add_argument("--overlap-ratio", type=float, default=0.2,
+                        help="Fraction of objects placed so they intersect a neighbour")
+    parser.add_argument("--deform-chance", type=float, default=0.3,
+                        help="Probability of randomizing a sphere (creates self intersections)")
+    parser.add_argument("--repeat", type=int, default=3, help="Timed repetitions per stage")
+    parser.add_argument("--threshold", type=float, default=0.00001, help="Intersection threshold")
+    parser.add_argument("--distortion-angle", type=float, default=45.0, help="Distortion angle (degrees)")
+    parser.add_argument("--workers", default="1",
+                        help="Comma separated pair narrow phase worker counts, e.g. 1,8,16,32")
+    parser.add_argument("--max-faces", default="0",
+                        help="Comma separated intersection result limits; each value > 0 adds "
+                             "self_k<N>/pair_k<N> timings (e.g. 0,1 times the pass/fail mode too)")
+    parser.add_argument("--output", help="Write results JSON to this file")
+    parser.add_argument("--baseline", help="Compare against a stored results JSON")
+    parser.add_argument("--tolerance", type=float, default=0.10,
+                        help="Allowed slowdown vs baseline before flagging a regression (0.10 = 10%%)")
+    return parser
+
+
+# Scene generation
+#################################################
+
+
+def clear_scene():
+    for obj in list(bpy.data.objects):
+        bpy.data.objects.remove(obj, do_unlink=True)
+    for mesh in list(bpy.data.meshes):
+        bpy.data.meshes.remove(mesh)
+
+
+def build_scene(object_count, total_faces, seed, overlap_ratio, deform_chance):
+    """Generate spheres with RandomSpheres, then lay them out with a controlled overlap ratio"""
+    clear_scene()
+
+    # uv sphere with subdivision s has (8s) * (4s) faces
+    faces_per_object = max(1, total_faces // object_count)
+    subdivisions = max(1, round(math.sqrt(faces_per_object / 32.0)))
+
+    bpy.ops.mesh.lcl_random_spheres(
+        sphere_count=object_count,
+        min_radius=1.0,
+        max_radius=1.0,
+        min_subdivisions=subdivisions,
+        max_subdivisions=subdivisions,
+        min_scale=1.0,
+        max_scale=1.0,
+        deform_chance=deform_chance,
+        deform_strength=0.1,
+        seed=seed,
+    )
+    objects = sorted((o for o in bpy.data.objects if o.type == 'MESH'), key=lambda o: o.name)
+
+    # Grid layout keeps non-overlapping spheres apart; every overlapping pair
+    # shares one grid cell with its partner offset by 1.5 radii.
+    spacing = 6.0
+    side = math.ceil(math.sqrt(object_count))
+    overlap_pairs = int(object_count * overlap_ratio) // 2
+    cell = 0
+    index = 0
+    while index < len(objects):
+        base = Vector(((cell % side) * spacing, (cell // side) * spacing, 0.0))
+        objects[index].location = base
+        if index // 2 < overlap_pairs and index + 1 < len(objects):
+            objects[index + 1].location = base + Vector((1.5, 0.0, 0.0))
+            index += 2
+        else:
+            index += 1
+        cell += 1
+
+    bpy.context.view_layer.update()
+    return objects
+
+
+# Timed stages
+#################################################
+
+
+def time_stage(func, repeat):
+    """Run func `repeat` times inside a fresh geometry session (like an operator run),
+    return (timings, last result)"""
+    timings = []
+    result = None
+    for _ in range(max(1, repeat)):
+        start = time.perf_counter()
+        mesh_cache.begin_session()
+        try:
+            result = func()
+        finally:
+            mesh_cache.end_session()
+        timings.append(time.perf_counter() - start)
+    return timings, result
+
+
+def stage_self(objects, args, max_faces=0):
+    return {obj.name: mesh_helpers.bmesh_check_self_intersect_object(obj, threshold=args.threshold,
+                                                                      max_faces=max_faces)
+            for obj in objects}
+
+
+def stage_pair(objects, args, workers=1, max_faces=0):
+    pair_results = mesh_helpers.check_all_object_intersections(objects, args.threshold, max_faces, workers)
+    return sum(len(faces1) + len(faces2) for _, _, faces1, faces2 in pair_results)
+
+
+def stage_distortion(objects, args):
+    angle = math.radians(args.distortion_angle)
+    return sum(len(mesh_helpers.check_distorted_faces(obj, angle_threshold=angle)) for obj in objects)
+
+
+def stage_selection(objects, flagged):
+    selected = 0
+    for obj in objects:
+        faces = flagged.get(obj.name)
+        if faces is None or len(faces) == 0:
+            continue
+        bm = bmesh.new()
+        bm.from_mesh(obj.data)
+        selected += mesh_helpers.select_faces_in_bmesh(bm, faces)
+        bm.to_mesh(obj.data)
+        bm.free()
+    return selected
+
+
+def run_scale(name, args, stages):
+    object_count, total_faces = SCALES[name]
+    objects = build_scene(object_count, total_faces, args.seed, args.overlap_ratio, args.deform_chance)
+    actual_faces = sum(len(obj.data.polygons) for obj in objects)
+    print(f"[{name}] {len(objects)} objects, {actual_faces} faces", flush=True)
+
+    record = {"objects": len(objects), "faces": actual_faces, "timings": {}, "issues": {}}
+
+    # Selection needs flagged faces, so self intersection always runs first
+    self_timings, self_faces = time_stage(lambda: stage_self(objects, args), args.repeat)
+    if "self" in stages:
+        record["timings"]["self"] = summarize(self_timings)
+        record["issues"]["self"] = sum(len(f) for f in self_faces.values())
+
+    if "pair" in stages:
+        for workers in args.worker_counts:
+            timings, found = time_stage(lambda: stage_pair(objects, args, workers), args.repeat)
+            stage = "pair" if workers == 1 else f"pair_w{workers}"
+            record["timings"][stage] = summarize(timings)
+            record["issues"][stage] = found
+
+    for limit in args.face_limits:
+        if "self" in stages:
+            timings, found = time_stage(lambda: stage_self(objects, args, limit), args.repeat)
+            record["timings"][f"self_k{limit}"] = summarize(timings)
+            record["issues"][f"self_k{limit}"] = sum(len(f) for f in found.values())
+        if "pair" in stages:
+            timings, found = time_stage(lambda: stage_pair(objects, args, max_faces=limit), args.repeat)
+            record["timings"][f"pair_k{limit}"] = summarize(timings)
+            record["issues"][f"pair_k{limit}"] = found
+
+    if "distortion" in stages:
+        timings, found = time_stage(lambda: stage_distortion(objects, args), args.repeat)
+        record["timings"]["distortion"] = summarize(timings)
+        record["issues"]["distortion"] = found
+
+    if "selection" in stages:
+        timings, found = time_stage(lambda: stage_selection(objects, self_faces), args.repeat)
+        record["timings"]["selection"] = summarize(timings)
+        record["issues"]["selection"] = found
+
+    for stage, timing in record["timings"].items():
+        print(f"[{name}] {stage:<10} min {timing['min']:.4f}s  median {timing['median']:.4f}s", flush=True)
+    return record
+
+
+def summarize(timings):
+    return {"min": min(timings), "median": statistics.median(timings), "runs": timings}
+
+
+# Baseline comparison
+#################################################
+
+
+def compare_with_baseline(results, baseline, tolerance):
+    """Print per-stage ratios against the baseline; return the list of regressions"""
+    regressions = []
+    print(f"\n{'scale':<14}{'stage':<12}{'baseline':>10}{'current':>10}{'ratio':>8}")
+    for scale, record in results["scales"].items():
+        base_record = baseline.get("scales", {}).get(scale)
+        if base_record is None:
+            continue
+        for stage, timing in record["timings"].items():
+            base_timing = base_record["timings"].get(stage)
+            if base_timing is None:
+                continue
+            ratio = timing["min"] / base_timing["min"] if base_timing["min"] > 0 else float("inf")
+            flag = ""
+            if ratio > 1.0 + tolerance:
+                flag = "  REGRESSION"
+                regressions.append((scale, stage, ratio))
+            print(f"{scale:<14}{stage:<12}{base_timing['min']:>10.4f}{timing['min']:>10.4f}{ratio:>8.2f}{flag}")
+    return regressions
+
+
+def main():
+    args = build_arg_parser().parse_args(get_script_args())
+    scales = [s.strip() for s in args.scales.split(",") if s.strip()]
+    stages = {s.strip() for s in args.stages.split(",") if s.strip()}
+    unknown = [s for s in scales if s not in SCALES] + [s for s in stages if s not in STAGES]
+    if unknown:
+        print(f"Unknown scale/stage: {', '.join(unknown)}", file=sys.stderr)
+        sys.exit(2)
+    args.worker_counts = sorted({max(1, int(w)) for w in args.workers.split(",") if w.strip()}) or [1]
+    args.face_limits = sorted({int(k) for k in args.max_faces.split(",") if k.strip() and int(k) > 0})
+
+    SimpleDemo.register()
+    try:
+        results = {
+            "meta": {
+                "blender": bpy.app.version_string,
+                "platform": platform.platform(),
+                "cpu_count": os.cpu_count(),
+                "workers": args.worker_counts,
+                "max_faces": args.face_limits,
+                "seed": args.seed,
+                "overlap_ratio": args.overlap_ratio,
+                "threshold": args.threshold,
+                "repeat": args.repeat,
+                "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            },
+            "scales": {name: run_scale(name, args, stages) for name in scales},
+        }
+    finally:
+        SimpleDemo.unregister()
+
+    if args.output:
+        Path(args.output).write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"Results written to {args.output}")
+
+    exit_code = 0
+    if args.baseline:
+        baseline = json.loads(Path(args.baseline).read_text(encoding="utf-8"))
+        regressions = compare_with_baseline(results, baseline, args.tolerance)
+        if regressions:
+            print(f"{len(regressions)} stage(s) regressed beyond {args.tolerance:.0%}")
+            exit_code = 1
+    sys.exit(exit_code)
+
+
+if __name__ == "__main__":
+    main()
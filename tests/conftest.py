@@ -0,0 +1,163 @@
+"""
+Shared fixtures for the model_inspector unit tests
+
+broad_phase and result_cache only depend on NumPy, so they are loaded straight
+from their files and run without Blender. Modules that import bpy/mathutils
+(mesh_cache, mesh_helpers, contact, check_engine) are skipped unless the bpy module is
+importable (e.g. `pip install bpy` or running inside Blender's Python).
+
+Usage:
+    python -m pytest -q tests
+"""
+
+import importlib
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+REPO_ROOT = Path(__file__).resolve().parents[1]
+MODULE_DIR = REPO_ROOT / "LcL_Tools" / "model_inspector"
+if str(REPO_ROOT) not in sys.path:
+    sys.path.insert(0, str(REPO_ROOT))
+
+
+def load_standalone(name):
+    """Load a NumPy-only module by path, bypassing the add-on package __init__ (which imports bpy)."""
+    pytest.importorskip("numpy")
+    spec = importlib.util.spec_from_file_location(f"model_inspector_{name}", MODULE_DIR / f"{name}.py")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def import_addon_module(name):
+    """Import a model_inspector module through the package, skipping when bpy is unavailable."""
+    pytest.importorskip("numpy")
+    pytest.importorskip("bpy")
+    return importlib.import_module(f"LcL_Tools.model_inspector.{name}")
+
+
+@pytest.fixture(scope="session")
+def broad_phase():
+    return load_standalone("broad_phase")
+
+
+@pytest.fixture
+def result_cache(tmp_path):
+    # Fresh module per test: hit/miss counters and the size estimate are module globals
+    module = load_standalone("result_cache")
+    module.configure(True, str(tmp_path))
+    return module
+
+
+@pytest.fixture(scope="session")
+def mesh_cache():
+    return import_addon_module("mesh_cache")
+
+
+@pytest.fixture(scope="session")
+def contact():
+    return import_addon_module("contact")
+
+
+@pytest.fixture(scope="session")
+def check_engine():
+    return import_addon_module("check_engine")
+
+
+@pytest.fixture(scope="session")
+def mesh_helpers():
+    return import_addon_module("mesh_helpers")
+
+
+@pytest.fixture
+def make_box():
+    """
+    Create axis-aligned box mesh objects in the current scene, removed after the test
+    size is the box extent along each axis; the object origin is at the box center.
+    """
+    import bpy
+
+    created = []
+
+    def build(name, size=(1, 1, 1), location=(0, 0, 0), scale=(1, 1, 1)):
+        sx, sy, sz = (s * 0.5 for s in size)
+        verts = [
+            (-sx, -sy, -sz), (sx, -sy, -sz), (sx, sy, -sz), (-sx, sy, -sz),
+            (-sx, -sy, sz), (sx, -sy, sz), (sx, sy, sz), (-sx, sy, sz),
+        ]
+        # -z, +z, -y, +x, +y, -x
+        faces = [(0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4), (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7)]
+        me = bpy.data.meshes.new(name)
+        me.from_pydata(verts, [], faces)
+        obj = bpy.data.objects.new(name, me)
+        obj.location = location
+        obj.scale = scale
+        bpy.context.scene.collection.objects.link(obj)
+        bpy.context.view_layer.update()
+        created.append(obj)
+        return obj
+
+    yield build
+    for obj in created:
+        me = obj.data
+        bpy.data.objects.remove(obj)
+        bpy.data.meshes.remove(me)
+
+
+@pytest.fixture
+def inspection_session(mesh_cache, mesh_helpers):
+    """Begin a geometry session like an operator run (max_bytes > 0 streams); cleared after the test"""
+    def begin(max_bytes=0):
+        mesh_cache.begin_session(max_bytes)
+        return mesh_cache.get_session_cache()
+
+    yield begin
+    mesh_cache.end_session()
+    mesh_helpers.clear_inspection_data()
+
+
+@pytest.fixture(scope="session")
+def make_geometry(mesh_cache):
+    """
+    Build a MeshGeometry by hand from vertex positions and polygons (vertex index lists)
+    Fills the buffers the topology/UV checks read; polygons are fan-triangulated.
+    """
+    import numpy as np
+
+    def build(positions, polys, uvs=None):
+        positions = np.asarray(positions, dtype=np.float32).reshape(-1, 3)
+        totals = np.array([len(p) for p in polys], dtype=np.int32)
+        starts = (np.cumsum(totals) - totals).astype(np.int32)
+        loop_verts = np.array([v for p in polys for v in p], dtype=np.int32)
+
+        edge_index = {}
+        loop_edges = []
+        for poly in polys:
+            for i, v in enumerate(poly):
+                edge = tuple(sorted((v, poly[(i + 1) % len(poly)])))
+                loop_edges.append(edge_index.setdefault(edge, len(edge_index)))
+
+        tri_loops = np.array([
+            (start, start + i, start + i + 1)
+            for start, total in zip(starts, totals)
+            for i in range(1, total - 1)
+        ], dtype=np.int32).reshape(-1, 3)
+        tri_polys = np.repeat(np.arange(len(polys), dtype=np.int32), totals - 2)
+
+        geometry = mesh_cache.MeshGeometry("test", positions, loop_verts[tri_loops], tri_polys, len(polys))
+        geometry.buffers.update(
+            poly_loop_starts=starts,
+            poly_loop_totals=totals,
+            loop_verts=loop_verts,
+            loop_edges=np.array(loop_edges, dtype=np.int32),
+            edges=np.array(list(edge_index), dtype=np.int32).reshape(-1, 2),
+            tri_loops=tri_loops,
+        )
+        if uvs is not None:
+            geometry.buffers['uvs'] = np.asarray(uvs, dtype=np.float32).reshape(-1, 2)
+        return geometry
+
+    return build
@@ -0,0 +1,98 @@
+"""Tests for broad_phase: world-space bounds, the AABB sweep and Morton ordering."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _brute_force_pairs(bounds_min, bounds_max, margin):
+    lo = bounds_min - margin
+    hi = bounds_max + margin
+    pairs = [
+        (i, j)
+        for i in range(len(lo))
+        for j in range(i + 1, len(lo))
+        if np.all(lo[i] <= hi[j]) and np.all(lo[j] <= hi[i])
+    ]
+    return np.array(pairs, dtype=np.int32).reshape(-1, 2)
+
+
+def _as_set(pairs):
+    return {tuple(p) for p in pairs.tolist()}
+
+
+def test_overlapping_pairs_finds_only_touching_boxes(broad_phase):
+    bounds_min = np.array([[0, 0, 0], [0.5, 0.5, 0.5], [5, 5, 5]], dtype=np.float64)
+    bounds_max = bounds_min + 1.0
+    pairs = broad_phase.overlapping_pairs(bounds_min, bounds_max)
+    assert pairs.dtype == np.int32
+    assert pairs.tolist() == [[0, 1]]
+
+
+def test_overlapping_pairs_requires_overlap_on_every_axis(broad_phase):
+    # Same X range, separated along Z
+    bounds_min = np.array([[0, 0, 0], [0, 0, 2]], dtype=np.float64)
+    bounds_max = bounds_min + 1.0
+    assert len(broad_phase.overlapping_pairs(bounds_min, bounds_max)) == 0
+
+
+def test_overlapping_pairs_margin_expands_both_boxes(broad_phase):
+    bounds_min = np.array([[0, 0, 0], [1.05, 0, 0]], dtype=np.float64)
+    bounds_max = bounds_min + 1.0
+    assert len(broad_phase.overlapping_pairs(bounds_min, bounds_max)) == 0
+    # Each box grows by the margin, so a 0.05 gap closes with margin 0.03
+    assert broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=0.03).tolist() == [[0, 1]]
+
+
+def test_overlapping_pairs_matches_brute_force(broad_phase):
+    rng = np.random.default_rng(7)
+    bounds_min = rng.uniform(0.0, 10.0, size=(200, 3))
+    bounds_max = bounds_min + rng.uniform(0.1, 1.5, size=(200, 3))
+    pairs = broad_phase.overlapping_pairs(bounds_min, bounds_max, margin=0.1)
+    assert np.all(pairs[:, 0] < pairs[:, 1])
+    assert len(_as_set(pairs)) == len(pairs)
+    assert _as_set(pairs) == _as_set(_brute_force_pairs(bounds_min, bounds_max, 0.1))
+
+
+def test_overlapping_pairs_fewer_than_two_boxes(broad_phase):
+    assert broad_phase.overlapping_pairs(np.zeros((1, 3)), np.ones((1, 3))).shape == (0, 2)
+    assert broad_phase.overlapping_pairs(np.zeros((0, 3)), np.zeros((0, 3))).shape == (0, 2)
+
+
+def test_transform_bounds_applies_scale_and_translation(broad_phase):
+    matrix = np.diag([2.0, 3.0, -1.0, 1.0])
+    matrix[:3, 3] = (1.0, 0.0, 5.0)
+    world_min, world_max = broad_phase.transform_bounds((0, 0, 0), (1, 1, 1), matrix)
+    np.testing.assert_allclose(world_min, (1.0, 0.0, 4.0))
+    np.testing.assert_allclose(world_max, (3.0, 3.0, 5.0))
+
+
+def test_morton_order_is_a_permutation(broad_phase):
+    rng = np.random.default_rng(3)
+    points = rng.uniform(-5.0, 5.0, size=(500, 3))
+    order = broad_phase.morton_order(points)
+    assert sorted(order.tolist()) == list(range(500))
+
+
+def test_morton_order_follows_z_curve_on_cube_corners(broad_phase):
+    corners = np.array([[x, y, z] for z in (0, 1) for y in (0, 1) for x in (0, 1)], dtype=np.float64)
+    shuffled = corners[::-1]
+    ordered = shuffled[broad_phase.morton_order(shuffled)]
+    # Z-order interleaves x, y, z bits with x lowest, which is exactly the construction order above
+    np.testing.assert_array_equal(ordered, corners)
+
+
+def test_morton_order_keeps_clusters_together(broad_phase):
+    rng = np.random.default_rng(11)
+    centers = np.array([[0, 0, 0], [100, 0, 0], [0, 100, 100]], dtype=np.float64)
+    labels = np.repeat(np.arange(3), 20)
+    rng.shuffle(labels)
+    points = centers[labels] + rng.uniform(-1.0, 1.0, size=(60, 3))
+    ordered_labels = labels[broad_phase.morton_order(points)]
+    # Each cluster forms one contiguous run: exactly two label changes along the order
+    assert np.count_nonzero(ordered_labels[1:] != ordered_labels[:-1]) == 2
+
+
+def test_morton_order_small_inputs(broad_phase):
+    assert broad_phase.morton_order(np.zeros((0, 3))).tolist() == []
+    assert broad_phase.morton_order(np.zeros((1, 3))).tolist() == [0]
@@ -0,0 +1,161 @@
+"""Tests for the check_engine checks: topology and UV on hand-built geometry, wall thickness on scene objects."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+CUBE_POSITIONS = [
+    [0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0],
+    [0, 0, 1], [1, 0, 1], [1, 1, 1], [0, 1, 1],
+]
+# Outward-facing, consistently wound quads
+CUBE_POLYS = [
+    (0, 3, 2, 1), (4, 5, 6, 7), (0, 1, 5, 4),
+    (1, 2, 6, 5), (2, 3, 7, 6), (3, 0, 4, 7),
+]
+
+
+def _faces(check, geometry):
+    return check.evaluate(geometry).tolist()
+
+
+def test_closed_cube_is_manifold(check_engine, make_geometry):
+    geometry = make_geometry(CUBE_POSITIONS, CUBE_POLYS)
+    assert _faces(check_engine.NonManifoldCheck(), geometry) == []
+
+
+def test_open_box_flags_boundary_faces(check_engine, make_geometry):
+    # Drop the top face: the four side faces touch the open boundary
+    geometry = make_geometry(CUBE_POSITIONS, CUBE_POLYS[:1] + CUBE_POLYS[2:])
+    assert _faces(check_engine.NonManifoldCheck(), geometry) == [1, 2, 3, 4]
+
+
+def test_flipped_face_flags_it_and_its_neighbours(check_engine, make_geometry):
+    polys = list(CUBE_POLYS)
+    polys[1] = polys[1][::-1]
+    geometry = make_geometry(CUBE_POSITIONS, polys)
+    # Every edge of the flipped top face is inconsistent, which also marks the four side faces
+    assert _faces(check_engine.NonManifoldCheck(), geometry) == [1, 2, 3, 4, 5]
+
+
+def test_edge_shared_by_three_faces(check_engine, make_geometry):
+    positions = [[0, 0, 0], [1, 0, 0], [0, 1, 0], [0, -1, 0], [0, 0, 1]]
+    geometry = make_geometry(positions, [(0, 1, 2), (1, 0, 3), (0, 1, 4)])
+    assert _faces(check_engine.NonManifoldCheck(), geometry) == [0, 1, 2]
+
+
+def test_zero_area_faces(check_engine, make_geometry):
+    positions = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [2, 0, 0], [3, 0, 0], [4, 0, 0]]
+    # Face 1 is a sliver with all three vertices on one line
+    geometry = make_geometry(positions, [(0, 1, 2, 3), (4, 5, 6)])
+    assert _faces(check_engine.ZeroAreaCheck(area_threshold=1e-8), geometry) == [1]
+    assert _faces(check_engine.ZeroAreaCheck(area_threshold=2.0), geometry) == [0, 1]
+
+
+def test_duplicate_verts(check_engine, make_geometry):
+    positions = [
+        [0, 0, 0], [1, 0, 0], [1, 1, 0],
+        # Face 1 starts at a copy of vertex 1, offset well inside the merge distance
+        [1.00001, 0, 0], [2, 0, 0], [2, 1, 0],
+        [5, 5, 5], [6, 5, 5], [6, 6, 5],
+    ]
+    geometry = make_geometry(positions, [(0, 1, 2), (3, 4, 5), (6, 7, 8)])
+    assert _faces(check_engine.DuplicateVertsCheck(merge_distance=0.001), geometry) == [0, 1]
+    assert _faces(check_engine.DuplicateVertsCheck(merge_distance=1e-7), geometry) == []
+
+
+def _uv_quads(offset):
+    """Two separate quads laid out in UV space, the second shifted by offset."""
+    positions = [[x, y, 0] for x, y in ((0, 0), (1, 0), (1, 1), (0, 1), (2, 0), (3, 0), (3, 1), (2, 1))]
+    square = np.array([[0, 0], [0.5, 0], [0.5, 0.5], [0, 0.5]])
+    uvs = np.concatenate((square, square + offset))
+    return positions, [(0, 1, 2, 3), (4, 5, 6, 7)], uvs
+
+
+def test_uv_overlap_flags_overlapping_islands(check_engine, make_geometry):
+    positions, polys, uvs = _uv_quads((0.25, 0.25))
+    geometry = make_geometry(positions, polys, uvs)
+    assert _faces(check_engine.UVOverlapCheck(epsilon=1e-6), geometry) == [0, 1]
+
+
+def test_uv_overlap_ignores_islands_sharing_an_edge(check_engine, make_geometry):
+    positions, polys, uvs = _uv_quads((0.5, 0.0))
+    geometry = make_geometry(positions, polys, uvs)
+    assert _faces(check_engine.UVOverlapCheck(epsilon=1e-6), geometry) == []
+
+
+def test_uv_overlap_ignores_triangles_of_the_same_face(check_engine, make_geometry):
+    positions, polys, uvs = _uv_quads((2.0, 2.0))
+    # A bow-tie UV quad: its two triangles overlap each other but belong to one face
+    uvs[:4] = [[0, 0], [1, 1], [1, 0], [0, 1]]
+    geometry = make_geometry(positions, polys, uvs)
+    assert _faces(check_engine.UVOverlapCheck(epsilon=1e-6), geometry) == []
+
+
+def test_triangles_overlap_2d(check_engine):
+    tri = np.array([[0, 0], [1, 0], [0, 1]], dtype=np.float64)
+    others = np.array([
+        tri + 0.2,                            # overlapping
+        tri + 5.0,                            # far apart
+        [[1, 0], [0, 1], [1, 1]],             # shares the hypotenuse only
+    ], dtype=np.float64)
+    hit = check_engine.triangles_overlap_2d(np.repeat(tri[None], 3, axis=0), others, 1e-9)
+    assert hit.tolist() == [True, False, False]
+
+
+def _brute_force_uv_faces(check_engine, uvs, tri_loops, tri_polys, epsilon):
+    uv_tris = uvs[tri_loops].astype(np.float64)
+    a, b = np.triu_indices(len(uv_tris), k=1)
+    keep = tri_polys[a] != tri_polys[b]
+    a, b = a[keep], b[keep]
+    hit = check_engine.triangles_overlap_2d(uv_tris[a], uv_tris[b], epsilon)
+    return sorted(set(tri_polys[a[hit]].tolist()) | set(tri_polys[b[hit]].tolist()))
+
+
+def test_uv_overlap_matches_brute_force_in_small_batches(check_engine, make_geometry, monkeypatch):
+    rng = np.random.default_rng(5)
+    count = 150
+    positions = rng.uniform(0.0, 1.0, size=(count * 3, 3))
+    polys = [(3 * i, 3 * i + 1, 3 * i + 2) for i in range(count)]
+    # Scattered small triangles plus a stack of identical copies (mirrored/stacked islands)
+    uvs = rng.uniform(0.0, 1.0, size=(count, 1, 2)) + rng.uniform(-0.05, 0.05, size=(count, 3, 2))
+    uvs[:40] = [[0.2, 0.2], [0.3, 0.2], [0.2, 0.3]]
+    geometry = make_geometry(positions, polys, uvs.reshape(-1, 2))
+    expected = _brute_force_uv_faces(
+        check_engine, geometry.get_buffer('uvs'), geometry.get_buffer('tri_loops'), geometry.tri_polys, 1e-6
+    )
+    assert set(range(40)) <= set(expected)
+
+    monkeypatch.setattr(check_engine, 'UV_PAIR_BATCH', 7)
+    assert _faces(check_engine.UVOverlapCheck(epsilon=1e-6), geometry) == expected
+
+
+def _thin_walls(check_engine, obj, min_thickness=0.05):
+    values = {}
+    check = check_engine.ThicknessCheck(min_thickness=min_thickness, max_samples=0)
+    faces = check_engine.run_object_checks(obj, [check], values)['THICKNESS']
+    return faces.tolist(), values.get('THICKNESS')
+
+
+def test_thin_slab_flags_its_large_faces(check_engine, make_box):
+    faces, values = _thin_walls(check_engine, make_box("slab", size=(2, 2, 0.02)))
+    # Only the -z / +z faces see the opposite side within the limit
+    assert faces == [0, 1]
+    np.testing.assert_allclose(values, 0.02, atol=1e-4)
+
+
+def test_thick_box_passes(check_engine, make_box):
+    faces, _ = _thin_walls(check_engine, make_box("box", size=(2, 2, 0.2)))
+    assert faces == []
+
+
+def test_thickness_is_measured_in_world_space(check_engine, make_box):
+    # 0.2 thick in local space, 0.02 in the world
+    flattened = make_box("flattened", size=(2, 2, 0.2), scale=(1, 1, 0.1))
+    faces, values = _thin_walls(check_engine, flattened)
+    assert faces == [0, 1]
+    np.testing.assert_allclose(values, 0.02, atol=1e-4)
+
+    # 0.02 thick in local space, 0.2 in the world
+    stretched = make_box("stretched", size=(2, 2, 0.02), scale=(1, 1, 10))
+    assert _thin_walls(check_engine, stretched)[0] == []
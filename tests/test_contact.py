@@ -0,0 +1,39 @@
+"""Tests for contact: triangle pair intersection segments."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Horizontal triangle in the XY plane and a vertical one piercing it along X
+FLAT = [[-1.0, -1.0, 0.0], [1.0, -1.0, 0.0], [0.0, 1.0, 0.0]]
+VERTICAL = [[-0.5, 0.0, -1.0], [0.5, 0.0, -1.0], [0.0, 0.0, 1.0]]
+
+
+def test_crossing_triangles_give_one_segment(contact):
+    segments = contact.triangle_segments(np.array([FLAT]), np.array([VERTICAL]))
+    assert segments.shape == (1, 2, 3)
+    assert segments.dtype == np.float32
+    # Overlap of the flat triangle's cut (x in [-0.5, 0.5]) and the vertical one's cut (x in [-0.25, 0.25])
+    xs = np.sort(segments[0, :, 0])
+    np.testing.assert_allclose(xs, (-0.25, 0.25), atol=1e-6)
+    np.testing.assert_allclose(segments[0, :, 1:], 0.0, atol=1e-6)
+
+
+def test_segment_is_symmetric_in_pair_order(contact):
+    ab = contact.triangle_segments(np.array([FLAT]), np.array([VERTICAL]))
+    ba = contact.triangle_segments(np.array([VERTICAL]), np.array([FLAT]))
+    np.testing.assert_allclose(np.sort(ab[0, :, 0]), np.sort(ba[0, :, 0]), atol=1e-6)
+
+
+def test_disjoint_and_coplanar_triangles_give_no_segment(contact):
+    lifted = np.array(VERTICAL) + (0.0, 0.0, 5.0)
+    beside = np.array(VERTICAL) + (5.0, 0.0, 0.0)
+    coplanar = np.array(FLAT) * 0.5
+    tris_a = np.array([FLAT, FLAT, FLAT])
+    tris_b = np.array([lifted, beside, coplanar])
+    assert contact.triangle_segments(tris_a, tris_b).shape == (0, 2, 3)
+
+
+def test_empty_input(contact):
+    empty = np.empty((0, 3, 3))
+    assert contact.triangle_segments(empty, empty).shape == (0, 2, 3)
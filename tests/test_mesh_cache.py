@@ -0,0 +1,82 @@
+"""Tests for mesh_cache: intersection result limits and the streaming geometry cache."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+EPSILON = 1e-6
+
+# Two separate crossings: face 0 x face 1 and face 2 x face 3
+CROSSING_POSITIONS = [
+    [-1, -1, 0], [1, -1, 0], [0, 1, 0],
+    [-0.5, 0, -1], [0.5, 0, -1], [0, 0, 1],
+    [9, -1, 0], [11, -1, 0], [10, 1, 0],
+    [9.5, 0, -1], [10.5, 0, -1], [10, 0, 1],
+]
+CROSSING_POLYS = [(0, 1, 2), (3, 4, 5), (6, 7, 8), (9, 10, 11)]
+
+
+def test_limited_self_intersection_is_a_prefix_of_the_full_result(mesh_cache, make_geometry):
+    geometry = make_geometry(CROSSING_POSITIONS, CROSSING_POLYS)
+    assert mesh_cache.self_intersect_faces(geometry, EPSILON, max_faces=1).tolist() == [0]
+    # The limited run still memoizes the complete answer and the triangle pairs for contact lines
+    assert geometry.results[('SELF', EPSILON)].tolist() == [0, 1, 2, 3]
+    pairs = np.sort(geometry.results[('SELF_PAIRS', EPSILON)], axis=1)
+    assert {tuple(p) for p in pairs.tolist()} == {(0, 1), (2, 3)}
+    assert mesh_cache.self_intersect_faces(geometry, EPSILON).tolist() == [0, 1, 2, 3]
+
+
+def test_self_intersection_ignores_faces_sharing_an_edge(mesh_cache, make_geometry):
+    positions = [[0, 0, 0], [1, 0, 0], [1, 1, 0], [0, 1, 0], [1, 0, 1]]
+    geometry = make_geometry(positions, [(0, 1, 2, 3), (1, 2, 4)])
+    assert mesh_cache.self_intersect_faces(geometry, EPSILON).tolist() == []
+
+
+def test_limited_pair_intersection_keeps_all_triangle_pairs(mesh_cache, make_geometry):
+    from mathutils import Matrix
+
+    geometry1 = make_geometry(CROSSING_POSITIONS[:3] + CROSSING_POSITIONS[6:9], [(0, 1, 2), (3, 4, 5)])
+    geometry2 = make_geometry(CROSSING_POSITIONS[3:6] + CROSSING_POSITIONS[9:], [(0, 1, 2), (3, 4, 5)])
+    identity = Matrix.Identity(4)
+
+    faces1, faces2, pairs = mesh_cache.pair_intersect(geometry1, identity, geometry2, identity, EPSILON, max_faces=1)
+    assert faces1.tolist() == [0]
+    assert faces2.tolist() == [0]
+    assert sorted(map(tuple, pairs.tolist())) == [(0, 0), (1, 1)]
+
+    # Moving the second mesh away clears the result
+    moved = Matrix.Translation((0, 0, 5))
+    faces1, faces2, pairs = mesh_cache.pair_intersect(geometry1, identity, geometry2, moved, EPSILON)
+    assert len(faces1) == len(faces2) == len(pairs) == 0
+
+
+def test_pinned_geometries_survive_the_budget_until_released(mesh_cache, make_box):
+    boxes = [make_box(f"box{i}", location=(3 * i, 0, 0)) for i in range(3)]
+    cache = mesh_cache.GeometryCache(max_bytes=1)
+
+    cache.begin_pinning()
+    for box in boxes[:2]:
+        cache.get(box)
+    # Both stay cached while pinned, even though the budget is exceeded
+    assert len(cache.geometries) == 2
+    assert cache.pinned_over_budget
+
+    cache.release_pinned()
+    assert len(cache.geometries) == 1
+    assert not cache.pinned_over_budget
+
+    cache.get(boxes[2])
+    cache.end_pinning()
+    assert len(cache.geometries) == 1
+    assert cache.evictions == 2
+
+
+def test_unlimited_cache_keeps_every_geometry(mesh_cache, make_box):
+    boxes = [make_box(f"box{i}", location=(3 * i, 0, 0)) for i in range(3)]
+    cache = mesh_cache.GeometryCache()
+
+    geometries = [cache.get(box) for box in boxes]
+    assert not cache.streaming
+    assert len(cache.geometries) == 3
+    assert cache.get(boxes[0]) is geometries[0]
+    assert cache.evictions == 0
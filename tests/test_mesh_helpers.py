@@ -0,0 +1,94 @@
+"""Tests for the object-level containment and clearance checks in mesh_helpers, on scene objects."""
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+# Face indices of the boxes built by the make_box fixture
+FACE_POS_X = 3
+FACE_NEG_X = 5
+
+
+@pytest.fixture
+def extracted(monkeypatch, mesh_cache):
+    """Names of the objects whose geometry was extracted"""
+    names = []
+    extract = mesh_cache.extract_geometry
+
+    def record(obj, *args, **kwargs):
+        names.append(obj.name)
+        return extract(obj, *args, **kwargs)
+
+    monkeypatch.setattr(mesh_cache, "extract_geometry", record)
+    return names
+
+
+def test_containment_reports_buried_object(mesh_helpers, make_box, inspection_session, extracted):
+    outer = make_box("outer", size=(4, 4, 4))
+    inner = make_box("inner")
+    far = make_box("far", location=(10, 0, 0))
+    # Overlaps the outer box without being inside it
+    crossing = make_box("crossing", location=(2, 0, 0))
+    inspection_session()
+
+    assert mesh_helpers.check_object_containment([outer, inner, far, crossing]) == 1
+    assert mesh_helpers.get_buried_report() == [{'inner': "inner", 'outer': "outer"}]
+    # Only the pair whose bounds nest needs geometry
+    assert sorted(extracted) == ["inner", "outer"]
+
+
+def test_containment_ignores_surface_intersections(mesh_helpers, make_box, inspection_session):
+    outer = make_box("outer", size=(4, 4, 4))
+    # Bounds nest but the faces touch the outer box's +x side
+    touching = make_box("touching", location=(1.5, 0, 0))
+    inspection_session()
+
+    assert mesh_helpers.check_object_containment([outer, touching]) == 0
+
+
+def test_streaming_containment_checks_pairs_in_batches(monkeypatch, mesh_helpers, make_box, inspection_session):
+    from LcL_Tools.model_inspector import containment
+
+    objects = []
+    for i in range(3):
+        objects.append(make_box(f"outer{i}", size=(4, 4, 4), location=(10 * i, 0, 0)))
+        objects.append(make_box(f"inner{i}", location=(10 * i, 0, 0)))
+
+    batch_sizes = []
+    find_buried = containment.find_buried
+
+    def record(items, pairs, *args):
+        batch_sizes.append(len(pairs))
+        return find_buried(items, pairs, *args)
+
+    monkeypatch.setattr(containment, "find_buried", record)
+    # A 1-byte budget: every pair exceeds it, so each pair is its own batch
+    cache = inspection_session(max_bytes=1)
+
+    assert mesh_helpers.check_object_containment(objects) == 3
+    assert batch_sizes == [1, 1, 1]
+    assert len(cache.geometries) == 1
+    assert sorted(row['inner'] for row in mesh_helpers.get_buried_report()) == ["inner0", "inner1", "inner2"]
+
+
+@pytest.mark.parametrize("max_bytes", [0, 1])
+def test_clearance_reports_close_faces(mesh_helpers, make_box, inspection_session, extracted, max_bytes):
+    left = make_box("left")
+    right = make_box("right", location=(1.05, 0, 0))
+    far = make_box("far", location=(10, 0, 0))
+    inspection_session(max_bytes)
+
+    assert mesh_helpers.check_clearance([left, right, far], distance=0.1) > 0
+    faces, values = mesh_helpers.get_inspection_values(left)
+    assert FACE_POS_X in faces.tolist()
+    assert FACE_NEG_X not in faces.tolist()
+    assert values.min() == pytest.approx(0.05, abs=1e-5)
+    assert "far" not in extracted
+
+
+def test_clearance_ignores_distant_objects(mesh_helpers, make_box, inspection_session):
+    left = make_box("left")
+    right = make_box("right", location=(1.5, 0, 0))
+    inspection_session()
+
+    assert mesh_helpers.check_clearance([left, right], distance=0.1) == 0
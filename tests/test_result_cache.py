@@ -0,0 +1,87 @@
+"""Tests for result_cache: encode/decode round trip and corrupt entries treated as misses."""
+
+import struct
+import zlib
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+
+def _arrays():
+    return [np.array([3, 1, 4, 1, 5], dtype=np.int32), np.empty(0, dtype=np.int32), np.arange(1000, dtype=np.int32)]
+
+
+def _assert_arrays_equal(actual, expected):
+    assert len(actual) == len(expected)
+    for a, b in zip(actual, expected):
+        assert a.dtype == np.int32
+        np.testing.assert_array_equal(a, b)
+
+
+def test_encode_decode_round_trip(result_cache):
+    _assert_arrays_equal(result_cache._decode(result_cache._encode(_arrays())), _arrays())
+
+
+def test_encode_decode_empty_list(result_cache):
+    assert result_cache._decode(result_cache._encode([])) == []
+
+
+def test_store_then_load_hits(result_cache):
+    key = result_cache.make_key('SELF', ['abc'], params=(0.001,))
+    assert result_cache.store(key, _arrays())
+    _assert_arrays_equal(result_cache.load(key), _arrays())
+    assert result_cache.get_hit_stats() == (1, 0)
+
+
+def test_load_missing_key_is_a_miss(result_cache):
+    assert result_cache.load(result_cache.make_key('SELF', ['missing'])) is None
+    assert result_cache.get_hit_stats() == (0, 1)
+
+
+def test_truncated_entry_is_a_miss(result_cache):
+    key = result_cache.make_key('PAIR', ['a', 'b'])
+    result_cache.store(key, _arrays())
+    path = result_cache._cache_path(key)
+    with open(path, "rb") as f:
+        data = f.read()
+    with open(path, "wb") as f:
+        f.write(data[:len(data) - 7])
+    assert result_cache.load(key) is None
+    assert result_cache.get_hit_stats() == (0, 1)
+
+
+def test_decode_rejects_truncated_header(result_cache):
+    data = result_cache._encode(_arrays())
+    for size in (0, 3, 8, 14):
+        assert result_cache._decode(data[:size]) is None
+
+
+def test_decode_rejects_payload_not_multiple_of_int32(result_cache):
+    # Valid zlib stream whose decompressed size is not a multiple of 4 bytes
+    header = result_cache.CACHE_MAGIC + struct.pack("<II", result_cache.CACHE_VERSION, 1) + struct.pack("<I", 1)
+    assert result_cache._decode(header + zlib.compress(b"\x01\x02\x03\x04\x05")) is None
+
+
+def test_decode_rejects_length_mismatch(result_cache):
+    header = result_cache.CACHE_MAGIC + struct.pack("<II", result_cache.CACHE_VERSION, 1) + struct.pack("<I", 3)
+    payload = np.arange(2, dtype=np.int32).tobytes()
+    assert result_cache._decode(header + zlib.compress(payload)) is None
+
+
+def test_decode_rejects_wrong_magic_and_version(result_cache):
+    data = result_cache._encode(_arrays())
+    assert result_cache._decode(b"XXXX" + data[4:]) is None
+    stale = data[:4] + struct.pack("<I", result_cache.CACHE_VERSION - 1) + data[8:]
+    assert result_cache._decode(stale) is None
+
+
+def test_make_key_depends_on_inputs(result_cache):
+    base = result_cache.make_key('PAIR', ['a', 'b'], matrices=[np.eye(4)], params=(0.001,))
+    moved = np.eye(4)
+    moved[0, 3] = 1.0
+    assert base == result_cache.make_key('PAIR', ['a', 'b'], matrices=[np.eye(4)], params=(0.001,))
+    assert base != result_cache.make_key('SELF', ['a', 'b'], matrices=[np.eye(4)], params=(0.001,))
+    assert base != result_cache.make_key('PAIR', ['b', 'a'], matrices=[np.eye(4)], params=(0.001,))
+    assert base != result_cache.make_key('PAIR', ['a', 'b'], matrices=[moved], params=(0.001,))
+    assert base != result_cache.make_key('PAIR', ['a', 'b'], matrices=[np.eye(4)], params=(0.002,))